@@ -1,6 +1,7 @@
 from flask import Flask, jsonify, request  # Add 'request' here
 from flask_cors import CORS
 import os
+import logging
 from datetime import datetime, timezone
 from dotenv import load_dotenv
 
@@ -10,6 +11,8 @@ load_dotenv()
 # Import and initialize extensions
 from .extensions import db, migrate, jwt, mail
 
+logger = logging.getLogger(__name__)
+
 def create_app(config_name='development'):
     app = Flask(__name__)
     
@@ -39,22 +42,41 @@ def create_app(config_name='development'):
             response.headers.add('Access-Control-Allow-Credentials', 'true')
         return response
     
+    # Structured (JSON) events for scan tracing
+    if app.config.get('STRUCTLOG_ENABLED', True):
+        from app.utils.tracing import configure_structlog
+        configure_structlog()
+    
+    # Compress large API responses (brotli/gzip)
+    if app.config.get('COMPRESS_ENABLED', True):
+        from app.utils.compression import init_compression
+        init_compression(app)
+    
     # Initialize extensions with app
     db.init_app(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
     mail.init_app(app)
     
+    # Prometheus metrics on /metrics (request latency, pool usage, worker aggregates)
+    if app.config.get('METRICS_ENABLED', True):
+        from app.utils.metrics import init_metrics
+        init_metrics(app)
+    
     # Import models
     try:
         from app.models import User
-        print("✅ Models imported successfully")
+        logger.debug("Models imported")
     except Exception as e:
-        print(f"⚠️  Models import error: {e}")
+        logger.warning(f"Models import error: {e}")
     
     # Configure JWT
     configure_jwt(app)
     
+    # Celery must exist before the API imports the task modules, so the tasks bind to it
+    from app.tasks.celery_config import make_celery
+    app.extensions['celery'] = make_celery(app)
+    
     # Register basic routes
     register_basic_routes(app)
     
@@ -67,8 +89,7 @@ def create_app(config_name='development'):
     # Register error handlers
     register_error_handlers(app)
     
-    print("✅ CORS configured for frontend integration")
-    print("📱 Server will accept requests from: http://localhost:3000")
+    logger.info("App created; CORS allows http://localhost:3000 and http://127.0.0.1:3000")
     
     return app
 
@@ -86,6 +107,14 @@ def configure_jwt(app):
     @jwt.unauthorized_loader
     def missing_token_callback(error):
         return jsonify({'error': 'Authentication token required'}), 401
+    
+    # Resolve current_user from a cached snapshot instead of querying per request
+    from app.auth.identity import load_current_user
+    jwt.user_lookup_loader(load_current_user)
+    
+    @jwt.user_lookup_error_loader
+    def user_lookup_error_callback(jwt_header, jwt_payload):
+        return jsonify({'error': 'User not found or disabled'}), 401
 
 def register_basic_routes(app):
     """Register basic routes"""
@@ -124,8 +153,6 @@ def register_basic_routes(app):
 def register_api_with_blueprint(app):
     """Register Flask-RESTX API using Blueprint approach"""
     try:
-        print("🔄 Setting up API with Blueprint...")
-        
         from flask import Blueprint
         from flask_restx import Api, Namespace, Resource
         
@@ -140,9 +167,10 @@ def register_api_with_blueprint(app):
             description='A comprehensive vulnerability scanning API',
             doc='/docs/'
         )
-        
-        print("✅ API Blueprint created")
-        
+
+        from app.utils.json_output import register_json_representation
+        register_json_representation(api)
+
         # Create test namespace
         test_ns = Namespace('test', description='Test operations')
         
@@ -183,7 +211,6 @@ def register_api_with_blueprint(app):
                 return {'message': 'CORS preflight for cors-test successful'}
         
         api.add_namespace(test_ns, path='/test')
-        print("✅ Test namespace registered")
         
         # Create auth namespace
         auth_ns = Namespace('auth', description='Authentication operations')
@@ -214,7 +241,7 @@ def register_api_with_blueprint(app):
             def post(self):
                 try:
                     data = request.get_json() or {}
-                    print(f"🔄 Registration attempt for: {data.get('email', 'unknown')}")
+                    logger.debug(f"Registration attempt for: {data.get('email', 'unknown')}")
                     
                     # Simple validation
                     email = data.get('email', '').strip().lower()
@@ -243,12 +270,11 @@ def register_api_with_blueprint(app):
                         
                         db.session.add(new_user)
                         db.session.commit()
-                        print(f"✅ User created successfully: {username}")
+                        logger.info(f"User created: {username}")
                         
                         # Create access token
-                        from flask_jwt_extended import create_access_token, create_refresh_token
-                        access_token = create_access_token(identity=new_user.id)
-                        refresh_token = create_refresh_token(identity=new_user.id)
+                        from app.auth.identity import issue_tokens
+                        access_token, refresh_token = issue_tokens(new_user)
                         
                         return {
                             'message': 'User registered successfully',
@@ -259,7 +285,7 @@ def register_api_with_blueprint(app):
                         }, 201
                         
                     except Exception as model_error:
-                        print(f"❌ Database error during registration: {model_error}")
+                        logger.error(f"Database error during registration: {model_error}")
                         db.session.rollback()
                         return {
                             'error': 'Registration failed',
@@ -268,7 +294,7 @@ def register_api_with_blueprint(app):
                         }, 500
                     
                 except Exception as e:
-                    print(f"❌ General error during registration: {e}")
+                    logger.error(f"General error during registration: {e}")
                     return {'error': 'Registration failed', 'details': str(e)}, 500
             
             def get(self):
@@ -293,7 +319,7 @@ def register_api_with_blueprint(app):
             def post(self):
                 try:
                     data = request.get_json() or {}
-                    print(f"🔄 Login attempt for: {data.get('email', 'unknown')}")
+                    logger.debug(f"Login attempt for: {data.get('email', 'unknown')}")
                     
                     email = data.get('email', '').strip().lower()
                     password = data.get('password', '')
@@ -302,24 +328,23 @@ def register_api_with_blueprint(app):
                         return {'error': 'Email and password are required'}, 400
                     
                     try:
-                        from flask_jwt_extended import create_access_token, create_refresh_token
+                        from app.auth.identity import issue_tokens
                         from app.models import User
                         
                         user = User.query.filter_by(email=email).first()
                         
                         if not user or not user.check_password(password):
-                            print(f"❌ Invalid login attempt for: {email}")
+                            logger.info(f"Invalid login attempt for: {email}")
                             return {'error': 'Invalid credentials'}, 401
                         
                         # Create tokens
-                        access_token = create_access_token(identity=user.id)
-                        refresh_token = create_refresh_token(identity=user.id)
+                        access_token, refresh_token = issue_tokens(user)
                         
                         # Update last login
                         user.last_login = datetime.utcnow()
                         db.session.commit()
                         
-                        print(f"✅ User logged in successfully: {user.username}")
+                        logger.debug(f"User logged in: {user.username}")
                         
                         return {
                             'message': 'Login successful',
@@ -330,7 +355,7 @@ def register_api_with_blueprint(app):
                         }, 200
                         
                     except Exception as model_error:
-                        print(f"❌ Database error during login: {model_error}")
+                        logger.error(f"Database error during login: {model_error}")
                         return {
                             'error': 'Login failed',
                             'details': str(model_error),
@@ -338,15 +363,21 @@ def register_api_with_blueprint(app):
                         }, 500
                     
                 except Exception as e:
-                    print(f"❌ General error during login: {e}")
+                    logger.error(f"General error during login: {e}")
                     return {'error': 'Login failed', 'details': str(e)}, 500
         
-        api.add_namespace(auth_ns, path='/auth')
-        print("✅ Auth namespace registered")
+        # Current user profile, resolved through the cached JWT user lookup
+        from app.auth.routes import UserProfile
+        auth_ns.add_resource(UserProfile, '/me')
         
+        api.add_namespace(auth_ns, path='/auth')
+
+        # Scans, reports, schedules and users
+        from app.api import register_namespaces
+        register_namespaces(api)
+
         # Register the blueprint with the app
         app.register_blueprint(api_bp)
-        print("✅ API Blueprint registered with app")
         
         # Also register docs at root level for convenience
         @app.route('/docs/')
@@ -354,20 +385,15 @@ def register_api_with_blueprint(app):
             from flask import redirect
             return redirect('/api/v1/docs/')
         
-        print("\n📋 Expected API Routes:")
-        print("   GET        /api/v1/test/ping")
-        print("   GET,POST   /api/v1/test/cors-test")
-        print("   GET        /api/v1/auth/ping")
-        print("   GET,POST   /api/v1/auth/register")
-        print("   POST       /api/v1/auth/login")
-        print("   GET        /api/v1/docs/")
+        if logger.isEnabledFor(logging.DEBUG):
+            for rule in app.url_map.iter_rules():
+                if rule.rule.startswith('/api/v1/'):
+                    logger.debug(f"Route {','.join(sorted(rule.methods - {'HEAD', 'OPTIONS'})):<10} {rule.rule}")
         
         return api
         
     except Exception as e:
-        print(f"❌ Error setting up API: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error setting up API: {e}")
 
 def register_cli_commands(app):
     """Register custom CLI commands"""
@@ -376,6 +402,15 @@ def register_cli_commands(app):
         db.create_all()
         print("✅ Database initialized!")
     
+    @app.cli.command()
+    def rebuild_stats():
+        """Recompute dashboard rollups from the scans table"""
+        from app.models import User, UserScanStats
+        for (user_id,) in db.session.query(User.id):
+            UserScanStats.rebuild(user_id)
+        db.session.commit()
+        print("✅ Scan statistics rebuilt!")
+    
     @app.cli.command()
     def drop_db():
         db.drop_all()
@@ -1,27 +1,18 @@
-from flask import Blueprint
-from flask_restx import Api
-from .users import users_ns
 from .scans import scans_ns
 from .reports import reports_ns
+from .schedules import schedules_ns
 
-# Create a Blueprint for the API
-api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
+# Resource namespaces, mounted on the app's Api by create_app. users_ns is not
+# mounted: authentication is served by the auth namespace in create_app, and
+# its profile routes have no access control
+NAMESPACES = [
+    (scans_ns, '/scans'),  # Namespace for scan-related operations
+    (reports_ns, '/reports'),  # Namespace for report management
+    (schedules_ns, '/schedules'),  # Namespace for recurring scan schedules
+]
 
-# Create an API instance
-api = Api(
-    api_bp,
-    title='Vulnerability Scanner API',
-    version='1.0',
-    description='A comprehensive vulnerability scanning API',
-    doc='/docs/'  # Swagger documentation endpoint
-)
-
-# Add namespaces
-api.add_namespace(users_ns, path='/users')  # Namespace for user authentication and management
-api.add_namespace(scans_ns, path='/scans')  # Namespace for scan-related operations
-api.add_namespace(reports_ns, path='/reports')  # Namespace for report management
-
-# Optional: Add other namespaces as needed
-# Example:
-# from .test import test_ns
-# api.add_namespace(test_ns, path='/test')
\ No newline at end of file
+def register_namespaces(api):
+    """Add the resource namespaces to an Api instance"""
+    for namespace, path in NAMESPACES:
+        api.add_namespace(namespace, path=path)
+    return api
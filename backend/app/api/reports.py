@@ -1,28 +1,116 @@
-from flask_restx import Namespace, Resource
+from flask import request, current_app, send_file
+from flask_restx import Namespace, Resource, fields
+from flask_jwt_extended import jwt_required, current_user
+
+from ..models.report import Report
+from ..models.scan import Scan
+from ..auth.utils import get_user_permissions
+from ..reports.renderer import TEMPLATES, FORMATS
+from ..services.report_services import ReportService
+from ..tasks.report_tasks import generate_report
 
 # Create a namespace for report-related operations
 reports_ns = Namespace('reports', description='Operations related to reports')
 
+report_request = reports_ns.model('ReportRequest', {
+    'scan_ids': fields.List(fields.Integer, required=True, description='Scans to include in the report'),
+    'template': fields.String(description='Report template (summary, detailed)', default='summary'),
+    'format': fields.String(description='Output format (pdf, html)', default='pdf')
+})
+
 @reports_ns.route('/')
 class ReportList(Resource):
+    @jwt_required()
     def get(self):
-        """Get a list of all reports"""
-        # Replace with actual database logic
-        return {'message': 'List of reports'}, 200
+        """Get a list of the user's reports"""
+        current_user_id = current_user.id
+        reports = Report.query.filter_by(user_id=current_user_id).order_by(Report.created_at.desc()).all()
+        return [report.to_dict() for report in reports], 200
 
+    @jwt_required()
+    @reports_ns.expect(report_request)
     def post(self):
-        """Create a new report"""
-        # Replace with actual report creation logic
-        return {'message': 'New report created'}, 201
+        """Request a report; identical cached reports are returned immediately"""
+        current_user_id = current_user.id
+        data = request.get_json() or {}
+
+        scan_ids = data.get('scan_ids')
+        template = data.get('template', 'summary')
+        fmt = data.get('format', 'pdf')
+
+        if not isinstance(scan_ids, list) or not scan_ids or not all(isinstance(i, int) for i in scan_ids):
+            return {'error': 'scan_ids must be a non-empty list of scan IDs'}, 400
+        if len(set(scan_ids)) > current_app.config['REPORT_MAX_SCANS']:
+            return {'error': f"At most {current_app.config['REPORT_MAX_SCANS']} scans per report"}, 400
+        if template not in TEMPLATES:
+            return {'error': f"template must be one of: {', '.join(TEMPLATES)}"}, 400
+        if fmt not in FORMATS:
+            return {'error': f"format must be one of: {', '.join(FORMATS)}"}, 400
+
+        if not get_user_permissions(current_user)['can_create_reports']:
+            return {'error': 'Reports are not available for this account'}, 403
+
+        owned = Scan.query.filter(Scan.id.in_(scan_ids), Scan.user_id == current_user_id).count()
+        if owned != len(set(scan_ids)):
+            return {'error': 'Scan not found'}, 404
+
+        report, created = ReportService().get_or_create(current_user_id, scan_ids, template, fmt)
+        if created:
+            generate_report.delay(report.id)
+            return report.to_dict(), 202
+
+        return report.to_dict(), 200
 
 @reports_ns.route('/<int:report_id>')
 class ReportDetail(Resource):
+    @jwt_required()
     def get(self, report_id):
         """Get details of a specific report by ID"""
-        # Replace with actual database logic
-        return {'message': f'Details of report {report_id}'}, 200
+        current_user_id = current_user.id
+        report = Report.query.filter_by(id=report_id, user_id=current_user_id).first()
 
+        if not report:
+            return {'error': 'Report not found'}, 404
+
+        return report.to_dict(), 200
+
+    @jwt_required()
     def delete(self, report_id):
         """Delete a specific report by ID"""
-        # Replace with actual database logic
-        return {'message': f'Report {report_id} deleted'}, 200
\ No newline at end of file
+        current_user_id = current_user.id
+        report = Report.query.filter_by(id=report_id, user_id=current_user_id).first()
+
+        if not report:
+            return {'error': 'Report not found'}, 404
+        if report.status in ('pending', 'rendering'):
+            return {'error': 'Cannot delete a report that is being rendered'}, 400
+
+        ReportService().delete(report)
+        return {'message': f'Report {report_id} deleted'}, 200
+
+@reports_ns.route('/<int:report_id>/download')
+class ReportDownload(Resource):
+    @jwt_required()
+    def get(self, report_id):
+        """Download a rendered report (supports Range and conditional requests)"""
+        current_user_id = current_user.id
+        report = Report.query.filter_by(id=report_id, user_id=current_user_id).first()
+
+        if not report:
+            return {'error': 'Report not found'}, 404
+        if not report.is_available():
+            return {'error': 'Report is not ready', 'status': report.status}, 409
+
+        # send_file streams from disk and answers Range / If-Range / If-None-Match itself;
+        # the ETag is the hash of the file's bytes, so ranges of different renders never mix
+        response = send_file(
+            report.file_path,
+            mimetype='application/pdf' if report.format == 'pdf' else 'text/html',
+            as_attachment=True,
+            download_name=f'scan-report-{report.id}.{report.format}',
+            conditional=True,
+            etag=report.file_hash or True,
+            max_age=3600
+        )
+        response.headers['Accept-Ranges'] = 'bytes'
+        return response
@@ -1,12 +1,20 @@
-from flask import request, jsonify
+from flask import request, jsonify, current_app
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required, current_user
 from datetime import datetime
+from urllib.parse import urlparse
+from celery import group
 
-from ..models.scan import Scan
+from ..models.scan import Scan, SCAN_TYPES
 from ..models.user import User
+from ..models.scan_batch import ScanBatch
+from ..models.user_scan_stats import UserScanStats
+from ..models.scan_usage import ScanUsage
 from ..extensions import db
 from ..tasks.scan_tasks import run_vulnerability_scan
+from ..services.diff_services import DiffService
+from ..utils.http_cache import make_etag, etag_conditional
+from ..utils.db_routing import read_replica
 
 # Create a namespace for scan-related operations
 scans_ns = Namespace('scans', description='Operations related to scans')
@@ -14,7 +22,7 @@ scans_ns = Namespace('scans', description='Operations related to scans')
 # API Models
 scan_request = scans_ns.model('ScanRequest', {
     'target_url': fields.String(required=True, description='Target URL to scan'),
-    'scan_type': fields.String(description='Type of scan (full, quick, custom)', default='full')
+    'scan_type': fields.String(description='Type of scan (full, quick, custom, incremental)', default='full')
 })
 
 scan_response = scans_ns.model('ScanResponse', {
@@ -26,13 +34,31 @@ scan_response = scans_ns.model('ScanResponse', {
     'total_vulnerabilities': fields.Integer(description='Total vulnerabilities found')
 })
 
+bulk_scan_request = scans_ns.model('BulkScanRequest', {
+    'targets': fields.List(fields.String, required=True, description='Target URLs to scan'),
+    'scan_type': fields.String(description='Type of scan applied to every target', default='full')
+})
+
+def _scan_list_etag(resource):
+    """Collection ETag from the owner's scans_version, a single primary key lookup"""
+    current_user_id = current_user.id
+    version = db.session.query(User.scans_version).filter_by(id=current_user_id).scalar()
+    return None if version is None else make_etag('scans', current_user_id, version)
+
+def _scan_etag(resource, scan_id):
+    """Scan ETag from its row version, without loading the full row"""
+    version = db.session.query(Scan.version).filter_by(id=scan_id, user_id=current_user.id).scalar()
+    return None if version is None else make_etag('scan', scan_id, version)
+
 @scans_ns.route('/')
 class ScanList(Resource):
     @jwt_required()
+    @read_replica
+    @etag_conditional(_scan_list_etag)
     @scans_ns.marshal_list_with(scan_response)
     def get(self):
         """Get list of user's scans"""
-        current_user_id = get_jwt_identity()
+        current_user_id = current_user.id
         scans = Scan.query.filter_by(user_id=current_user_id).order_by(Scan.started_at.desc()).all()
         return [scan.to_dict() for scan in scans]
 
@@ -41,45 +67,160 @@ class ScanList(Resource):
     @scans_ns.marshal_with(scan_response)
     def post(self):
         """Create and start a new scan"""
-        current_user_id = get_jwt_identity()
-        data = request.get_json()
+        current_user_id = current_user.id
+        data = request.get_json() or {}
+        scan_type = data.get('scan_type', 'full')
         
-        if not data or not data.get('target_url'):
-            return {'error': 'target_url is required'}, 400
+        error = validate_target_url(data.get('target_url')) or validate_scan_type(scan_type)
+        if error:
+            return {'error': error}, 400
         
-        # Check user scan limits
-        user = User.query.get(current_user_id)
-        if user.is_guest and user.scan_limit <= 0:
-            return {'error': 'Scan limit exceeded for guest users'}, 403
+        # Consume quota atomically; it is released if the transaction rolls back
+        if not reserve_scan_quota(current_user, 1):
+            return {'error': 'Scan limit exceeded'}, 403
         
         # Create new scan
         scan = Scan(
             user_id=current_user_id,
-            target_url=data['target_url'],
-            scan_type=data.get('scan_type', 'full'),
+            target_url=data['target_url'].strip(),
+            scan_type=scan_type,
             status='pending'
         )
         
         db.session.add(scan)
+        UserScanStats.increment(current_user_id, total_scans=1, last_scan_at=datetime.utcnow())
         db.session.commit()
         
-        # Decrease scan limit for guest users
-        if user.is_guest:
-            user.scan_limit -= 1
-            db.session.commit()
-        
         # Start background scan task
         run_vulnerability_scan.delay(scan.id)
         
         return scan.to_dict(), 201
 
+def validate_target_url(target_url):
+    """Return an error message if target_url cannot be scanned, else None"""
+    if not isinstance(target_url, str) or not target_url.strip():
+        return 'target_url is required'
+    
+    parsed = urlparse(target_url.strip())
+    if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+        return 'target_url must be an http(s) URL with a host'
+    
+    return None
+
+def validate_scan_type(scan_type):
+    """Return an error message if scan_type is not a supported scan type, else None"""
+    if scan_type not in SCAN_TYPES:
+        return f"scan_type must be one of: {', '.join(SCAN_TYPES)}"
+    return None
+
+def reserve_scan_quota(user, count):
+    """Consume quota for count new scans in the current transaction"""
+    return ScanUsage.reserve_for(user, count)
+
+@scans_ns.route('/bulk')
+class BulkScanList(Resource):
+    @jwt_required()
+    @scans_ns.expect(bulk_scan_request)
+    def post(self):
+        """Validate, create and enqueue many scans in one request"""
+        current_user_id = current_user.id
+        data = request.get_json() or {}
+        targets = data.get('targets')
+        scan_type = data.get('scan_type', 'full')
+        
+        if not isinstance(targets, list) or not targets:
+            return {'error': 'targets must be a non-empty list'}, 400
+        
+        error = validate_scan_type(scan_type)
+        if error:
+            return {'error': error}, 400
+        
+        max_targets = current_app.config['BULK_SCAN_MAX_TARGETS']
+        if len(targets) > max_targets:
+            return {'error': f'At most {max_targets} targets per request'}, 400
+        
+        errors = {}
+        for index, target in enumerate(targets):
+            error = validate_target_url(target)
+            if error:
+                errors[str(index)] = error
+        if errors:
+            return {'error': 'Validation failed', 'details': errors}, 400
+        
+        # Drop duplicates while keeping submission order
+        targets = list(dict.fromkeys(target.strip() for target in targets))
+        
+        if not reserve_scan_quota(current_user, len(targets)):
+            return {'error': 'Scan limit exceeded'}, 403
+        
+        # Create the batch and all of its scans in a single transaction
+        batch = ScanBatch(user_id=current_user_id, scan_type=scan_type, total_scans=len(targets))
+        db.session.add(batch)
+        db.session.flush()
+        
+        scans = [
+            Scan(
+                user_id=current_user_id,
+                target_url=target,
+                scan_type=scan_type,
+                status='pending',
+                batch_id=batch.id
+            )
+            for target in targets
+        ]
+        db.session.add_all(scans)
+        
+        UserScanStats.increment(current_user_id, total_scans=len(scans), last_scan_at=datetime.utcnow())
+        
+        db.session.commit()
+        
+        # Enqueue every scan with a single group call
+        group(run_vulnerability_scan.s(scan.id) for scan in scans).apply_async()
+        
+        return {
+            'batch_id': batch.id,
+            'total_scans': len(scans),
+            'scan_ids': [scan.id for scan in scans]
+        }, 201
+
+@scans_ns.route('/batches/<string:batch_id>')
+class ScanBatchDetail(Resource):
+    @jwt_required()
+    def get(self, batch_id):
+        """Get aggregate progress of a bulk submission"""
+        current_user_id = current_user.id
+        batch = ScanBatch.query.filter_by(id=batch_id, user_id=current_user_id).first()
+        
+        if not batch:
+            return {'error': 'Batch not found'}, 404
+        
+        return batch.to_dict()
+
+@scans_ns.route('/stats')
+class ScanStats(Resource):
+    @jwt_required()
+    @read_replica
+    def get(self):
+        """Get the user's scan totals and severity breakdown"""
+        current_user_id = current_user.id
+        stats = UserScanStats.query.get(current_user_id)
+        
+        if not stats:
+            stats = UserScanStats(user_id=current_user_id)
+            for name in UserScanStats.COUNTERS:
+                setattr(stats, name, 0)
+            stats.updated_at = datetime.utcnow()
+        
+        return stats.to_dict()
+
 @scans_ns.route('/<int:scan_id>')
 class ScanDetail(Resource):
     @jwt_required()
+    @etag_conditional(_scan_etag)
     @scans_ns.marshal_with(scan_response)
     def get(self, scan_id):
         """Get details of a specific scan"""
-        current_user_id = get_jwt_identity()
+        current_user_id = current_user.id
         scan = Scan.query.filter_by(id=scan_id, user_id=current_user_id).first()
         
         if not scan:
@@ -90,7 +231,7 @@ class ScanDetail(Resource):
     @jwt_required()
     def delete(self, scan_id):
         """Delete a specific scan"""
-        current_user_id = get_jwt_identity()
+        current_user_id = current_user.id
         scan = Scan.query.filter_by(id=scan_id, user_id=current_user_id).first()
         
         if not scan:
@@ -100,6 +241,20 @@ class ScanDetail(Resource):
         if scan.status == 'running':
             return {'error': 'Cannot delete running scan'}, 400
         
+        # Take the scan back out of the user's rollup
+        deltas = {'total_scans': -1}
+        if scan.status == 'completed':
+            deltas.update(
+                completed_scans=-1,
+                total_vulnerabilities=-(scan.total_vulnerabilities or 0),
+                high_severity_count=-(scan.high_severity_count or 0),
+                medium_severity_count=-(scan.medium_severity_count or 0),
+                low_severity_count=-(scan.low_severity_count or 0)
+            )
+        elif scan.status == 'failed':
+            deltas['failed_scans'] = -1
+        UserScanStats.increment(current_user_id, **deltas)
+        
         db.session.delete(scan)
         db.session.commit()
         
@@ -108,9 +263,10 @@ class ScanDetail(Resource):
 @scans_ns.route('/<int:scan_id>/results')
 class ScanResults(Resource):
     @jwt_required()
+    @read_replica
     def get(self, scan_id):
         """Get scan results"""
-        current_user_id = get_jwt_identity()
+        current_user_id = current_user.id
         scan = Scan.query.filter_by(id=scan_id, user_id=current_user_id).first()
         
         if not scan:
@@ -122,4 +278,25 @@ class ScanResults(Resource):
         return {
             'scan': scan.to_dict(),
             'results': [result.to_dict() for result in results]
-        }
\ No newline at end of file
+        }
+
+@scans_ns.route('/<int:scan_id>/diff')
+class ScanDiffResource(Resource):
+    @jwt_required()
+    @scans_ns.param('base', 'ID of the scan to compare against (defaults to the previous scan of the same target)')
+    def get(self, scan_id):
+        """Get findings added, removed and unchanged since another scan"""
+        current_user_id = current_user.id
+        scan = Scan.query.filter_by(id=scan_id, user_id=current_user_id).first()
+        
+        if not scan:
+            return {'error': 'Scan not found'}, 404
+        
+        base_scan = None
+        base_scan_id = request.args.get('base', type=int)
+        if base_scan_id is not None:
+            base_scan = Scan.query.filter_by(id=base_scan_id, user_id=current_user_id).first()
+            if not base_scan:
+                return {'error': 'Base scan not found'}, 404
+        
+        return DiffService().get_diff(scan, base_scan)
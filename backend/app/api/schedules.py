@@ -0,0 +1,146 @@
+from flask import request, current_app
+from flask_restx import Namespace, Resource, fields
+from flask_jwt_extended import jwt_required, current_user
+from datetime import datetime
+
+from ..models.scan_schedule import ScanSchedule
+from ..extensions import db
+from ..auth.utils import get_user_permissions
+from ..utils.cron import validate_cron
+from .scans import validate_target_url, validate_scan_type
+
+# Create a namespace for recurring scan schedules
+schedules_ns = Namespace('schedules', description='Operations related to recurring scans')
+
+schedule_request = schedules_ns.model('ScheduleRequest', {
+    'target_url': fields.String(required=True, description='Target URL to scan'),
+    'cron': fields.String(required=True, description='Cron expression, e.g. "0 3 * * 1" or "@daily"'),
+    'scan_type': fields.String(description='Type of scan', default='full'),
+    'jitter_seconds': fields.Integer(description='Random spread added after the cron time'),
+    'is_active': fields.Boolean(description='Whether the schedule fires')
+})
+
+def _validate_schedule(data, partial=False):
+    """Collect validation errors for a schedule payload"""
+    errors = []
+
+    if not partial or 'target_url' in data:
+        error = validate_target_url(data.get('target_url'))
+        if error:
+            errors.append(error)
+
+    if not partial or 'cron' in data:
+        cron = data.get('cron')
+        if not isinstance(cron, str):
+            errors.append('cron must be a string')
+        else:
+            error = validate_cron(cron)
+            if error:
+                errors.append(error)
+
+    if 'scan_type' in data:
+        error = validate_scan_type(data['scan_type'])
+        if error:
+            errors.append(error)
+
+    jitter = data.get('jitter_seconds')
+    if jitter is not None and (not isinstance(jitter, int) or jitter < 0 or jitter > 86400):
+        errors.append('jitter_seconds must be between 0 and 86400')
+
+    if 'is_active' in data and not isinstance(data['is_active'], bool):
+        errors.append('is_active must be true or false')
+
+    return errors
+
+def _can_schedule():
+    return get_user_permissions(current_user)['can_schedule_scans']
+
+@schedules_ns.route('/')
+class ScheduleList(Resource):
+    @jwt_required()
+    def get(self):
+        """Get list of user's scan schedules"""
+        current_user_id = current_user.id
+        schedules = ScanSchedule.query.filter_by(user_id=current_user_id).order_by(ScanSchedule.id).all()
+        return [schedule.to_dict() for schedule in schedules]
+
+    @jwt_required()
+    @schedules_ns.expect(schedule_request)
+    def post(self):
+        """Create a recurring scan schedule"""
+        current_user_id = current_user.id
+        data = request.get_json() or {}
+
+        if not _can_schedule():
+            return {'error': 'Scheduling scans is not available for this account'}, 403
+
+        errors = _validate_schedule(data)
+        if errors:
+            return {'error': 'Validation failed', 'details': errors}, 400
+
+        schedule = ScanSchedule(
+            user_id=current_user_id,
+            target_url=data['target_url'].strip(),
+            cron=data['cron'].strip(),
+            scan_type=data.get('scan_type', 'full'),
+            jitter_seconds=data.get('jitter_seconds', current_app.config['SCHEDULE_DEFAULT_JITTER'])
+        )
+        db.session.add(schedule)
+        db.session.commit()
+
+        return schedule.to_dict(), 201
+
+@schedules_ns.route('/<int:schedule_id>')
+class ScheduleDetail(Resource):
+    @jwt_required()
+    def get(self, schedule_id):
+        """Get details of a specific schedule"""
+        current_user_id = current_user.id
+        schedule = ScanSchedule.query.filter_by(id=schedule_id, user_id=current_user_id).first()
+
+        if not schedule:
+            return {'error': 'Schedule not found'}, 404
+
+        return schedule.to_dict()
+
+    @jwt_required()
+    @schedules_ns.expect(schedule_request)
+    def put(self, schedule_id):
+        """Update a schedule"""
+        current_user_id = current_user.id
+        schedule = ScanSchedule.query.filter_by(id=schedule_id, user_id=current_user_id).first()
+
+        if not schedule:
+            return {'error': 'Schedule not found'}, 404
+
+        if not _can_schedule():
+            return {'error': 'Scheduling scans is not available for this account'}, 403
+
+        data = request.get_json() or {}
+        errors = _validate_schedule(data, partial=True)
+        if errors:
+            return {'error': 'Validation failed', 'details': errors}, 400
+
+        for field in ('target_url', 'cron', 'scan_type', 'jitter_seconds', 'is_active'):
+            if field in data:
+                setattr(schedule, field, data[field].strip() if isinstance(data[field], str) else data[field])
+
+        # Timing fields changed, so recompute when the schedule fires next
+        schedule.next_run_at = schedule.compute_next_run(datetime.utcnow())
+        db.session.commit()
+
+        return schedule.to_dict()
+
+    @jwt_required()
+    def delete(self, schedule_id):
+        """Delete a schedule"""
+        current_user_id = current_user.id
+        schedule = ScanSchedule.query.filter_by(id=schedule_id, user_id=current_user_id).first()
+
+        if not schedule:
+            return {'error': 'Schedule not found'}, 404
+
+        db.session.delete(schedule)
+        db.session.commit()
+
+        return {'message': 'Schedule deleted successfully'}, 200
@@ -1,7 +1,7 @@
 from flask_restx import Namespace, Resource
 from flask import request
 from app.models import User
-from flask_jwt_extended import create_access_token, create_refresh_token
+from app.auth.identity import issue_tokens
 from app.extensions import db
 
 # Create a namespace for user-related operations
@@ -32,8 +32,7 @@ class Register(Resource):
         db.session.commit()
 
         # Generate authentication tokens
-        access_token = create_access_token(identity=new_user.id)
-        refresh_token = create_refresh_token(identity=new_user.id)
+        access_token, refresh_token = issue_tokens(new_user)
 
         return {
             'message': 'User registered successfully',
@@ -61,9 +60,11 @@ class Login(Resource):
         if not user or not user.check_password(password):
             return {'error': 'Invalid credentials'}, 401
 
+        # Persist the hash if check_password upgraded it
+        db.session.commit()
+
         # Generate authentication tokens
-        access_token = create_access_token(identity=user.id)
-        refresh_token = create_refresh_token(identity=user.id)
+        access_token, refresh_token = issue_tokens(user)
 
         return {
             'message': 'Login successful',
@@ -0,0 +1,106 @@
+import time
+import threading
+from flask import current_app
+from flask_jwt_extended import create_access_token, create_refresh_token
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from ..extensions import db
+from ..models.user import User
+from ..utils.metrics import record_cache
+
+class CurrentUser:
+    """Read-only snapshot of a user, safe to share between requests"""
+
+    FIELDS = ('id', 'email', 'username', 'is_guest', 'scan_limit', 'is_active',
+              'is_admin', 'created_at', 'last_login')
+
+    __slots__ = FIELDS
+
+    # Reuse the model's permission and serialization logic on the snapshot
+    get_remaining_scans = User.get_remaining_scans
+    can_scan = User.can_scan
+    to_dict = User.to_dict
+
+    def __init__(self, user):
+        for field in self.FIELDS:
+            setattr(self, field, getattr(user, field))
+
+    def __repr__(self):
+        return f'<CurrentUser {self.username}>'
+
+class UserCache:
+    """Per-process TTL cache of user snapshots keyed by user ID"""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, user_id, snapshot, ttl):
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + ttl, snapshot)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+user_cache = UserCache()
+
+def issue_tokens(user):
+    """Create an (access, refresh) token pair for a user"""
+    identity = str(user.id)  # JWT subjects must be strings
+    access_token = create_access_token(identity=identity)
+    refresh_token = create_refresh_token(identity=identity)
+    return access_token, refresh_token
+
+def load_current_user(jwt_header, jwt_data):
+    """JWT user_lookup_loader: resolve the token subject to a cached user snapshot
+
+    Returns None for unknown or disabled accounts, which makes the request fail
+    with 401. Cache hits cost no queries; the TTL bounds staleness across
+    processes, while writes in this process invalidate immediately.
+    """
+    try:
+        user_id = int(jwt_data[current_app.config['JWT_IDENTITY_CLAIM']])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    snapshot = user_cache.get(user_id)
+    record_cache('user', snapshot is not None)
+    if snapshot is None:
+        user = db.session.get(User, user_id)
+        if user is None:
+            return None
+        snapshot = CurrentUser(user)
+        user_cache.set(user_id, snapshot, current_app.config.get('USER_CACHE_TTL', 30))
+
+    return snapshot if snapshot.is_active else None
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_on_write(mapper, connection, target):
+    """Drop the snapshot at flush and again once the transaction commits"""
+    user_cache.invalidate(target.id)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault('invalidated_user_ids', set()).add(target.id)
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_after_commit(session):
+    # A concurrent request may have re-cached the pre-commit row in between
+    for user_id in session.info.pop('invalidated_user_ids', ()):
+        user_cache.invalidate(user_id)
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_after_rollback(session):
+    session.info.pop('invalidated_user_ids', None)
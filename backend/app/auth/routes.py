@@ -1,14 +1,12 @@
 from flask import request, jsonify, current_app
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import (
-    create_access_token, create_refresh_token, 
-    jwt_required, get_jwt_identity, get_jwt
-)
+from flask_jwt_extended import jwt_required, current_user
 from datetime import datetime, timedelta
 import re
 
 from ..extensions import db
 from ..models import User
+from .identity import issue_tokens
 
 # Create namespace for auth endpoints
 auth_ns = Namespace('auth', description='Authentication operations')
@@ -135,11 +133,7 @@ class Register(Resource):
             db.session.commit()
             
             # Create tokens
-            access_token = create_access_token(
-                identity=new_user.id,
-                additional_claims={'user_type': 'registered'}
-            )
-            refresh_token = create_refresh_token(identity=new_user.id)
+            access_token, refresh_token = issue_tokens(new_user)
             
             return {
                 'message': 'User registered successfully',
@@ -187,14 +181,7 @@ class Login(Resource):
             db.session.commit()
             
             # Create tokens
-            access_token = create_access_token(
-                identity=user.id,
-                additional_claims={
-                    'user_type': 'guest' if user.is_guest else 'registered',
-                    'is_admin': user.is_admin
-                }
-            )
-            refresh_token = create_refresh_token(identity=user.id)
+            access_token, refresh_token = issue_tokens(user)
             
             return {
                 'message': 'Login successful',
@@ -216,11 +203,8 @@ class UserProfile(Resource):
     def get(self):
         """Get current user profile"""
         try:
-            current_user_id = get_jwt_identity()
-            user = User.query.get(current_user_id)
-            
-            if not user:
-                return {'error': 'User not found'}, 404
+            # Loaded (and cached) by the JWT user lookup; no query on a cache hit
+            user = current_user
             
             return {
                 'user': user.to_dict(),
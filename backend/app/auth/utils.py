@@ -69,7 +69,7 @@ def get_user_permissions(user):
         'can_scan': user.can_scan(),
         'can_create_reports': not user.is_guest,
         'can_save_scans': not user.is_guest,
-        'can_schedule_scans': not user.is_guest and not user.is_guest,
+        'can_schedule_scans': not user.is_guest,
         'scan_limit': user.scan_limit,
         'remaining_scans': user.get_remaining_scans(),
         'is_admin': user.is_admin
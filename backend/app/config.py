@@ -6,10 +6,24 @@ class Config:
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-key-change-in-production'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
+    # werkzeug method string, e.g. 'scrypt:32768:8:1' or 'pbkdf2:sha256:600000'; hashes are upgraded on login
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD') or 'scrypt:32768:8:1'
+    USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL') or 30)  # Seconds a user snapshot serves authenticated requests
     
     # Database - Use SQLite for development
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///vulnscanner.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE') or 10),  # Per process: size against the server's max_connections
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW') or 10),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT') or 30),
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE') or 1800),
+        'pool_pre_ping': True
+    }
+    
+    # Optional read replica for read-heavy endpoints (a second SQLite file works locally)
+    DATABASE_REPLICA_URL = os.environ.get('DATABASE_REPLICA_URL')
+    SQLALCHEMY_BINDS = {'replica': DATABASE_REPLICA_URL} if DATABASE_REPLICA_URL else {}
     
     # Celery
     CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL') or 'redis://localhost:6379/0'
@@ -30,10 +44,60 @@ class Config:
     # Rate Limiting - Use Redis if available, memory otherwise
     RATELIMIT_STORAGE_URI = os.environ.get('RATELIMIT_STORAGE_URI') or 'memory://'
     
+    # Response compression and serialization
+    COMPRESS_ENABLED = os.environ.get('COMPRESS_ENABLED', 'true').lower() == 'true'
+    COMPRESS_MIN_SIZE = 1024  # Bytes; smaller bodies are sent as-is
+    COMPRESS_BR_LEVEL = 4
+    COMPRESS_GZIP_LEVEL = 6
+    JSON_FAST_ENCODER = True  # Uses orjson when installed
+    
+    # Metrics (set PROMETHEUS_MULTIPROC_DIR to aggregate gunicorn and celery processes)
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+    METRICS_QUEUES = ['celery']  # Broker queues reported as celery_queue_depth
+    METRICS_WORKER_PORT = os.environ.get('METRICS_WORKER_PORT')  # Worker exporter, for workers on other hosts
+    STRUCTLOG_ENABLED = os.environ.get('STRUCTLOG_ENABLED', 'true').lower() == 'true'  # JSON scan trace events
+    
     # Scan Settings
+    SCAN_QUOTA_WINDOW = timedelta(hours=int(os.environ.get('SCAN_QUOTA_WINDOW_HOURS') or 24))  # Rolling window for registered users' scan_limit; guests' limit is lifetime
+    SCAN_QUOTA_ALL_USERS = os.environ.get('SCAN_QUOTA_ALL_USERS', 'false').lower() == 'true'  # Off: only guests are limited
     SCAN_TIMEOUT = 300  # 5 minutes
     GUEST_SCAN_LIMIT = 3
     USER_SCAN_LIMIT = 10
+    BULK_SCAN_MAX_TARGETS = 1000
+    PROGRESS_MIN_DELTA = 10  # Percentage points between intermediate progress writes
+    PROGRESS_MIN_INTERVAL = 5  # Seconds between intermediate progress writes
+    
+    # Recurring scans (run with: celery -A celery_app.celery beat)
+    SCHEDULER_INTERVAL = 60  # Seconds between due-schedule sweeps
+    SCHEDULER_BATCH_SIZE = 200
+    SCHEDULE_DEFAULT_JITTER = 300  # Seconds
+    
+    # Crawl stage feeding SQLMap
+    CRAWLER_MAX_DEPTH = int(os.environ.get('CRAWLER_MAX_DEPTH') or 2)
+    CRAWLER_MAX_PAGES = int(os.environ.get('CRAWLER_MAX_PAGES') or 50)
+    CRAWLER_CONCURRENCY = 10
+    SQLMAP_WORKERS = int(os.environ.get('SQLMAP_WORKERS') or 4)
+    SQLMAP_MAX_ENDPOINTS = 25
+    SQLMAP_STDOUT_TAIL = 8192  # Bytes of console output kept per run; findings come from --output-dir
+    
+    # Sandbox for external tool processes (sqlmap, nmap, nikto)
+    TOOL_CPU_SECONDS = int(os.environ.get('TOOL_CPU_SECONDS') or 900)
+    TOOL_MEMORY_MB = int(os.environ.get('TOOL_MEMORY_MB') or 2048)  # Address-space limit per process
+    TOOL_OPEN_FILES = 1024
+    TOOL_FILE_SIZE_MB = 512
+    TOOL_MAX_OUTPUT_BYTES = 50 * 1024 * 1024  # stdout + stderr kept per run; the tool is killed beyond this
+    TOOL_CGROUP_PARENT = os.environ.get('TOOL_CGROUP_PARENT')  # Delegated cgroup v2 dir, e.g. /sys/fs/cgroup/scanner
+    TOOL_CGROUP_CPU = float(os.environ.get('TOOL_CGROUP_CPU') or 1.0)  # CPUs per tool process
+    TOOL_CGROUP_PIDS = 256
+    TOOL_WORKSPACE_DIR = os.environ.get('TOOL_WORKSPACE_DIR')  # Scratch space for tool output files; defaults to /dev/shm
+    
+    # In-process HTTP checks
+    HTTP_CHECKS_CONCURRENCY = 50
+    HTTP_CHECKS_TIMEOUT = 10
+    
+    # Reports
+    REPORTS_DIR = os.environ.get('REPORTS_DIR') or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'instance', 'reports')
+    REPORT_MAX_SCANS = 50
     
     # Tool Configurations (your specified commands)
     SCAN_TOOLS = {
@@ -71,8 +135,10 @@ class ProductionConfig(Config):
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_ENGINE_OPTIONS = {}  # The in-memory SQLite pool takes no sizing options
     WTF_CSRF_ENABLED = False
     RATELIMIT_STORAGE_URI = 'memory://'
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1000'  # Cheap hashing keeps tests fast
 
 config = {
     'development': DevelopmentConfig,
@@ -3,9 +3,10 @@ from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_mail import Mail
 from flask_restx import Api
+from .utils.db_routing import RoutingSession
 
 # Initialize extensions
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})  # Routes marked reads to a replica
 migrate = Migrate()
 jwt = JWTManager()
 mail = Mail()
@@ -2,6 +2,13 @@ from ..extensions import db
 
 # Import all models to ensure they're registered
 from .user import User
-from .scan import Scan, ScanResult
+from .scan import Scan
+from .scan_result import ScanResult
+from .scan_diff import ScanDiff
+from .scan_batch import ScanBatch
+from .scan_schedule import ScanSchedule
+from .report import Report
+from .user_scan_stats import UserScanStats
+from .scan_usage import ScanUsage
 
-__all__ = ['db', 'User', 'Scan', 'ScanResult']
\ No newline at end of file
+__all__ = ['db', 'User', 'Scan', 'ScanResult', 'ScanDiff', 'ScanBatch', 'ScanSchedule', 'Report', 'UserScanStats', 'ScanUsage']
\ No newline at end of file
@@ -0,0 +1,49 @@
+import os
+from datetime import datetime
+from ..extensions import db
+
+class Report(db.Model):
+    __tablename__ = 'reports'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    scan_ids = db.Column(db.JSON, nullable=False)  # Sorted list of scans covered by the report
+    template = db.Column(db.String(50), nullable=False, default='summary')  # summary, detailed
+    format = db.Column(db.String(10), nullable=False, default='pdf')  # pdf, html
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, rendering, ready, failed
+    cache_key = db.Column(db.String(64), nullable=False, index=True)  # Hash of (scan_ids, template, format)
+    content_hash = db.Column(db.String(64), nullable=False)  # Hash of the results rendered
+    file_path = db.Column(db.String(500))
+    file_hash = db.Column(db.String(64))  # SHA-256 of the rendered file, served as its strong ETag
+    file_size = db.Column(db.Integer)
+    error_message = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    completed_at = db.Column(db.DateTime)
+
+    # Relationship with user
+    user = db.relationship('User', backref=db.backref('reports', lazy=True))
+
+    def is_available(self):
+        """Check if the rendered file is ready to be served"""
+        return self.status == 'ready' and bool(self.file_path) and os.path.exists(self.file_path)
+
+    def to_dict(self):
+        """Convert report to dictionary"""
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'scan_ids': self.scan_ids,
+            'template': self.template,
+            'format': self.format,
+            'status': self.status,
+            'content_hash': self.content_hash,
+            'file_size': self.file_size,
+            'file_hash': self.file_hash,
+            'error_message': self.error_message,
+            'created_at': self.created_at.isoformat(),
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'download_url': f'/api/v1/reports/{self.id}/download' if self.status == 'ready' else None
+        }
+
+    def __repr__(self):
+        return f'<Report {self.id}: {self.template}.{self.format}>'
@@ -1,13 +1,20 @@
 from datetime import datetime
+from sqlalchemy.orm import object_session
 from ..extensions import db
 
+SCAN_TYPES = ('full', 'quick', 'custom', 'incremental')
+
 class Scan(db.Model):
     __tablename__ = 'scans'
+    __table_args__ = (
+        # Lookup of the previous scan of the same target
+        db.Index('ix_scans_user_target', 'user_id', 'target_url'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     target_url = db.Column(db.String(500), nullable=False)
-    scan_type = db.Column(db.String(50), nullable=False, default='full')  # full, quick, custom
+    scan_type = db.Column(db.String(50), nullable=False, default='full')  # One of SCAN_TYPES
     status = db.Column(db.String(20), nullable=False, default='pending')  # pending, running, completed, failed
     progress = db.Column(db.Integer, default=0)  # 0-100 percentage
     started_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -17,11 +24,23 @@ class Scan(db.Model):
     medium_severity_count = db.Column(db.Integer, default=0)
     low_severity_count = db.Column(db.Integer, default=0)
     scan_config = db.Column(db.JSON)  # Store scan configuration as JSON
+    batch_id = db.Column(db.String(32), db.ForeignKey('scan_batches.id'), index=True)  # Set for bulk submissions
+    version = db.Column(db.Integer, nullable=False, default=1)  # Bumped on every update, used for ETags
     error_message = db.Column(db.Text)
     
     # Relationship with user
     user = db.relationship('User', backref=db.backref('scans', lazy=True))
     
+    def get_previous_scan(self):
+        """Get the last completed scan of the same target before this one"""
+        return Scan.query.filter(
+            Scan.user_id == self.user_id,
+            Scan.target_url == self.target_url,
+            Scan.status == 'completed',
+            Scan.id != self.id,
+            Scan.started_at <= self.started_at
+        ).order_by(Scan.started_at.desc(), Scan.id.desc()).first()
+    
     def to_dict(self):
         """Convert scan to dictionary"""
         return {
@@ -37,47 +56,28 @@ class Scan(db.Model):
             'high_severity_count': self.high_severity_count,
             'medium_severity_count': self.medium_severity_count,
             'low_severity_count': self.low_severity_count,
-            'error_message': self.error_message
+            'error_message': self.error_message,
+            'batch_id': self.batch_id
         }
     
     def __repr__(self):
         return f'<Scan {self.id}: {self.target_url}>'
 
-class ScanResult(db.Model):
-    __tablename__ = 'scan_results'
-    
-    id = db.Column(db.Integer, primary_key=True)
-    scan_id = db.Column(db.Integer, db.ForeignKey('scans.id'), nullable=False)
-    vulnerability_type = db.Column(db.String(100), nullable=False)
-    severity = db.Column(db.String(20), nullable=False)  # low, medium, high, critical
-    title = db.Column(db.String(200), nullable=False)
-    description = db.Column(db.Text)
-    affected_url = db.Column(db.String(500))
-    evidence = db.Column(db.Text)
-    recommendation = db.Column(db.Text)
-    cve_id = db.Column(db.String(20))  # CVE identifier if applicable
-    cvss_score = db.Column(db.Float)
-    found_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    # Relationship with scan
-    scan = db.relationship('Scan', backref=db.backref('results', lazy=True))
-    
-    def to_dict(self):
-        """Convert scan result to dictionary"""
-        return {
-            'id': self.id,
-            'scan_id': self.scan_id,
-            'vulnerability_type': self.vulnerability_type,
-            'severity': self.severity,
-            'title': self.title,
-            'description': self.description,
-            'affected_url': self.affected_url,
-            'evidence': self.evidence,
-            'recommendation': self.recommendation,
-            'cve_id': self.cve_id,
-            'cvss_score': self.cvss_score,
-            'found_at': self.found_at.isoformat()
-        }
-    
-    def __repr__(self):
-        return f'<ScanResult {self.id}: {self.vulnerability_type}>'
\ No newline at end of file
+def _bump_collection_version(connection, user_id):
+    """Increment the owner's scan list version in the same transaction"""
+    users = db.metadata.tables['users']
+    connection.execute(
+        users.update().where(users.c.id == user_id).values(scans_version=users.c.scans_version + 1)
+    )
+
+@db.event.listens_for(Scan, 'before_update')
+def _on_scan_update(mapper, connection, target):
+    """Bump the row and collection versions whenever a scan actually changes"""
+    if object_session(target).is_modified(target, include_collections=False):
+        target.version = (target.version or 0) + 1
+        _bump_collection_version(connection, target.user_id)
+
+@db.event.listens_for(Scan, 'after_insert')
+@db.event.listens_for(Scan, 'after_delete')
+def _on_scan_insert_or_delete(mapper, connection, target):
+    _bump_collection_version(connection, target.user_id)
@@ -0,0 +1,49 @@
+import uuid
+from datetime import datetime
+from ..extensions import db
+
+class ScanBatch(db.Model):
+    __tablename__ = 'scan_batches'
+
+    id = db.Column(db.String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    scan_type = db.Column(db.String(50), nullable=False, default='full')
+    total_scans = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationship with scans
+    scans = db.relationship('Scan', backref='batch', lazy='dynamic')
+
+    def get_progress(self):
+        """Aggregate status counts and progress of the scans in this batch"""
+        from .scan import Scan
+
+        rows = db.session.query(
+            Scan.status, db.func.count(Scan.id), db.func.coalesce(db.func.sum(Scan.progress), 0)
+        ).filter(Scan.batch_id == self.id).group_by(Scan.status).all()
+
+        status_counts = {status: count for status, count, _ in rows}
+        progress_sum = sum(progress for _, _, progress in rows)
+        finished = status_counts.get('completed', 0) + status_counts.get('failed', 0)
+
+        return {
+            'status_counts': status_counts,
+            'finished': finished,
+            'progress': round(progress_sum / self.total_scans) if self.total_scans else 100,
+            'status': 'completed' if finished >= self.total_scans else 'running'
+        }
+
+    def to_dict(self):
+        """Convert batch to dictionary"""
+        data = {
+            'id': self.id,
+            'user_id': self.user_id,
+            'scan_type': self.scan_type,
+            'total_scans': self.total_scans,
+            'created_at': self.created_at.isoformat()
+        }
+        data.update(self.get_progress())
+        return data
+
+    def __repr__(self):
+        return f'<ScanBatch {self.id}: {self.total_scans} scans>'
@@ -0,0 +1,43 @@
+from datetime import datetime
+from ..extensions import db
+
+class ScanDiff(db.Model):
+    __tablename__ = 'scan_diffs'
+
+    id = db.Column(db.Integer, primary_key=True)
+    scan_id = db.Column(db.Integer, db.ForeignKey('scans.id', ondelete='CASCADE'), nullable=False, unique=True, index=True)
+    base_scan_id = db.Column(db.Integer, db.ForeignKey('scans.id', ondelete='SET NULL'))  # Previous scan of the same target
+    added = db.Column(db.JSON, nullable=False, default=list)
+    removed = db.Column(db.JSON, nullable=False, default=list)
+    unchanged = db.Column(db.JSON, nullable=False, default=list)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationship with scan
+    scan = db.relationship('Scan', foreign_keys=[scan_id],
+                           backref=db.backref('diff', uselist=False, cascade='all, delete-orphan'))
+
+    def __init__(self, scan_id, base_scan_id, diff):
+        self.scan_id = scan_id
+        self.base_scan_id = base_scan_id
+        self.added = diff['added']
+        self.removed = diff['removed']
+        self.unchanged = diff['unchanged']
+
+    def to_dict(self):
+        """Convert scan diff to dictionary"""
+        return {
+            'scan_id': self.scan_id,
+            'base_scan_id': self.base_scan_id,
+            'created_at': self.created_at.isoformat(),
+            'added': self.added,
+            'removed': self.removed,
+            'unchanged': self.unchanged,
+            'summary': {
+                'added': len(self.added),
+                'removed': len(self.removed),
+                'unchanged': len(self.unchanged)
+            }
+        }
+
+    def __repr__(self):
+        return f'<ScanDiff {self.scan_id} vs {self.base_scan_id}>'
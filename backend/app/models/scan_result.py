@@ -5,7 +5,7 @@ class ScanResult(db.Model):
     __tablename__ = 'scan_results'
     
     id = db.Column(db.Integer, primary_key=True)
-    scan_id = db.Column(db.Integer, db.ForeignKey('scans.id'), nullable=False)
+    scan_id = db.Column(db.Integer, db.ForeignKey('scans.id', ondelete='CASCADE'), nullable=False)
     tool_name = db.Column(db.String(50), nullable=False)  # nmap, sqlmap, nikto
     tool_version = db.Column(db.String(50))
     raw_data = db.Column(db.JSON, nullable=False)  # Raw tool output
@@ -13,6 +13,15 @@ class ScanResult(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     processing_time = db.Column(db.Float)  # Time taken to process in seconds
     
+    # Sandbox accounting for the tool process(es) behind this result
+    peak_rss_kb = db.Column(db.Integer)
+    cpu_time = db.Column(db.Float)  # User + system seconds
+    output_bytes = db.Column(db.BigInteger)
+    limits_exceeded = db.Column(db.JSON)  # e.g. ['timeout', 'output']; empty when within budget
+    
+    # Relationship with scan
+    scan = db.relationship('Scan', backref=db.backref('results', lazy=True, cascade='all, delete-orphan'))
+    
     def __init__(self, scan_id, tool_name, raw_data, tool_version=None, processing_time=None):
         self.scan_id = scan_id
         self.tool_name = tool_name
@@ -20,10 +29,18 @@ class ScanResult(db.Model):
         self.tool_version = tool_version
         self.processing_time = processing_time
     
+    def set_resource_usage(self, usage):
+        """Copy sandbox accounting (see ToolRun.resources) onto the result"""
+        if not usage:
+            return
+        self.peak_rss_kb = usage.get('peak_rss_kb')
+        self.cpu_time = usage.get('cpu_seconds')
+        self.output_bytes = usage.get('output_bytes')
+        self.limits_exceeded = usage.get('exceeded') or []
+    
     def set_ai_analysis(self, analysis):
-        """Set AI analysis results"""
+        """Set AI analysis results (caller commits)"""
         self.ai_analysis = analysis
-        db.session.commit()
     
     def get_severity(self):
         """Get vulnerability severity from AI analysis"""
@@ -52,6 +69,12 @@ class ScanResult(db.Model):
             'tool_version': self.tool_version,
             'created_at': self.created_at.isoformat(),
             'processing_time': self.processing_time,
+            'resource_usage': {
+                'peak_rss_kb': self.peak_rss_kb,
+                'cpu_time': self.cpu_time,
+                'output_bytes': self.output_bytes,
+                'limits_exceeded': self.limits_exceeded or []
+            },
             'severity': self.get_severity(),
             'vulnerability_type': self.get_vulnerability_type(),
             'has_vulnerabilities': self.has_vulnerabilities(),
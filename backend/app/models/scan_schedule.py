@@ -0,0 +1,76 @@
+import zlib
+from datetime import datetime, timedelta
+from ..extensions import db
+from ..utils.cron import CronSpec
+
+class ScanSchedule(db.Model):
+    __tablename__ = 'scan_schedules'
+    __table_args__ = (
+        # The scheduler only ever asks for active schedules that are due
+        db.Index('ix_scan_schedules_due', 'is_active', 'next_run_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    target_url = db.Column(db.String(500), nullable=False)
+    scan_type = db.Column(db.String(50), nullable=False, default='full')
+    cron = db.Column(db.String(100), nullable=False)  # Five-field cron expression or @daily style alias
+    jitter_seconds = db.Column(db.Integer, nullable=False, default=300)  # Spread window after the cron time
+    is_active = db.Column(db.Boolean, default=True, nullable=False)
+    next_run_at = db.Column(db.DateTime, nullable=False)
+    last_run_at = db.Column(db.DateTime)
+    last_scan_id = db.Column(db.Integer, db.ForeignKey('scans.id', ondelete='SET NULL'))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationship with user
+    user = db.relationship('User', backref=db.backref('scan_schedules', lazy=True))
+
+    def __init__(self, user_id, target_url, cron, scan_type='full', jitter_seconds=300):
+        self.user_id = user_id
+        self.target_url = target_url
+        self.cron = cron
+        self.scan_type = scan_type
+        self.jitter_seconds = jitter_seconds
+        self.is_active = True
+        self.next_run_at = self.compute_next_run(datetime.utcnow())
+
+    def _jitter(self):
+        """Stable per-schedule offset so schedules sharing a cron time don't fire together"""
+        if not self.jitter_seconds:
+            return timedelta(0)
+        seed = f'{self.user_id}:{self.target_url}:{self.cron}'.encode('utf-8')
+        return timedelta(seconds=zlib.crc32(seed) % self.jitter_seconds)
+
+    def compute_next_run(self, after):
+        """Get the next jittered run time after the given moment
+
+        The cron time is looked up on the un-jittered timeline, so a jitter
+        longer than the cron period shifts every run by the same offset
+        instead of skipping cron times.
+        """
+        jitter = self._jitter()
+        return CronSpec(self.cron).next_after(after - jitter) + jitter
+
+    def advance(self, now):
+        """Move next_run_at past now after the schedule fired, skipping missed runs"""
+        self.last_run_at = now
+        self.next_run_at = self.compute_next_run(now)
+
+    def to_dict(self):
+        """Convert schedule to dictionary"""
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'target_url': self.target_url,
+            'scan_type': self.scan_type,
+            'cron': self.cron,
+            'jitter_seconds': self.jitter_seconds,
+            'is_active': self.is_active,
+            'next_run_at': self.next_run_at.isoformat(),
+            'last_run_at': self.last_run_at.isoformat() if self.last_run_at else None,
+            'last_scan_id': self.last_scan_id,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+    def __repr__(self):
+        return f'<ScanSchedule {self.id}: {self.target_url} ({self.cron})>'
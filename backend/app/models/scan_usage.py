@@ -0,0 +1,79 @@
+from datetime import datetime
+from flask import current_app
+from ..extensions import db
+
+class ScanUsage(db.Model):
+    """Scan reservations; a user's usage is the sum of those inside the rolling window"""
+    __tablename__ = 'scan_usage'
+    __table_args__ = (
+        db.Index('ix_scan_usage_user_reserved', 'user_id', 'reserved_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    reserved_at = db.Column(db.DateTime, nullable=False)
+    count = db.Column(db.Integer, nullable=False, default=1)
+
+    @classmethod
+    def reserve(cls, user_id, count, limit, window, now=None):
+        """Consume count scans if the rolling usage stays within limit
+
+        The user's row is locked first, so concurrent reservations for the same
+        user are serialized and cannot both pass the check. Runs inside the
+        caller's transaction: a rollback releases the reservation. A window of
+        None counts every reservation ever made (a lifetime limit).
+        """
+        if count > limit:
+            return False
+
+        from .user import User
+        now = now or datetime.utcnow()
+        db.session.query(User.id).filter_by(id=user_id).with_for_update().scalar()
+
+        if cls.used_in_window(user_id, window, now) + count > limit:
+            return False
+
+        db.session.add(cls(user_id=user_id, reserved_at=now, count=count))
+        if window is not None:
+            # Reservations that left the window no longer count
+            cls.query.filter(
+                cls.user_id == user_id,
+                cls.reserved_at <= now - window
+            ).delete(synchronize_session=False)
+        return True
+
+    @staticmethod
+    def applies_to(user):
+        """Whether user's scans count against scan_limit
+
+        Guests are always limited and admins never are; other users only
+        when SCAN_QUOTA_ALL_USERS is enabled.
+        """
+        if user.is_admin:
+            return False
+        return user.is_guest or current_app.config.get('SCAN_QUOTA_ALL_USERS', False)
+
+    @staticmethod
+    def window_for(user):
+        """Guests keep a lifetime limit (None); other users get SCAN_QUOTA_WINDOW"""
+        if user.is_guest:
+            return None
+        return current_app.config['SCAN_QUOTA_WINDOW']
+
+    @classmethod
+    def reserve_for(cls, user, count, now=None):
+        """reserve() with the user's limit and window; unlimited users always succeed"""
+        if not cls.applies_to(user):
+            return True
+        return cls.reserve(user.id, count, user.scan_limit, cls.window_for(user), now)
+
+    @classmethod
+    def used_in_window(cls, user_id, window, now=None):
+        """Scans reserved in the window ending at now (all of them when window is None)"""
+        query = db.session.query(db.func.coalesce(db.func.sum(cls.count), 0)).filter(cls.user_id == user_id)
+        if window is not None:
+            query = query.filter(cls.reserved_at > (now or datetime.utcnow()) - window)
+        return query.scalar()
+
+    def __repr__(self):
+        return f'<ScanUsage {self.user_id} @ {self.reserved_at}: {self.count}>'
@@ -1,6 +1,14 @@
 from datetime import datetime
+from functools import lru_cache
+from flask import current_app
 from werkzeug.security import generate_password_hash, check_password_hash
 from ..extensions import db
+from .scan_usage import ScanUsage
+
+@lru_cache(maxsize=None)
+def _stored_method(method):
+    """Method prefix werkzeug writes for a configured method (e.g. 'scrypt' -> 'scrypt:32768:8:1')"""
+    return generate_password_hash('', method=method).split('$', 1)[0]
 
 class User(db.Model):
     __tablename__ = 'users'
@@ -15,6 +23,7 @@ class User(db.Model):
     is_admin = db.Column(db.Boolean, default=False, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     last_login = db.Column(db.DateTime)
+    scans_version = db.Column(db.Integer, default=0, nullable=False)  # Bumped when any of the user's scans change
     
     def __init__(self, email, username, password, is_guest=False, scan_limit=None):
         self.email = email
@@ -29,21 +38,32 @@ class User(db.Model):
             self.scan_limit = 10
     
     def set_password(self, password):
-        """Hash and set password"""
-        self.password_hash = generate_password_hash(password)
+        """Hash and set password with the configured method"""
+        self.password_hash = generate_password_hash(password, method=current_app.config['PASSWORD_HASH_METHOD'])
     
     def check_password(self, password):
-        """Check if provided password matches hash"""
-        return check_password_hash(self.password_hash, password)
+        """Check if provided password matches hash, upgrading an outdated hash (caller commits)"""
+        if not check_password_hash(self.password_hash, password):
+            return False
+        
+        if self.needs_rehash():
+            self.set_password(password)
+        return True
+    
+    def needs_rehash(self):
+        """Whether the stored hash was made with different parameters than configured"""
+        return self.password_hash.split('$', 1)[0] != _stored_method(current_app.config['PASSWORD_HASH_METHOD'])
     
     def get_remaining_scans(self):
-        """Get remaining scans for user"""
+        """Get remaining scans for user in the current quota window"""
         if self.is_admin:
             return float('inf')  # Unlimited for admins
         
-        # For now, just return scan_limit
-        # TODO: Later subtract actual scan count
-        return self.scan_limit
+        if not ScanUsage.applies_to(self):
+            return self.scan_limit
+        
+        used = ScanUsage.used_in_window(self.id, ScanUsage.window_for(self))
+        return max(self.scan_limit - used, 0)
     
     def can_scan(self):
         """Check if user can perform a new scan"""
@@ -0,0 +1,88 @@
+from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+from ..extensions import db
+
+class UserScanStats(db.Model):
+    """Per-user scan totals, maintained incrementally as scans change state"""
+    __tablename__ = 'user_scan_stats'
+
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    total_scans = db.Column(db.Integer, nullable=False, default=0)
+    completed_scans = db.Column(db.Integer, nullable=False, default=0)
+    failed_scans = db.Column(db.Integer, nullable=False, default=0)
+    total_vulnerabilities = db.Column(db.Integer, nullable=False, default=0)
+    high_severity_count = db.Column(db.Integer, nullable=False, default=0)
+    medium_severity_count = db.Column(db.Integer, nullable=False, default=0)
+    low_severity_count = db.Column(db.Integer, nullable=False, default=0)
+    last_scan_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    COUNTERS = ('total_scans', 'completed_scans', 'failed_scans', 'total_vulnerabilities',
+                'high_severity_count', 'medium_severity_count', 'low_severity_count')
+
+    @classmethod
+    def increment(cls, user_id, last_scan_at=None, **deltas):
+        """Atomically add deltas to a user's counters within the current transaction"""
+        values = {name: getattr(cls, name) + delta for name, delta in deltas.items() if delta}
+        values['updated_at'] = datetime.utcnow()
+        if last_scan_at is not None:
+            values['last_scan_at'] = last_scan_at
+
+        updated = cls.query.filter_by(user_id=user_id).update(values, synchronize_session=False)
+        if updated:
+            return
+
+        # First scan for this user: create the row, falling back to UPDATE if another writer won
+        try:
+            with db.session.begin_nested():
+                row = cls(user_id=user_id, last_scan_at=last_scan_at)
+                for name in cls.COUNTERS:
+                    setattr(row, name, deltas.get(name, 0))
+                db.session.add(row)
+        except IntegrityError:
+            cls.query.filter_by(user_id=user_id).update(values, synchronize_session=False)
+
+    @classmethod
+    def rebuild(cls, user_id):
+        """Recompute a user's row from the scans table (backfill and repair)"""
+        from .scan import Scan
+
+        counts = db.session.query(
+            db.func.count(Scan.id),
+            db.func.count(Scan.id).filter(Scan.status == 'completed'),
+            db.func.count(Scan.id).filter(Scan.status == 'failed'),
+            db.func.coalesce(db.func.sum(Scan.total_vulnerabilities), 0),
+            db.func.coalesce(db.func.sum(Scan.high_severity_count), 0),
+            db.func.coalesce(db.func.sum(Scan.medium_severity_count), 0),
+            db.func.coalesce(db.func.sum(Scan.low_severity_count), 0),
+            db.func.max(Scan.started_at)
+        ).filter(Scan.user_id == user_id).one()
+
+        row = cls.query.get(user_id) or cls(user_id=user_id)
+        for name, value in zip(cls.COUNTERS, counts[:-1]):
+            setattr(row, name, value)
+        row.last_scan_at = counts[-1]
+        row.updated_at = datetime.utcnow()
+        db.session.add(row)
+        return row
+
+    def to_dict(self):
+        """Convert stats to dictionary"""
+        return {
+            'user_id': self.user_id,
+            'total_scans': self.total_scans,
+            'completed_scans': self.completed_scans,
+            'failed_scans': self.failed_scans,
+            'active_scans': self.total_scans - self.completed_scans - self.failed_scans,
+            'total_vulnerabilities': self.total_vulnerabilities,
+            'severity_breakdown': {
+                'high': self.high_severity_count,
+                'medium': self.medium_severity_count,
+                'low': self.low_severity_count
+            },
+            'last_scan_at': self.last_scan_at.isoformat() if self.last_scan_at else None,
+            'updated_at': self.updated_at.isoformat()
+        }
+
+    def __repr__(self):
+        return f'<UserScanStats {self.user_id}: {self.total_scans} scans>'
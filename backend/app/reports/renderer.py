@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Any, Iterator, List
+
+from jinja2 import Environment, PackageLoader, select_autoescape
+
+from ..models.scan import Scan
+from ..models.scan_result import ScanResult
+from ..scanner.findings import normalize_results
+from ..extensions import db
+
+TEMPLATES = ('summary', 'detailed')
+FORMATS = ('pdf', 'html')
+SEVERITIES = ['critical', 'high', 'medium', 'low', 'info', 'unknown']
+SUMMARY_SEVERITIES = ('critical', 'high', 'medium')  # Findings listed by the summary template
+HASH_CHUNK = 1024 * 1024
+
+_environment = Environment(
+    loader=PackageLoader('app.reports', 'templates'),
+    autoescape=select_autoescape(['html'])
+)
+
+def report_cache_key(scan_ids: List[int], template: str, fmt: str) -> str:
+    """Hash identifying a report by what was asked for"""
+    identity = json.dumps([sorted(scan_ids), template, fmt])
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+def report_content_hash(scan_ids: List[int]) -> str:
+    """Hash of the stored results a report would be rendered from"""
+    rows = db.session.query(Scan.id, Scan.status, Scan.completed_at).filter(Scan.id.in_(scan_ids)).all()
+    result_ids = db.session.query(ScanResult.scan_id, ScanResult.id).filter(
+        ScanResult.scan_id.in_(scan_ids)
+    ).order_by(ScanResult.scan_id, ScanResult.id).all()
+
+    identity = json.dumps({
+        'scans': sorted([scan_id, status, str(completed_at)] for scan_id, status, completed_at in rows),
+        'results': [list(row) for row in result_ids]
+    })
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+def file_sha256(path: str) -> str:
+    """Hash of a rendered file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def iter_sections(scan_ids: List[int]) -> Iterator[Dict[str, Any]]:
+    """Yield one section per scan, loading a single scan's findings at a time"""
+    for scan_id in sorted(scan_ids):
+        scan = Scan.query.get(scan_id)
+        if scan is None:
+            continue
+
+        results = ScanResult.query.filter_by(scan_id=scan_id).all()
+        findings = sorted(
+            normalize_results(results).values(),
+            key=lambda finding: (SEVERITIES.index(finding['severity']) if finding['severity'] in SEVERITIES
+                                 else len(SEVERITIES), finding['tool'], finding['title'])
+        )
+        yield {
+            'scan': scan,
+            'findings': findings,
+            'counts': Counter(finding['severity'] for finding in findings)
+        }
+
+        # Keep the session from accumulating every scan's raw results
+        for result in results:
+            db.session.expunge(result)
+
+def render_report(scan_ids: List[int], template: str, fmt: str, output_path: str) -> int:
+    """Render a report to output_path and return its size in bytes
+
+    Output is written to a temporary file in the destination directory and
+    moved into place once complete, so readers never see a partial file.
+    """
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(output_path), suffix=f'.{fmt}.part')
+
+    try:
+        with os.fdopen(fd, 'wb') as output:
+            if fmt == 'html':
+                _render_html(scan_ids, template, output)
+            else:
+                _render_pdf(scan_ids, template, output)
+        os.replace(temp_path, output_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    return os.path.getsize(output_path)
+
+def _context(scan_ids: List[int]) -> Dict[str, Any]:
+    return {
+        'generated_at': datetime.utcnow().strftime('%Y-%m-%d %H:%M'),
+        'scan_count': len(scan_ids),
+        'severities': SEVERITIES[:-1],
+        'summary_severities': SUMMARY_SEVERITIES,
+        'sections': iter_sections(scan_ids)
+    }
+
+def _render_html(scan_ids: List[int], template: str, output) -> None:
+    """Stream template output to the file chunk by chunk"""
+    for chunk in _environment.get_template(f'{template}.html').generate(**_context(scan_ids)):
+        output.write(chunk.encode('utf-8'))
+
+PDF_TABLE_ROWS = 100  # Findings per table; long sections become several tables
+
+class _FlowableStream(list):
+    """Story list that pulls flowables from a generator as reportlab consumes them
+
+    The doc template takes flowables off the front of the list as they are laid
+    out, so only the flowables of the section being drawn are held in memory.
+    """
+
+    def __init__(self, flowables):
+        super().__init__()
+        self._source = iter(flowables)
+
+    def _fill(self, size: int) -> None:
+        while self._source is not None and list.__len__(self) < size:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+
+    def __len__(self):
+        self._fill(1)
+        return list.__len__(self)
+
+    def __getitem__(self, index):
+        # Lookahead (keepWithNext) reads past the front of the list
+        if isinstance(index, int) and index >= 0:
+            self._fill(index + 1)
+        return list.__getitem__(self, index)
+
+def _render_pdf(scan_ids: List[int], template: str, output) -> None:
+    """Render the PDF with reportlab directly into the output file, one section at a time"""
+    # reportlab is only needed by the report worker, so import it lazily
+    from reportlab.platypus import SimpleDocTemplate
+    from reportlab.lib.pagesizes import A4
+
+    document = SimpleDocTemplate(output, pagesize=A4, title='Vulnerability Scan Report')
+    document.build(_FlowableStream(_pdf_story(scan_ids, template)))
+
+def _pdf_story(scan_ids: List[int], template: str) -> Iterator[Any]:
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+    from xml.sax.saxutils import escape
+
+    styles = getSampleStyleSheet()
+    context = _context(scan_ids)
+    cell = styles['BodyText']
+    table_style = TableStyle([
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.whitesmoke),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP')
+    ])
+
+    yield Paragraph('Vulnerability Scan Report', styles['Title'])
+    yield Paragraph(f"Generated {context['generated_at']} UTC - {context['scan_count']} scan(s)", styles['Normal'])
+    yield Spacer(1, 12)
+
+    for section in context['sections']:
+        scan = section['scan']
+        yield Paragraph(escape(scan.target_url), styles['Heading2'])
+        yield Paragraph(f'Scan #{scan.id} - {scan.scan_type} - {scan.status}', styles['Normal'])
+
+        counts = [[severity.title() for severity in context['severities']] + ['Total'],
+                  [section['counts'].get(severity, 0) for severity in context['severities']] +
+                  [len(section['findings'])]]
+        yield Table(counts, style=table_style)
+        yield Spacer(1, 8)
+
+        findings = section['findings']
+        if template == 'summary':
+            findings = [finding for finding in findings if finding['severity'] in SUMMARY_SEVERITIES]
+            columns = ('severity', 'tool', 'title')
+        else:
+            columns = ('severity', 'tool', 'type', 'title', 'location')
+
+        header = [column.title() for column in columns]
+        for start in range(0, len(findings), PDF_TABLE_ROWS):
+            rows = [header]
+            rows.extend([Paragraph(escape(str(finding[column])), cell) for column in columns]
+                        for finding in findings[start:start + PDF_TABLE_ROWS])
+            yield Table(rows, style=table_style, repeatRows=1)
+        yield Spacer(1, 16)
@@ -0,0 +1,22 @@
+from typing import Dict, Any
+
+def diff_findings(previous: Dict[str, Dict[str, Any]],
+                  current: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Compare two sets of normalized findings indexed by finding key"""
+    previous_keys = previous.keys()
+    current_keys = current.keys()
+
+    added = [current[key] for key in sorted(current_keys - previous_keys)]
+    removed = [previous[key] for key in sorted(previous_keys - current_keys)]
+    unchanged = [current[key] for key in sorted(current_keys & previous_keys)]
+
+    return {
+        'added': added,
+        'removed': removed,
+        'unchanged': unchanged,
+        'summary': {
+            'added': len(added),
+            'removed': len(removed),
+            'unchanged': len(unchanged)
+        }
+    }
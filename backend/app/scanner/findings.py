@@ -0,0 +1,109 @@
+import hashlib
+import re
+from typing import Dict, Any, List, Iterable
+
+# Leading "[12:34:56] [INFO]" style prefixes change on every run and must not
+# take part in a finding's identity
+_VOLATILE_PREFIX = re.compile(r'^(\[[^\]]*\]\s*)+')
+_WHITESPACE = re.compile(r'\s+')
+
+def _clean(value: Any) -> str:
+    """Collapse whitespace and strip volatile prefixes from a text field"""
+    text = str(value or '')
+    text = _VOLATILE_PREFIX.sub('', text.strip())
+    return _WHITESPACE.sub(' ', text).strip()
+
+def _finding(tool: str, finding_type: str, severity: str, title: str,
+             location: str = '', detail: str = '') -> Dict[str, Any]:
+    """Build a normalized finding dictionary"""
+    finding = {
+        'tool': tool,
+        'type': finding_type,
+        'severity': (severity or 'unknown').lower(),
+        'title': _clean(title),
+        'location': location or '',
+        'detail': detail or ''
+    }
+    finding['key'] = finding_key(finding)
+    return finding
+
+def finding_key(finding: Dict[str, Any]) -> str:
+    """Stable hash identifying a finding across scans of the same target"""
+    identity = '\x1f'.join([
+        finding.get('tool', ''),
+        finding.get('type', ''),
+        finding.get('location', ''),
+        finding.get('title', '')
+    ])
+    return hashlib.sha1(identity.encode('utf-8')).hexdigest()
+
+def _normalize_sqlmap(raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    vulnerabilities = (raw_data.get('vulnerabilities') or {}).get('vulnerabilities', [])
+    return [
+        _finding('sqlmap', vuln.get('type', 'SQL Injection'), vuln.get('severity', 'high'),
+                 vuln.get('description', ''), location=vuln.get('url', ''))
+        for vuln in vulnerabilities
+    ]
+
+def _normalize_nmap(raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    target = raw_data.get('target', '')
+    open_ports = (raw_data.get('parsed_results') or {}).get('open_ports', [])
+    return [
+        _finding('nmap', 'Open Port', 'info',
+                 f"{port.get('port')}/{port.get('protocol')} open",
+                 location=f"{target}:{port.get('port')}/{port.get('protocol')}",
+                 detail=port.get('service', ''))
+        for port in open_ports
+    ]
+
+def _nikto_location(vuln: Dict[str, Any]) -> str:
+    # Multi-host reports repeat paths, so the host and port are part of the location
+    if vuln.get('host'):
+        return f"{vuln['host']}:{vuln.get('port', '')}{vuln.get('url', '')}"
+    return vuln.get('url', '')
+
+def _normalize_nikto(raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    vulnerabilities = (raw_data.get('parsed_results') or {}).get('vulnerabilities', [])
+    return [
+        _finding('nikto', vuln.get('type', 'Web Vulnerability'), vuln.get('severity', 'medium'),
+                 vuln.get('description', ''), location=_nikto_location(vuln))
+        for vuln in vulnerabilities
+    ]
+
+def _normalize_http_checks(raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        _finding('http_checks', check.get('type', 'HTTP Check'), check.get('severity', 'info'),
+                 check.get('title', ''), location=check.get('url', ''), detail=check.get('detail', ''))
+        for check in raw_data.get('findings', [])
+    ]
+
+NORMALIZERS = {
+    'sqlmap': _normalize_sqlmap,
+    'nmap': _normalize_nmap,
+    'nikto': _normalize_nikto,
+    'http_checks': _normalize_http_checks
+}
+
+def normalize_result(tool_name: str, raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert raw output of a single tool run into normalized findings"""
+    normalizer = NORMALIZERS.get(tool_name)
+    if not normalizer or not isinstance(raw_data, dict):
+        return []
+    return normalizer(raw_data)
+
+def normalize_results(results: Iterable) -> Dict[str, Dict[str, Any]]:
+    """Normalize all ScanResult rows of a scan into findings indexed by key"""
+    findings = {}
+    for result in results:
+        for finding in normalize_result(result.tool_name, result.raw_data):
+            findings.setdefault(finding['key'], finding)
+    return findings
+
+def count_by_severity(findings: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """Count findings into the high/medium/low buckets stored on a scan"""
+    counts = {'high': 0, 'medium': 0, 'low': 0}
+    for finding in findings:
+        severity = 'high' if finding['severity'] == 'critical' else finding['severity']
+        if severity in counts:
+            counts[severity] += 1
+    return counts
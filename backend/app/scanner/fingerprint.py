@@ -0,0 +1,92 @@
+import hashlib
+import re
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+WEB_SERVICES = {'http', 'https', 'http-alt', 'http-proxy', 'https-alt', 'ssl/http', 'http-mgmt'}
+WEB_PORTS = {80, 443, 8000, 8080, 8443, 8888}
+
+_LINK_PATTERN = re.compile(r'''(?:href|action|src)\s*=\s*["']([^"'#]+)''', re.IGNORECASE)
+_INPUT_PATTERN = re.compile(r'''name\s*=\s*["']([^"']+)''', re.IGNORECASE)
+
+def probe_http(target_url: str, timeout: float = 10) -> Dict[str, Any]:
+    """Fetch the target page once and summarize its attack surface"""
+    try:
+        response = httpx.get(target_url, timeout=timeout, follow_redirects=True, verify=False)
+    except httpx.HTTPError as e:
+        return {'error': str(e)}
+
+    # Hash links and input names rather than the body so that nonces, CSRF
+    # tokens and timestamps don't make every page look changed
+    body = response.text
+    surface = sorted(set(_LINK_PATTERN.findall(body)) | set(_INPUT_PATTERN.findall(body)))
+
+    return {
+        'status': response.status_code,
+        'server': response.headers.get('server', ''),
+        'final_url': str(response.url),
+        'surface_hash': hashlib.sha256('\n'.join(surface).encode('utf-8')).hexdigest()
+    }
+
+def build_fingerprint(nmap_result: Dict[str, Any], http_info: Dict[str, Any],
+                      endpoints: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Build the cheap fingerprint compared between incremental scans
+
+    endpoints are the crawler's endpoint signatures (see signature_key).
+    """
+    open_ports = (nmap_result.get('parsed_results') or {}).get('open_ports', [])
+    fingerprint = {
+        'target': nmap_result.get('target', ''),
+        'ports': sorted(f"{p['port']}/{p['protocol']}:{p['service']}" for p in open_ports),
+        'http': http_info
+    }
+    if endpoints is not None:
+        fingerprint['endpoints'] = sorted(set(endpoints))
+    return fingerprint
+
+def compare_fingerprints(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Work out which parts of the attack surface changed since the previous scan"""
+    new_ports = sorted(set(current.get('ports', [])) - set(previous.get('ports', [])))
+
+    previous_http = previous.get('http') or {}
+    current_http = current.get('http') or {}
+    http_changed = (
+        'error' in previous_http or 'error' in current_http or
+        any(previous_http.get(field) != current_http.get(field)
+            for field in ('status', 'server', 'final_url', 'surface_hash'))
+    )
+
+    # None when either scan has no endpoint signatures (fingerprints from before they were recorded)
+    new_endpoints = removed_endpoints = None
+    if 'endpoints' in previous and 'endpoints' in current:
+        new_endpoints = sorted(set(current['endpoints']) - set(previous['endpoints']))
+        removed_endpoints = sorted(set(previous['endpoints']) - set(current['endpoints']))
+
+    return {
+        'new_ports': new_ports,
+        'new_web_ports': [port for port in new_ports if _is_web_port(port)],
+        'http_changed': http_changed,
+        'new_endpoints': new_endpoints,
+        'removed_endpoints': removed_endpoints,
+        'unchanged': not new_ports and not http_changed and not new_endpoints
+    }
+
+def web_port_urls(target_url: str, ports: List[str]) -> List[str]:
+    """Build URLs for web services listening on the given fingerprint ports"""
+    host = urlparse(target_url).hostname or target_url
+    urls = []
+    for port_spec in ports:
+        port, service = _split_port(port_spec)
+        scheme = 'https' if 'https' in service or 'ssl' in service or port in (443, 8443) else 'http'
+        urls.append(f"{scheme}://{host}:{port}")
+    return urls
+
+def _split_port(port_spec: str):
+    port_proto, _, service = port_spec.partition(':')
+    return int(port_proto.split('/')[0]), service
+
+def _is_web_port(port_spec: str) -> bool:
+    port, service = _split_port(port_spec)
+    return service in WEB_SERVICES or port in WEB_PORTS
@@ -0,0 +1,139 @@
+import asyncio
+import logging
+from html.parser import HTMLParser
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, urlencode, parse_qsl, urldefrag
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+class _LinkParser(HTMLParser):
+    """Collect links and forms from an HTML page"""
+
+    def __init__(self):
+        super().__init__()
+        self.links = []
+        self.forms = []
+        self._form = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in ('a', 'area') and attrs.get('href'):
+            self.links.append(attrs['href'])
+        elif tag in ('frame', 'iframe') and attrs.get('src'):
+            self.links.append(attrs['src'])
+        elif tag == 'form':
+            self._form = {
+                'action': attrs.get('action') or '',
+                'method': (attrs.get('method') or 'get').upper(),
+                'fields': []
+            }
+            self.forms.append(self._form)
+        elif tag in ('input', 'select', 'textarea') and self._form is not None and attrs.get('name'):
+            self._form['fields'].append((attrs['name'], attrs.get('value') or '1'))
+
+    def handle_endtag(self, tag):
+        if tag == 'form':
+            self._form = None
+
+def parameter_signature(endpoint: Dict[str, Any]) -> Tuple:
+    """Identify endpoints that would exercise the same parameters"""
+    parsed = urlparse(endpoint['url'])
+    params = {name for name, _ in parse_qsl(parsed.query, keep_blank_values=True)}
+    if endpoint.get('data'):
+        params |= {name for name, _ in parse_qsl(endpoint['data'], keep_blank_values=True)}
+    return (endpoint.get('method', 'GET'), parsed.scheme, parsed.netloc, parsed.path or '/', tuple(sorted(params)))
+
+def signature_key(endpoint: Dict[str, Any]) -> str:
+    """parameter_signature as a string, for storing in scan results"""
+    method, scheme, netloc, path, params = parameter_signature(endpoint)
+    return f"{method} {scheme}://{netloc}{path}?{','.join(params)}"
+
+class Crawler:
+    """Async same-origin crawler discovering parameterized endpoints"""
+
+    def __init__(self, max_depth: int = 2, max_pages: int = 50, concurrency: int = 10, timeout: float = 10):
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.concurrency = concurrency
+        self.timeout = timeout
+
+    def crawl(self, start_url: str) -> List[Dict[str, Any]]:
+        """Crawl from start_url and return deduplicated parameterized endpoints"""
+        return asyncio.run(self.crawl_async(start_url))
+
+    async def crawl_async(self, start_url: str) -> List[Dict[str, Any]]:
+        origin = urlparse(start_url).netloc
+        endpoints = {}
+        visited = set()
+        frontier = [urldefrag(start_url)[0]]
+
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits, follow_redirects=True,
+                                     verify=False) as client:
+            for depth in range(self.max_depth + 1):
+                batch = []
+                for url in frontier:
+                    if url in visited or len(visited) >= self.max_pages:
+                        continue
+                    visited.add(url)
+                    batch.append(url)
+                if not batch:
+                    break
+
+                pages = await asyncio.gather(*(self._fetch(client, semaphore, url) for url in batch))
+
+                frontier = []
+                for url, page in zip(batch, pages):
+                    if page is None:
+                        continue
+                    for endpoint in self._extract(url, page):
+                        if urlparse(endpoint['url']).netloc != origin:
+                            continue
+                        if endpoint['method'] == 'GET':
+                            frontier.append(endpoint['url'])
+                        if urlparse(endpoint['url']).query or endpoint.get('data'):
+                            endpoints.setdefault(parameter_signature(endpoint), endpoint)
+
+        logger.info(f"Crawled {len(visited)} pages from {start_url}, "
+                    f"found {len(endpoints)} parameterized endpoints")
+        return list(endpoints.values())
+
+    async def _fetch(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str) -> Optional[str]:
+        async with semaphore:
+            try:
+                response = await client.get(url)
+            except httpx.HTTPError as e:
+                logger.debug(f"Crawler failed to fetch {url}: {e}")
+                return None
+
+        if 'html' not in response.headers.get('content-type', ''):
+            return None
+        return response.text
+
+    def _extract(self, page_url: str, html: str) -> List[Dict[str, Any]]:
+        parser = _LinkParser()
+        try:
+            parser.feed(html)
+        except Exception as e:
+            logger.debug(f"Crawler failed to parse {page_url}: {e}")
+
+        found = []
+        for link in parser.links:
+            url = urldefrag(urljoin(page_url, link))[0]
+            if urlparse(url).scheme in ('http', 'https'):
+                found.append({'url': url, 'method': 'GET', 'data': None})
+
+        for form in parser.forms:
+            action = urldefrag(urljoin(page_url, form['action']))[0]
+            query = urlencode(form['fields'])
+            if form['method'] == 'POST':
+                found.append({'url': action, 'method': 'POST', 'data': query or None})
+            elif query:
+                separator = '&' if urlparse(action).query else '?'
+                found.append({'url': f"{action}{separator}{query}", 'method': 'GET', 'data': None})
+
+        return found
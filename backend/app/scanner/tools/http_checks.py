@@ -0,0 +1,247 @@
+import asyncio
+import importlib.util
+import logging
+import ssl
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse, urljoin
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+SECURITY_HEADERS = {
+    'strict-transport-security': ('medium', 'Missing Strict-Transport-Security header'),
+    'content-security-policy': ('medium', 'Missing Content-Security-Policy header'),
+    'x-frame-options': ('low', 'Missing X-Frame-Options header'),
+    'x-content-type-options': ('low', 'Missing X-Content-Type-Options header'),
+    'referrer-policy': ('low', 'Missing Referrer-Policy header'),
+    'permissions-policy': ('low', 'Missing Permissions-Policy header')
+}
+
+BANNER_HEADERS = ('server', 'x-powered-by', 'x-aspnet-version', 'x-aspnetmvc-version', 'x-generator')
+
+SENSITIVE_PATHS = {
+    '/.git/HEAD': ('high', 'Git repository exposed'),
+    '/.svn/entries': ('high', 'Subversion metadata exposed'),
+    '/.hg/requires': ('high', 'Mercurial repository exposed'),
+    '/.env': ('high', 'Environment file exposed'),
+    '/.DS_Store': ('low', 'macOS directory metadata exposed'),
+    '/.htaccess': ('medium', 'Apache .htaccess readable'),
+    '/.htpasswd': ('high', 'Apache .htpasswd readable'),
+    '/config.php.bak': ('high', 'Configuration backup exposed'),
+    '/wp-config.php.bak': ('high', 'WordPress configuration backup exposed'),
+    '/backup.zip': ('high', 'Backup archive exposed'),
+    '/backup.tar.gz': ('high', 'Backup archive exposed'),
+    '/db.sql': ('high', 'Database dump exposed'),
+    '/dump.sql': ('high', 'Database dump exposed'),
+    '/phpinfo.php': ('medium', 'phpinfo() page exposed'),
+    '/info.php': ('medium', 'phpinfo() page exposed'),
+    '/server-status': ('medium', 'Apache server-status exposed'),
+    '/server-info': ('medium', 'Apache server-info exposed'),
+    '/elmah.axd': ('medium', 'ELMAH error log exposed'),
+    '/trace.axd': ('medium', 'ASP.NET trace exposed'),
+    '/actuator/env': ('high', 'Spring Boot actuator env exposed'),
+    '/actuator/heapdump': ('high', 'Spring Boot heap dump exposed'),
+    '/.well-known/security.txt': ('info', 'security.txt present'),
+    '/crossdomain.xml': ('info', 'Flash cross-domain policy present'),
+    '/debug/pprof/': ('medium', 'Go pprof endpoint exposed'),
+    '/admin/': ('info', 'Admin area reachable'),
+    '/phpmyadmin/': ('medium', 'phpMyAdmin reachable')
+}
+
+class CheckEngine:
+    """Run many lightweight HTTP checks concurrently over one pooled client"""
+
+    def __init__(self, concurrency: int = 50, timeout: float = 10):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.checks = [
+            self._check_security_headers,
+            self._check_banners,
+            self._check_cookies,
+            self._check_methods,
+            self._check_robots,
+            self._check_tls,
+            self._check_sensitive_paths
+        ]
+
+    def run(self, target_url: str) -> Dict[str, Any]:
+        """Run all checks against the target and return normalized findings"""
+        return asyncio.run(self.run_async(target_url))
+
+    async def run_async(self, target_url: str) -> Dict[str, Any]:
+        start = time.perf_counter()
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+
+        async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=limits, timeout=self.timeout,
+                                     follow_redirects=False, verify=False) as client:
+            self._client = client
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._requests = {}
+
+            outcomes = await asyncio.gather(*(check(target_url) for check in self.checks),
+                                            return_exceptions=True)
+
+        findings = []
+        errors = []
+        for check, outcome in zip(self.checks, outcomes):
+            if isinstance(outcome, Exception):
+                errors.append(f"{check.__name__.lstrip('_')}: {outcome}")
+            else:
+                findings.extend(outcome)
+
+        return {
+            'target': target_url,
+            'http2': HTTP2_AVAILABLE,
+            'requests_made': len(self._requests),
+            'duration': time.perf_counter() - start,
+            'errors': errors,
+            'findings': findings,
+            'total_found': len(findings)
+        }
+
+    async def _request(self, method: str, url: str) -> Optional[httpx.Response]:
+        """Issue a request once per (method, url) and share the response between checks"""
+        key = (method, url)
+        if key not in self._requests:
+            self._requests[key] = asyncio.ensure_future(self._send(method, url))
+        return await self._requests[key]
+
+    async def _send(self, method: str, url: str) -> Optional[httpx.Response]:
+        async with self._semaphore:
+            try:
+                return await self._client.request(method, url)
+            except httpx.HTTPError as e:
+                logger.debug(f"HTTP check request {method} {url} failed: {e}")
+                return None
+
+    def _finding(self, finding_type: str, severity: str, title: str, url: str, detail: str = '') -> Dict[str, Any]:
+        return {'type': finding_type, 'severity': severity, 'title': title, 'url': url, 'detail': detail}
+
+    async def _check_security_headers(self, target_url: str) -> List[Dict[str, Any]]:
+        response = await self._request('GET', target_url)
+        if response is None:
+            return []
+
+        findings = []
+        for header, (severity, title) in SECURITY_HEADERS.items():
+            if header == 'strict-transport-security' and urlparse(target_url).scheme != 'https':
+                continue
+            if header not in response.headers:
+                findings.append(self._finding('Security Headers', severity, title, target_url))
+        return findings
+
+    async def _check_banners(self, target_url: str) -> List[Dict[str, Any]]:
+        response = await self._request('GET', target_url)
+        if response is None:
+            return []
+
+        return [
+            self._finding('Information Disclosure', 'low', f'{header} banner disclosed', target_url,
+                          response.headers[header])
+            for header in BANNER_HEADERS if response.headers.get(header)
+        ]
+
+    async def _check_cookies(self, target_url: str) -> List[Dict[str, Any]]:
+        response = await self._request('GET', target_url)
+        if response is None:
+            return []
+
+        findings = []
+        https = urlparse(target_url).scheme == 'https'
+        for cookie in response.headers.get_list('set-cookie'):
+            name = cookie.split('=', 1)[0].strip()
+            flags = cookie.lower()
+            if 'httponly' not in flags:
+                findings.append(self._finding('Cookie Security', 'low', f'Cookie {name} without HttpOnly', target_url))
+            if https and 'secure' not in flags:
+                findings.append(self._finding('Cookie Security', 'medium', f'Cookie {name} without Secure', target_url))
+        return findings
+
+    async def _check_methods(self, target_url: str) -> List[Dict[str, Any]]:
+        response = await self._request('OPTIONS', target_url)
+        if response is None:
+            return []
+
+        allowed = {method.strip().upper() for method in response.headers.get('allow', '').split(',') if method.strip()}
+        risky = sorted(allowed & {'TRACE', 'TRACK', 'PUT', 'DELETE', 'CONNECT'})
+        if not risky:
+            return []
+        return [self._finding('HTTP Methods', 'medium', 'Risky HTTP methods allowed', target_url, ', '.join(risky))]
+
+    async def _check_robots(self, target_url: str) -> List[Dict[str, Any]]:
+        url = urljoin(target_url, '/robots.txt')
+        response = await self._request('GET', url)
+        if response is None or response.status_code != 200:
+            return []
+
+        disallowed = [
+            line.split(':', 1)[1].strip()
+            for line in response.text.splitlines()
+            if line.lower().startswith('disallow:') and line.split(':', 1)[1].strip()
+        ]
+        if not disallowed:
+            return []
+        return [self._finding('Information Disclosure', 'info', 'robots.txt lists disallowed paths', url,
+                              ', '.join(disallowed[:50]))]
+
+    async def _check_tls(self, target_url: str) -> List[Dict[str, Any]]:
+        parsed = urlparse(target_url)
+        if parsed.scheme != 'https':
+            return [self._finding('Transport Security', 'medium', 'Site served over plain HTTP', target_url)]
+
+        host = parsed.hostname
+        port = parsed.port or 443
+        context = ssl.create_default_context()
+        findings = []
+
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port, ssl=context, server_hostname=host), self.timeout)
+        except ssl.SSLCertVerificationError as e:
+            return [self._finding('Transport Security', 'high', 'Invalid TLS certificate', target_url, e.verify_message)]
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.debug(f"TLS check failed for {target_url}: {e}")
+            return []
+
+        try:
+            ssl_object = writer.get_extra_info('ssl_object')
+            version = ssl_object.version()
+            if version in ('SSLv3', 'TLSv1', 'TLSv1.1'):
+                findings.append(self._finding('Transport Security', 'medium', f'Outdated protocol {version}', target_url))
+
+            cert = ssl_object.getpeercert()
+            expires = datetime.fromtimestamp(ssl.cert_time_to_seconds(cert['notAfter']), timezone.utc)
+            days_left = (expires - datetime.now(timezone.utc)).days
+            if days_left < 30:
+                findings.append(self._finding('Transport Security', 'medium', 'TLS certificate expires soon', target_url,
+                                              f'{days_left} days left'))
+        finally:
+            writer.close()
+
+        return findings
+
+    async def _check_sensitive_paths(self, target_url: str) -> List[Dict[str, Any]]:
+        urls = {path: urljoin(target_url, path) for path in SENSITIVE_PATHS}
+        # A random path tells us how the server answers for missing files (soft 404s)
+        baseline, *responses = await asyncio.gather(
+            self._request('GET', urljoin(target_url, f'/{uuid.uuid4().hex}')),
+            *(self._request('GET', url) for url in urls.values())
+        )
+        soft_404 = baseline is not None and baseline.status_code == 200
+
+        findings = []
+        for (path, url), response in zip(urls.items(), responses):
+            if response is None or response.status_code != 200 or not response.content:
+                continue
+            if soft_404 and response.content == baseline.content:
+                continue
+            severity, title = SENSITIVE_PATHS[path]
+            findings.append(self._finding('Sensitive File', severity, title, url))
+        return findings
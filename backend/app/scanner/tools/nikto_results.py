@@ -0,0 +1,184 @@
+import re
+import json
+import logging
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK = 65536
+MAX_VALUE_BYTES = 8 * 1024 * 1024  # A single item larger than this is treated as a corrupt report
+HOST_FIELDS = ('host', 'ip', 'port', 'banner')
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\r\n]*')
+_SEPARATORS = re.compile(r'[ \t\r\n,]*')
+
+class _JSONStream:
+    """Chunked reader over a JSON document that decodes one value at a time
+
+    Only the unread part of the current chunk and the value being decoded are
+    held in memory, however large the document is.
+    """
+
+    def __init__(self, f, chunk_size: int = READ_CHUNK):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, '' at the end of the document"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def skip(self, char: str) -> bool:
+        """Consume char if it comes next"""
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, char: str) -> None:
+        if not self.skip(char):
+            raise ValueError(f"Expected {char!r} at offset {self.pos}")
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or not self._fill():
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if len(self.buffer) - self.pos > MAX_VALUE_BYTES or not self._fill():
+                    raise
+
+    def array_items(self) -> Iterator[Any]:
+        """Decode the elements of the array whose '[' was just consumed
+
+        The hot loop for large reports, so separators are skipped with one regex
+        match per element instead of going through peek() and skip().
+        """
+        while True:
+            pos = _SEPARATORS.match(self.buffer, self.pos).end()
+            self.pos = pos
+            if pos == len(self.buffer):
+                if not self._fill():
+                    raise ValueError('Unterminated array')
+                continue
+            if self.buffer[pos] == ']':
+                self.pos = pos + 1
+                return
+            try:
+                value, end = _decoder.raw_decode(self.buffer, pos)
+            except json.JSONDecodeError:
+                if len(self.buffer) - pos > MAX_VALUE_BYTES or not self._fill():
+                    raise
+                continue
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            yield value
+
+def _iter_host(stream: _JSONStream) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+    """(host, item) pairs for one host object, then (host, None) once the object ends
+
+    Host fields are filled in as they are read; Nikto writes them before the items.
+    """
+    stream.expect('{')
+    host = {}
+    while not stream.skip('}'):
+        key = stream.value()
+        stream.expect(':')
+        if key == 'vulnerabilities' and stream.skip('['):
+            for item in stream.array_items():
+                if isinstance(item, dict):
+                    yield host, item
+        else:
+            value = stream.value()
+            if key in HOST_FIELDS:
+                host[key] = value
+        stream.skip(',')
+    yield host, None
+
+def iter_nikto_items(f, chunk_size: int = READ_CHUNK) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+    """Stream (host, item) pairs from a Nikto JSON report, with item None at each host's end
+
+    Handles the single-host object of Nikto 2.1 and the list of host objects
+    written by Nikto 2.5 for multi-host scans. Raises ValueError on a malformed
+    report, after yielding the items read up to that point.
+    """
+    stream = _JSONStream(f, chunk_size)
+    first = stream.peek()
+    if first == '[':
+        stream.skip('[')
+        while not stream.skip(']'):
+            yield from _iter_host(stream)
+            stream.skip(',')
+    elif first == '{':
+        yield from _iter_host(stream)
+    elif first:
+        raise ValueError(f"Not a Nikto JSON report (starts with {first!r})")
+
+def normalize_item(host: Dict[str, Any], item: Dict[str, Any]) -> Dict[str, Any]:
+    """Finding for one report item; Nikto 2.x calls the description 'msg'"""
+    return {
+        'type': item.get('type', 'Web Vulnerability'),
+        'description': item.get('msg') or item.get('description', ''),
+        'severity': item.get('severity', 'medium'),
+        'url': item.get('url', ''),
+        'method': item.get('method', ''),
+        'id': item.get('id', ''),
+        'references': item.get('references') or item.get('OSVDB', ''),
+        'host': host.get('host', ''),
+        'port': str(host.get('port', ''))
+    }
+
+def parse_nikto_report(f, chunk_size: int = READ_CHUNK) -> Dict[str, Any]:
+    """Normalized findings and scanned hosts of a Nikto JSON report
+
+    A truncated or corrupt report keeps the findings read before the damage
+    and records an error.
+    """
+    vulnerabilities = []
+    hosts = []
+    error = None
+    try:
+        for host, item in iter_nikto_items(f, chunk_size):
+            if item is None:
+                hosts.append(host)
+            else:
+                vulnerabilities.append(normalize_item(host, item))
+    except (ValueError, RecursionError) as e:
+        error = f"Malformed Nikto report after {len(vulnerabilities)} findings: {e}"
+        logger.warning(error)
+
+    result = {
+        'vulnerabilities': vulnerabilities,
+        'total_found': len(vulnerabilities),
+        'hosts': [dict(host) for host in hosts]
+    }
+    if error:
+        result['error'] = error
+    return result
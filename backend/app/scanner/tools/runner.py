@@ -0,0 +1,332 @@
+import os
+import re
+import uuid
+import shutil
+import signal
+import logging
+import resource
+import threading
+import subprocess
+import time
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK = 65536
+POLL_INTERVAL = 0.2  # Seconds between memory samples and exit checks
+MB = 1024 * 1024
+
+# Signals the kernel uses when an rlimit is hit
+LIMIT_SIGNALS = {
+    signal.SIGXCPU: 'cpu',
+    signal.SIGXFSZ: 'file_size',
+}
+
+# How tools report a failed allocation under RLIMIT_AS (ENOMEM from mmap/brk)
+ENOMEM_PATTERN = re.compile(
+    r'MemoryError|Cannot allocate memory|out of memory|std::bad_alloc|memory exhausted|'
+    r'failed to allocate|OutOfMemoryError', re.IGNORECASE)
+
+class ToolRun:
+    """Outcome of a sandboxed tool process"""
+
+    def __init__(self, command: List[str]):
+        self.command = command
+        self.stdout = ''
+        self.stderr = ''
+        self.returncode = None
+        self.timed_out = False
+        self.peak_rss_kb = 0
+        self.cpu_seconds = 0.0
+        self.output_bytes = 0
+        self.kept_bytes = 0
+        self.wall_seconds = 0.0
+        self.spawn_seconds = 0.0
+        self.exceeded = []
+        self._lock = threading.Lock()  # The stdout and stderr readers share kept_bytes and exceeded
+
+    @property
+    def resources(self) -> Dict[str, Any]:
+        """Accounting recorded alongside the tool's raw output"""
+        return {
+            'peak_rss_kb': self.peak_rss_kb,
+            'cpu_seconds': round(self.cpu_seconds, 3),
+            'output_bytes': self.output_bytes,
+            'wall_seconds': round(self.wall_seconds, 3),
+            'spawn_seconds': round(self.spawn_seconds, 4),
+            'exceeded': list(self.exceeded)
+        }
+
+    def flag(self, reason: str) -> bool:
+        """Record an exceeded budget; False if it was already recorded"""
+        with self._lock:
+            if reason in self.exceeded:
+                return False
+            self.exceeded.append(reason)
+            return True
+
+def merge_resources(usages: List[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Combine accounting of several runs of one tool (e.g. SQLMap per endpoint)"""
+    usages = [usage for usage in usages if usage]
+    exceeded = []
+    for usage in usages:
+        exceeded.extend(reason for reason in usage['exceeded'] if reason not in exceeded)
+    return {
+        'peak_rss_kb': max((usage['peak_rss_kb'] for usage in usages), default=0),
+        'cpu_seconds': round(sum(usage['cpu_seconds'] for usage in usages), 3),
+        'output_bytes': sum(usage['output_bytes'] for usage in usages),
+        'wall_seconds': round(sum(usage['wall_seconds'] for usage in usages), 3),
+        'spawn_seconds': round(sum(usage.get('spawn_seconds', 0) for usage in usages), 4),
+        'exceeded': exceeded
+    }
+
+class ToolSandbox:
+    """Run external tools under rlimits and, optionally, a cgroup v2 group
+
+    Limits are set by launching the tool through prlimit(1), so they are in
+    place before the tool is exec'd, instead of in a preexec_fn, which is unsafe
+    when tools are launched from threads. Without prlimit(1) they are applied
+    with prlimit(2) right after the process starts. Each tool runs in its own
+    session so the whole process group can be killed.
+    """
+
+    def __init__(self, cpu_seconds=None, memory_mb=None, open_files=None, file_size_mb=None,
+                 max_output_bytes=None, cgroup_parent=None, cgroup_cpu=None, cgroup_pids=None):
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.open_files = open_files
+        self.file_size_mb = file_size_mb
+        self.max_output_bytes = max_output_bytes
+        self.cgroup_parent = cgroup_parent
+        self.cgroup_cpu = cgroup_cpu
+        self.cgroup_pids = cgroup_pids
+
+    @classmethod
+    def from_config(cls, config) -> 'ToolSandbox':
+        return cls(
+            cpu_seconds=config.get('TOOL_CPU_SECONDS'),
+            memory_mb=config.get('TOOL_MEMORY_MB'),
+            open_files=config.get('TOOL_OPEN_FILES'),
+            file_size_mb=config.get('TOOL_FILE_SIZE_MB'),
+            max_output_bytes=config.get('TOOL_MAX_OUTPUT_BYTES'),
+            cgroup_parent=config.get('TOOL_CGROUP_PARENT'),
+            cgroup_cpu=config.get('TOOL_CGROUP_CPU'),
+            cgroup_pids=config.get('TOOL_CGROUP_PIDS')
+        )
+
+    def run(self, command: List[str], timeout: float, stdout_tail: Optional[int] = None) -> ToolRun:
+        """Run command to completion, enforcing limits and recording usage
+
+        With stdout_tail, only the last stdout_tail bytes of stdout are kept, for
+        tools whose results are read from files. Raises FileNotFoundError when
+        the tool is not installed, like subprocess.run.
+        """
+        run = ToolRun(command)
+        started = time.perf_counter()
+
+        limits = self._rlimits()
+        wrapper = shutil.which('prlimit') if limits else None
+        if wrapper:
+            # prlimit execs the tool, so report a missing tool the way Popen would
+            executable = shutil.which(command[0])
+            if not executable:
+                raise FileNotFoundError(2, 'No such file or directory', command[0])
+            argv = [wrapper, *self._prlimit_options(limits), '--', executable, *command[1:]]
+        else:
+            argv = command
+
+        process = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   stdin=subprocess.DEVNULL, start_new_session=True)
+        cgroup = self._join_cgroup(process.pid)
+        if limits and not wrapper:
+            self._apply_rlimits(process.pid, limits)
+        run.spawn_seconds = time.perf_counter() - started
+
+        chunks = {'stdout': [], 'stderr': []}
+        read_bytes = {'stdout': 0, 'stderr': 0}  # Each reader only writes its own stream's count
+        readers = [
+            threading.Thread(target=self._read, args=(process, stream, name, chunks[name], read_bytes, run, tail),
+                             daemon=True)
+            for name, stream, tail in (('stdout', process.stdout, stdout_tail), ('stderr', process.stderr, None))
+        ]
+        for reader in readers:
+            reader.start()
+
+        deadline = started + timeout
+        while True:
+            # Sample the tool's own high-water RSS; rusage from wait4 also counts
+            # memory inherited from this worker at fork/exec
+            run.peak_rss_kb = max(run.peak_rss_kb, self._vm_hwm_kb(process.pid))
+            # Wait without reaping so the process group ID can't be reused before we kill it
+            if os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT | os.WNOHANG) is not None:
+                break
+            if time.perf_counter() >= deadline:
+                run.timed_out = True
+                run.flag('timeout')
+                self._kill_group(process)
+            time.sleep(POLL_INTERVAL)
+
+        # Kill anything the tool left behind so its pipes close, then reap it with its usage
+        self._kill_group(process)
+        _, status, usage = os.wait4(process.pid, 0)
+        for reader in readers:
+            reader.join()
+        run.output_bytes = sum(read_bytes.values())
+
+        process.returncode = os.waitstatus_to_exitcode(status)
+        run.returncode = process.returncode
+        run.wall_seconds = time.perf_counter() - started
+        run.cpu_seconds = usage.ru_utime + usage.ru_stime
+        stdout = b''.join(chunks['stdout'])
+        if stdout_tail is not None:
+            stdout = stdout[-stdout_tail:] if stdout_tail else b''
+        run.stdout = stdout.decode('utf-8', errors='replace')
+        run.stderr = b''.join(chunks['stderr']).decode('utf-8', errors='replace')
+
+        self._check_budget(run)
+        if cgroup:
+            self._collect_cgroup(cgroup, run)
+
+        if run.exceeded:
+            logger.warning(f"{command[0]} exceeded its budget ({', '.join(run.exceeded)}): {run.resources}")
+
+        return run
+
+    def _rlimits(self) -> List[tuple]:
+        """(resource, (soft, hard)) pairs for the configured limits"""
+        limits = []
+        if self.cpu_seconds:
+            # Soft limit sends SIGXCPU, the hard limit a few seconds later SIGKILL
+            limits.append((resource.RLIMIT_CPU, (self.cpu_seconds, self.cpu_seconds + 5)))
+        if self.memory_mb:
+            limits.append((resource.RLIMIT_AS, (self.memory_mb * MB, self.memory_mb * MB)))
+        if self.open_files:
+            limits.append((resource.RLIMIT_NOFILE, (self.open_files, self.open_files)))
+        if self.file_size_mb:
+            limits.append((resource.RLIMIT_FSIZE, (self.file_size_mb * MB, self.file_size_mb * MB)))
+        return limits
+
+    @staticmethod
+    def _prlimit_options(limits: List[tuple]) -> List[str]:
+        names = {
+            resource.RLIMIT_CPU: 'cpu',
+            resource.RLIMIT_AS: 'as',
+            resource.RLIMIT_NOFILE: 'nofile',
+            resource.RLIMIT_FSIZE: 'fsize',
+        }
+        return [f'--{names[limit]}={soft}:{hard}' for limit, (soft, hard) in limits]
+
+    @staticmethod
+    def _apply_rlimits(pid: int, limits: List[tuple]) -> None:
+        for limit, value in limits:
+            try:
+                resource.prlimit(pid, limit, value)
+            except (ProcessLookupError, ValueError, PermissionError) as e:
+                logger.debug(f"Could not apply rlimit {limit} to {pid}: {e}")
+
+    def _read(self, process, stream, name: str, chunks: List[bytes], read_bytes: Dict[str, int], run: ToolRun,
+              tail: Optional[int] = None) -> None:
+        """Drain a pipe, keeping at most max_output_bytes across both streams
+
+        A tailed stream keeps only its last tail bytes, so it never counts
+        against the output budget.
+        """
+        kept = 0
+        for chunk in iter(lambda: stream.read1(READ_CHUNK), b''):
+            read_bytes[name] += len(chunk)
+            if tail is not None:
+                chunks.append(chunk)
+                kept += len(chunk)
+                while chunks and kept - len(chunks[0]) >= tail:
+                    kept -= len(chunks.pop(0))
+                continue
+            with run._lock:
+                run.kept_bytes += len(chunk)
+                over_budget = self.max_output_bytes and run.kept_bytes > self.max_output_bytes
+            if over_budget:
+                if run.flag('output'):
+                    self._kill_group(process)
+                continue
+            chunks.append(chunk)
+        stream.close()
+
+    @staticmethod
+    def _vm_hwm_kb(pid: int) -> int:
+        try:
+            with open(f'/proc/{pid}/status') as f:
+                for line in f:
+                    if line.startswith('VmHWM:'):
+                        return int(line.split()[1])
+        except (OSError, ValueError):
+            pass
+        return 0
+
+    @staticmethod
+    def _kill_group(process) -> None:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _check_budget(self, run: ToolRun) -> None:
+        if run.returncode is not None and run.returncode < 0:
+            reason = LIMIT_SIGNALS.get(-run.returncode)
+            if reason:
+                run.flag(reason)
+            elif (-run.returncode == signal.SIGKILL and self.cpu_seconds
+                  and run.cpu_seconds >= self.cpu_seconds):
+                run.flag('cpu')
+        if self.memory_mb and run.peak_rss_kb * 1024 >= self.memory_mb * MB * 0.95:
+            run.flag('memory')
+        # Hitting RLIMIT_AS fails the allocation rather than killing the tool,
+        # so it usually exits with an error well below the limit in RSS
+        if self.memory_mb and run.returncode and ENOMEM_PATTERN.search(run.stderr[-4096:]):
+            run.flag('memory')
+
+    def _join_cgroup(self, pid: int) -> Optional[str]:
+        """Create a per-run cgroup v2 group under cgroup_parent and move the tool into it"""
+        if not self.cgroup_parent:
+            return None
+
+        path = os.path.join(self.cgroup_parent, f'tool-{uuid.uuid4().hex[:12]}')
+        try:
+            os.mkdir(path)
+            settings = {
+                'memory.max': self.memory_mb * MB if self.memory_mb else None,
+                'memory.swap.max': 0 if self.memory_mb else None,
+                'cpu.max': f'{int(self.cgroup_cpu * 100000)} 100000' if self.cgroup_cpu else None,
+                'pids.max': self.cgroup_pids
+            }
+            for name, value in settings.items():
+                if value is not None and os.path.exists(os.path.join(path, name)):
+                    with open(os.path.join(path, name), 'w') as f:
+                        f.write(str(value))
+            with open(os.path.join(path, 'cgroup.procs'), 'w') as f:
+                f.write(str(pid))
+            return path
+        except OSError as e:
+            logger.warning(f"cgroup limits unavailable under {self.cgroup_parent}: {e}")
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
+            return None
+
+    def _collect_cgroup(self, path: str, run: ToolRun) -> None:
+        """Read peak memory and OOM kills from the group, then remove it"""
+        try:
+            peak_file = os.path.join(path, 'memory.peak')
+            if os.path.exists(peak_file):
+                with open(peak_file) as f:
+                    run.peak_rss_kb = max(run.peak_rss_kb, int(f.read().strip()) // 1024)
+            with open(os.path.join(path, 'memory.events')) as f:
+                events = dict(line.split() for line in f if line.strip())
+            if int(events.get('oom_kill', 0)):
+                run.flag('memory')
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read cgroup accounting from {path}: {e}")
+        finally:
+            try:
+                os.rmdir(path)
+            except OSError as e:
+                logger.warning(f"Could not remove cgroup {path}: {e}")
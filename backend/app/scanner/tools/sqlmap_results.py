@@ -0,0 +1,143 @@
+import os
+import logging
+from typing import Dict, Any, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# sqlmap prints (and writes to <output-dir>/<host>/log) its injection points as
+#   sqlmap identified the following injection point(s) with a total of 46 HTTP(s) requests:
+#   ---
+#   Parameter: id (GET)
+#       Type: boolean-based blind
+#       Title: AND boolean-based blind - WHERE or HAVING clause
+#       Payload: id=1 AND 5723=5723
+#   ---
+BLOCK_HEADER = 'identified the following injection point'
+BLOCK_SEPARATOR = '---'
+TECHNIQUE_FIELDS = {'Title:': 'title', 'Payload:': 'payload', 'Vector:': 'vector'}
+
+def _split_parameter(value: str):
+    """'id (GET)' -> ('id', 'GET'); names may contain spaces, e.g. 'JSON id ((custom) POST)'"""
+    if value.endswith(')') and ' (' in value:
+        index = value.index(' (')
+        return value[:index], value[index + 2:-1]
+    return value, ''
+
+def parse_injection_points(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """Yield one point per parameter and technique from sqlmap's injection point blocks
+
+    Works line by line, so a log or console output of any size is read in constant memory.
+    """
+    header_seen = False
+    in_block = False
+    parameter = place = None
+    technique = None
+
+    for line in lines:
+        text = line.strip()
+        if not in_block:
+            if BLOCK_HEADER in text:
+                header_seen = True
+            elif header_seen and text == BLOCK_SEPARATOR:
+                in_block = True
+                header_seen = False
+            continue
+
+        if text == BLOCK_SEPARATOR or text.startswith('Parameter:') or text.startswith('Type:'):
+            if technique and parameter is not None:
+                yield dict(technique, parameter=parameter, place=place)
+            technique = None
+
+        if text == BLOCK_SEPARATOR:
+            in_block = False
+            parameter = place = None
+        elif text.startswith('Parameter:'):
+            parameter, place = _split_parameter(text[len('Parameter:'):].strip())
+        elif text.startswith('Type:'):
+            technique = {'technique': text[len('Type:'):].strip(), 'title': '', 'payload': ''}
+        elif technique is not None:
+            for prefix, field in TECHNIQUE_FIELDS.items():
+                if text.startswith(prefix):
+                    technique[field] = text[len(prefix):].strip()
+                    break
+
+    # A truncated log still reports the points completed so far
+    if in_block and technique and parameter is not None:
+        yield dict(technique, parameter=parameter, place=place)
+
+def read_target(host_dir: str) -> Optional[str]:
+    """URL from target.txt ('<url> (<method>)  # <command line>')"""
+    try:
+        with open(os.path.join(host_dir, 'target.txt'), encoding='utf-8', errors='replace') as f:
+            first_line = f.readline().strip()
+    except OSError:
+        return None
+    url = first_line.split(' ', 1)[0]
+    return url or None
+
+class SqlmapIngester:
+    """Collect deduplicated SQL injection findings from sqlmap output
+
+    A finding is one injection point: URL, place, parameter, technique and
+    payload. sqlmap's session.sqlite is not read; it holds pickled values and
+    the log carries the same injection data as text.
+    """
+
+    def __init__(self):
+        self.vulnerabilities = []
+        self._seen = set()
+
+    def ingest_dir(self, output_dir: str, url: str = '') -> int:
+        """Read every <host>/log under an --output-dir; returns the number of new findings"""
+        added = 0
+        try:
+            host_dirs = [entry.path for entry in os.scandir(output_dir) if entry.is_dir()]
+        except OSError:
+            return 0
+
+        for host_dir in sorted(host_dirs):
+            log_path = os.path.join(host_dir, 'log')
+            if not os.path.exists(log_path):
+                continue
+            target_url = read_target(host_dir) or url
+            try:
+                with open(log_path, encoding='utf-8', errors='replace') as f:
+                    added += self.ingest_lines(f, target_url)
+            except OSError as e:
+                logger.warning(f"Could not read sqlmap log {log_path}: {e}")
+        return added
+
+    def ingest_lines(self, lines: Iterable[str], url: str = '') -> int:
+        """Add the injection points found in lines of a log or console output"""
+        added = 0
+        for point in parse_injection_points(lines):
+            key = (url, point['place'], point['parameter'], point['technique'], point['payload'])
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            self.vulnerabilities.append(self._finding(point, url))
+            added += 1
+        return added
+
+    @staticmethod
+    def _finding(point: Dict[str, str], url: str) -> Dict[str, Any]:
+        place = f"{point['place']} " if point['place'] else ''
+        # The payload holds random values, so it stays out of the description
+        # that identifies the finding across scans
+        return {
+            'type': 'SQL Injection',
+            'severity': 'high',
+            'description': f"{place}parameter '{point['parameter']}' is injectable: {point['title'] or point['technique']}",
+            'url': url,
+            'parameter': point['parameter'],
+            'place': point['place'],
+            'technique': point['technique'],
+            'title': point['title'],
+            'payload': point['payload']
+        }
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            'vulnerabilities': self.vulnerabilities,
+            'total_found': len(self.vulnerabilities)
+        }
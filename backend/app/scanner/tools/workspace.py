@@ -0,0 +1,126 @@
+import os
+import re
+import shutil
+import atexit
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PREFIX = 'scanner-ws-'
+_OWNER_PATTERN = re.compile(rf'^{PREFIX}(\d+)-')
+
+def default_root() -> str:
+    """tmpfs when available, so tool output never touches the disk"""
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+class WorkspacePool:
+    """Per-process pool of scratch directories for tools that write files
+
+    Directories are emptied when released and reused by the next tool run, so
+    a busy worker does not create and delete a directory tree per run. The
+    process's base directory is removed at exit, and base directories left by
+    processes that no longer exist are swept when a pool starts.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_idle: int = 8):
+        self.root = root or default_root()
+        self.max_idle = max_idle
+        self._idle: List[str] = []
+        self._lock = threading.Lock()
+        self._base = None
+        self._pid = None
+
+    @contextmanager
+    def acquire(self) -> Iterator[str]:
+        """An empty directory for the duration of the block"""
+        path = self._checkout()
+        try:
+            yield path
+        finally:
+            self._release(path)
+
+    def _checkout(self) -> str:
+        with self._lock:
+            if self._pid != os.getpid():
+                self._start()
+            if self._idle:
+                return self._idle.pop()
+        return tempfile.mkdtemp(dir=self._base)
+
+    def _release(self, path: str) -> None:
+        if not self._empty(path):
+            shutil.rmtree(path, ignore_errors=True)
+            return
+        with self._lock:
+            # A directory from before a fork belongs to the parent's base
+            if os.path.dirname(path) == self._base and len(self._idle) < self.max_idle:
+                self._idle.append(path)
+                return
+        shutil.rmtree(path, ignore_errors=True)
+
+    def _start(self) -> None:
+        """Create this process's base directory (again after a fork)"""
+        self._sweep_stale()
+        self._pid = os.getpid()
+        self._idle = []
+        self._base = tempfile.mkdtemp(prefix=f'{PREFIX}{self._pid}-', dir=self.root)
+        atexit.register(_remove_base, self._base, self._pid)
+
+    def _sweep_stale(self) -> None:
+        try:
+            entries = os.listdir(self.root)
+        except OSError:
+            return
+        for name in entries:
+            match = _OWNER_PATTERN.match(name)
+            if match and not _process_exists(int(match.group(1))):
+                shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+
+    @staticmethod
+    def _empty(path: str) -> bool:
+        """Remove everything inside path; False if the directory can't be reused"""
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            return False
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+            except OSError as e:
+                logger.warning(f"Could not clean workspace entry {entry.path}: {e}")
+                return False
+        return True
+
+def _remove_base(base: str, pid: int) -> None:
+    # Forked children inherit the handler but not ownership of the directory
+    if os.getpid() == pid:
+        shutil.rmtree(base, ignore_errors=True)
+
+def _process_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_workspace_pool(root: Optional[str] = None) -> WorkspacePool:
+    """Shared pool for a root directory (the default tmpfs root when None)"""
+    root = root or default_root()
+    with _pools_lock:
+        if root not in _pools:
+            _pools[root] = WorkspacePool(root)
+        return _pools[root]
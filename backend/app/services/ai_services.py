@@ -1,7 +1,6 @@
 import json
 import logging
 from typing import Dict, Any
-import openai
 from flask import current_app
 
 logger = logging.getLogger(__name__)
@@ -10,7 +9,7 @@ class AIService:
     """Service for AI analysis of scan results"""
     
     def __init__(self):
-        openai.api_key = current_app.config.get('OPENAI_API_KEY')
+        self.api_key = current_app.config.get('OPENAI_API_KEY')
     
     def analyze_scan_result(self, raw_data: Dict[str, Any], tool_name: str) -> Dict[str, Any]:
         """Analyze scan result using AI"""
@@ -18,10 +17,13 @@ class AIService:
         try:
             prompt = self._create_analysis_prompt(raw_data, tool_name)
             
-            if not openai.api_key:
+            if not self.api_key:
                 # Fallback analysis without AI
                 return self._fallback_analysis(raw_data, tool_name)
             
+            import openai  # Heavy; only loaded when AI analysis is actually configured
+            openai.api_key = self.api_key
+            
             response = openai.ChatCompletion.create(
                 model="gpt-3.5-turbo",
                 messages=[
@@ -117,6 +119,14 @@ class AIService:
                 description = 'Web application vulnerabilities detected'
                 solution = 'Update software and configure security headers'
         
+        elif tool_name == 'http_checks':
+            if raw_data.get('total_found', 0) > 0:
+                has_vulns = True
+                severity = 'low'
+                vuln_type = 'HTTP Misconfiguration'
+                description = f"{raw_data['total_found']} HTTP configuration issues detected"
+                solution = 'Add missing security headers and remove exposed files and banners'
+        
         return {
             'has_vulnerabilities': has_vulns,
             'vulnerability': vuln_type,
@@ -0,0 +1,52 @@
+import logging
+from typing import Dict, Any, Optional
+
+from ..models.scan import Scan
+from ..models.scan_diff import ScanDiff
+from ..models.scan_result import ScanResult
+from ..scanner.diff import diff_findings
+from ..scanner.findings import normalize_results
+from ..extensions import db
+
+logger = logging.getLogger(__name__)
+
+class DiffService:
+    """Service to compare the findings of two scans of the same target"""
+
+    def compute_diff(self, scan: Scan, base_scan: Optional[Scan]) -> Dict[str, Any]:
+        """Diff the findings of a scan against a base scan"""
+        current = normalize_results(ScanResult.query.filter_by(scan_id=scan.id).all())
+        previous = {}
+        if base_scan is not None:
+            previous = normalize_results(ScanResult.query.filter_by(scan_id=base_scan.id).all())
+
+        diff = diff_findings(previous, current)
+        diff['scan_id'] = scan.id
+        diff['base_scan_id'] = base_scan.id if base_scan else None
+        return diff
+
+    def store_diff(self, scan: Scan) -> ScanDiff:
+        """Precompute and persist the diff against the previous scan"""
+        base_scan = scan.get_previous_scan()
+        diff = self.compute_diff(scan, base_scan)
+
+        ScanDiff.query.filter_by(scan_id=scan.id).delete()
+        scan_diff = ScanDiff(scan.id, diff['base_scan_id'], diff)
+        db.session.add(scan_diff)
+        db.session.commit()
+
+        logger.info(f"Stored diff for scan {scan.id} against {diff['base_scan_id']}: {diff['summary']}")
+        return scan_diff
+
+    def get_diff(self, scan: Scan, base_scan: Optional[Scan] = None) -> Dict[str, Any]:
+        """Get a diff, served from the precomputed row when possible"""
+        stored = ScanDiff.query.filter_by(scan_id=scan.id).first()
+
+        if base_scan is None:
+            if stored:
+                return stored.to_dict()
+            base_scan = scan.get_previous_scan()
+        elif stored and stored.base_scan_id == base_scan.id:
+            return stored.to_dict()
+
+        return self.compute_diff(scan, base_scan)
@@ -0,0 +1,93 @@
+import logging
+import os
+from datetime import datetime
+from typing import List, Tuple
+
+from flask import current_app
+
+from ..models.report import Report
+from ..reports.renderer import report_cache_key, report_content_hash, render_report, file_sha256
+from ..extensions import db
+from ..utils.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+class ReportService:
+    """Service to cache and render scan reports"""
+
+    def get_or_create(self, user_id: int, scan_ids: List[int], template: str, fmt: str) -> Tuple[Report, bool]:
+        """Reuse a report rendered from identical results, or create a pending one"""
+        scan_ids = sorted(set(scan_ids))
+        cache_key = report_cache_key(scan_ids, template, fmt)
+        content_hash = report_content_hash(scan_ids)
+
+        existing = Report.query.filter(
+            Report.user_id == user_id,
+            Report.cache_key == cache_key,
+            Report.content_hash == content_hash,
+            Report.status.in_(['pending', 'rendering', 'ready'])
+        ).order_by(Report.created_at.desc()).first()
+
+        if existing and (existing.status != 'ready' or existing.is_available()):
+            record_cache('report', True)
+            return existing, False
+
+        record_cache('report', False)
+
+        report = self._new_report(user_id, scan_ids, template, fmt, cache_key, content_hash)
+        db.session.add(report)
+        db.session.commit()
+        return report, True
+
+    def render(self, report: Report) -> Report:
+        """Render a report to disk and mark it ready"""
+        report.status = 'rendering'
+        db.session.commit()
+
+        reports_dir = current_app.config['REPORTS_DIR']
+        rendered_path = os.path.join(reports_dir, f'{report.cache_key}-report-{report.id}.{report.format}')
+
+        try:
+            render_report(report.scan_ids, report.template, report.format, rendered_path)
+            # Files are named by their own hash: a re-render with different bytes
+            # (PDFs embed timestamps) never reuses the path or ETag of another file
+            file_hash = file_sha256(rendered_path)
+            output_path = os.path.join(reports_dir, f'{report.cache_key}-{file_hash[:16]}.{report.format}')
+            os.replace(rendered_path, output_path)
+            report.file_path = output_path
+            report.file_hash = file_hash
+            report.file_size = os.path.getsize(output_path)
+            report.status = 'ready'
+        except Exception as e:
+            logger.error(f"Rendering report {report.id} failed: {str(e)}")
+            report.status = 'failed'
+            report.error_message = str(e)
+            if os.path.exists(rendered_path):
+                os.unlink(rendered_path)
+
+        report.completed_at = datetime.utcnow()
+        db.session.commit()
+        return report
+
+    def delete(self, report: Report) -> None:
+        """Delete a report and its rendered file"""
+        file_path = report.file_path
+        db.session.delete(report)
+        db.session.commit()
+
+        if file_path and not Report.query.filter_by(file_path=file_path).first():
+            try:
+                os.unlink(file_path)
+            except OSError:
+                pass
+
+    def _new_report(self, user_id, scan_ids, template, fmt, cache_key, content_hash) -> Report:
+        return Report(
+            user_id=user_id,
+            scan_ids=scan_ids,
+            template=template,
+            format=fmt,
+            status='pending',
+            cache_key=cache_key,
+            content_hash=content_hash
+        )
@@ -1,25 +1,42 @@
-import subprocess
-import json
 import os
 import logging
-import tempfile
-from datetime import datetime
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
+from flask import current_app, has_app_context
+
 from ..models.scan_result import ScanResult
-from ..extensions import db
+from ..scanner.tools.crawler import Crawler, parameter_signature, signature_key
+from ..scanner.tools.http_checks import CheckEngine
+from ..scanner.tools.runner import ToolSandbox, merge_resources
+from ..scanner.tools.sqlmap_results import SqlmapIngester
+from ..scanner.tools.nikto_results import parse_nikto_report
+from ..scanner.tools.workspace import get_workspace_pool
+from ..utils.tracing import NULL_TRACE
+from ..utils.metrics import TOOL_DURATION
+from ..scanner.fingerprint import build_fingerprint, compare_fingerprints, probe_http, web_port_urls
 
 logger = logging.getLogger(__name__)
 
 class ScannerService:
     """Service to handle vulnerability scanning with multiple tools"""
     
-    def __init__(self):
+    def __init__(self, progress_callback=None, trace=None, result_callback=None):
+        self.config = current_app.config if has_app_context() else {}
+        # ScanResults of finished tools; result_callback lets the caller persist each one as it arrives
+        self.tool_results = []
+        self.result_callback = result_callback
+        self.progress_callback = progress_callback
+        self.sandbox = ToolSandbox.from_config(self.config)
+        self.workspace = get_workspace_pool(self.config.get('TOOL_WORKSPACE_DIR'))
+        self.trace = trace or NULL_TRACE
         self.tools = {
             'sqlmap': self._run_sqlmap,
             'nmap': self._run_nmap,
-            'nikto': self._run_nikto
+            'nikto': self._run_nikto,
+            'http_checks': self._run_http_checks
         }
     
     def run_all_scans(self, scan_id: int, target_url: str) -> Dict[str, Any]:
@@ -29,86 +46,313 @@ class ScannerService:
         logger.info(f"Starting comprehensive scan for {target_url} (scan_id: {scan_id})")
         
         for tool_name, tool_func in self.tools.items():
-            try:
-                logger.info(f"Running {tool_name} scan...")
-                start_time = datetime.utcnow()
-                
-                result = tool_func(target_url)
-                
-                end_time = datetime.utcnow()
-                processing_time = (end_time - start_time).total_seconds()
-                
-                # Store result in database
-                scan_result = ScanResult(
-                    scan_id=scan_id,
-                    tool_name=tool_name,
-                    raw_data=result,
-                    processing_time=processing_time
-                )
-                
-                db.session.add(scan_result)
-                db.session.commit()
-                
-                results[tool_name] = {
-                    'success': True,
-                    'result_id': scan_result.id,
-                    'processing_time': processing_time,
-                    'vulnerabilities_found': self._count_vulnerabilities(tool_name, result)
-                }
-                
-                logger.info(f"{tool_name} scan completed in {processing_time:.2f}s")
-                
-            except Exception as e:
-                logger.error(f"Error running {tool_name}: {str(e)}")
-                results[tool_name] = {
-                    'success': False,
-                    'error': str(e),
-                    'processing_time': 0
-                }
+            self._run_tool(scan_id, tool_name, lambda: tool_func(target_url), results)
+        
+        # Record the fingerprint so a later incremental scan can compare against it
+        nmap_result = results.get('nmap', {}).get('raw_data')
+        if nmap_result is not None:
+            sqlmap_result = results.get('sqlmap', {}).get('raw_data') or {}
+            endpoints = [endpoint['signature'] for endpoint in sqlmap_result.get('endpoints', [])] or None
+            self._run_tool(scan_id, 'fingerprint',
+                           lambda: build_fingerprint(nmap_result, probe_http(target_url), endpoints), results)
+        
+        return self._strip_raw_data(results)
+    
+    def run_incremental_scans(self, scan_id: int, target_url: str, previous_scan) -> Dict[str, Any]:
+        """Re-test only the surface that changed since the previous scan of the target"""
+        previous_results = {}
+        if previous_scan is not None:
+            for result in ScanResult.query.filter_by(scan_id=previous_scan.id).all():
+                previous_results[result.tool_name] = result
+        
+        if 'fingerprint' not in previous_results:
+            logger.info(f"No previous fingerprint for {target_url}, running a full scan")
+            return self.run_all_scans(scan_id, target_url)
+        
+        logger.info(f"Starting incremental scan for {target_url} (scan_id: {scan_id}, "
+                    f"previous: {previous_scan.id})")
+        results = {}
+        
+        # Cheap fingerprint stage: port scan plus a single HTTP probe
+        self._run_tool(scan_id, 'nmap', lambda: self._run_nmap(target_url), results)
+        nmap_result = results['nmap'].get('raw_data')
+        if nmap_result is None:
+            logger.info(f"Fingerprint stage failed for {target_url}, running remaining tools in full")
+            for tool_name in ('sqlmap', 'nikto', 'http_checks'):
+                self._run_tool(scan_id, tool_name, lambda: self.tools[tool_name](target_url), results)
+            return self._strip_raw_data(results)
+        
+        # The crawl is part of the fingerprint, so SQLMap only has to test new endpoints
+        endpoints = self._crawl(target_url)
+        fingerprint = build_fingerprint(nmap_result, probe_http(target_url),
+                                        [signature_key(endpoint) for endpoint in endpoints])
+        self._run_tool(scan_id, 'fingerprint', lambda: fingerprint, results)
+        changes = compare_fingerprints(previous_results['fingerprint'].raw_data, fingerprint)
+        logger.info(f"Surface changes since scan {previous_scan.id}: {changes}")
+        
+        # In-process HTTP checks take seconds, so they always run
+        self._run_tool(scan_id, 'http_checks', lambda: self._run_http_checks(target_url), results)
+        
+        # SQLMap runs on endpoints whose signature is new; results for the rest are carried forward
+        previous_sqlmap = previous_results.get('sqlmap')
+        if previous_sqlmap is None or changes['new_endpoints'] is None:
+            self._run_tool(scan_id, 'sqlmap', lambda: self._run_sqlmap(target_url, endpoints), results)
+        elif changes['new_endpoints'] or changes['removed_endpoints']:
+            self._run_tool(scan_id, 'sqlmap',
+                           lambda: self._run_sqlmap(target_url, endpoints, previous_sqlmap), results)
+        else:
+            self._carry_forward(scan_id, previous_sqlmap, results)
+        
+        # Nikto reruns in full when the target page changed, otherwise only new web ports are tested
+        if changes['http_changed'] or 'nikto' not in previous_results:
+            self._run_tool(scan_id, 'nikto', lambda: self._run_nikto(target_url), results)
+        elif changes['new_web_ports']:
+            urls = web_port_urls(target_url, changes['new_web_ports'])
+            self._run_tool(scan_id, 'nikto',
+                           lambda: self._merge_nikto(previous_results['nikto'], urls), results)
+        else:
+            self._carry_forward(scan_id, previous_results['nikto'], results)
+        
+        return self._strip_raw_data(results)
+    
+    def _run_tool(self, scan_id: int, tool_name: str, tool_call, results: Dict[str, Any]) -> None:
+        """Run a single tool, store its ScanResult and record the outcome in results"""
+        start_time = time.perf_counter()
+        try:
+            logger.info(f"Running {tool_name} scan...")
+            
+            with self.trace.span('tool', tool=tool_name):
+                result = tool_call()
+            
+            processing_time = time.perf_counter() - start_time
+            self._record_tool_spans(tool_name, result)
+            TOOL_DURATION.labels(tool=tool_name, outcome='success').observe(processing_time)
+            
+            scan_result = ScanResult(
+                scan_id=scan_id,
+                tool_name=tool_name,
+                raw_data=result,
+                processing_time=processing_time
+            )
+            scan_result.set_resource_usage(result.get('resources') if isinstance(result, dict) else None)
+            self._store_result(scan_result)
+            
+            results[tool_name] = {
+                'success': True,
+                'processing_time': processing_time,
+                'vulnerabilities_found': self._count_vulnerabilities(tool_name, result),
+                'raw_data': result
+            }
+            
+            logger.info(f"{tool_name} scan completed in {processing_time:.2f}s")
+            
+        except Exception as e:
+            logger.error(f"Error running {tool_name}: {str(e)}")
+            TOOL_DURATION.labels(tool=tool_name, outcome='error').observe(time.perf_counter() - start_time)
+            results[tool_name] = {
+                'success': False,
+                'error': str(e),
+                'processing_time': 0
+            }
         
+        self._report_progress(results)
+    
+    def _carry_forward(self, scan_id: int, previous: ScanResult, results: Dict[str, Any]) -> None:
+        """Copy a previous clean result for a part of the surface that did not change"""
+        raw_data = dict(previous.raw_data)
+        raw_data['carried_forward_from'] = previous.raw_data.get('carried_forward_from', previous.scan_id)
+        raw_data.pop('resources', None)  # Nothing ran for this result
+        
+        self._store_result(ScanResult(
+            scan_id=scan_id,
+            tool_name=previous.tool_name,
+            raw_data=raw_data,
+            tool_version=previous.tool_version,
+            processing_time=0
+        ))
+        
+        results[previous.tool_name] = {
+            'success': True,
+            'processing_time': 0,
+            'vulnerabilities_found': self._count_vulnerabilities(previous.tool_name, raw_data),
+            'carried_forward': True
+        }
+        logger.info(f"{previous.tool_name} unchanged, carried forward from scan {raw_data['carried_forward_from']}")
+        self._report_progress(results)
+    
+    def _store_result(self, scan_result: ScanResult) -> None:
+        self.tool_results.append(scan_result)
+        if self.result_callback is not None:
+            self.result_callback(scan_result)
+    
+    def _record_tool_spans(self, tool_name: str, result: Any) -> None:
+        """Split a sandboxed tool's time into process spawn and runtime spans"""
+        usage = result.get('resources') if isinstance(result, dict) else None
+        if not usage:
+            return
+        spawn = usage.get('spawn_seconds', 0)
+        self.trace.record('tool_spawn', spawn, tool=tool_name)
+        self.trace.record('tool_runtime', max(usage['wall_seconds'] - spawn, 0), tool=tool_name,
+                          cpu_seconds=usage['cpu_seconds'], peak_rss_kb=usage['peak_rss_kb'])
+    
+    def _report_progress(self, results: Dict[str, Any]) -> None:
+        """Report the fraction of tools finished (every tool plus the fingerprint)"""
+        if self.progress_callback is not None:
+            self.progress_callback(min(len(results) / (len(self.tools) + 1), 1.0))
+    
+    def _merge_nikto(self, previous: ScanResult, urls) -> Dict[str, Any]:
+        """Run Nikto on new web ports only and merge with the previous findings"""
+        vulnerabilities = list((previous.raw_data.get('parsed_results') or {}).get('vulnerabilities', []))
+        runs = []
+        
+        for url in urls:
+            run = self._run_nikto(url)
+            vulnerabilities.extend((run.get('parsed_results') or {}).get('vulnerabilities', []))
+            runs.append({key: run.get(key) for key in ('command', 'return_code', 'stderr', 'error', 'resources')})
+        
+        return {
+            'carried_forward_from': previous.raw_data.get('carried_forward_from', previous.scan_id),
+            'incremental_targets': list(urls),
+            'incremental_runs': runs,
+            'resources': merge_resources([run.get('resources') for run in runs]),
+            'parsed_results': {
+                'vulnerabilities': vulnerabilities,
+                'total_found': len(vulnerabilities)
+            }
+        }
+    
+    def _strip_raw_data(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop raw tool output from the summary returned to the task"""
+        for result in results.values():
+            result.pop('raw_data', None)
         return results
     
-    def _run_sqlmap(self, target_url: str) -> Dict[str, Any]:
-        """Run SQLMap scan"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_dir = os.path.join(temp_dir, 'sqlmap_results')
+    def _crawl(self, target_url: str) -> List[Dict[str, Any]]:
+        """The target plus the parameterized endpoints the crawler finds, one per signature"""
+        crawler = Crawler(
+            max_depth=self.config.get('CRAWLER_MAX_DEPTH', 2),
+            max_pages=self.config.get('CRAWLER_MAX_PAGES', 50),
+            concurrency=self.config.get('CRAWLER_CONCURRENCY', 10)
+        )
+        endpoints = [{'url': target_url, 'method': 'GET', 'data': None}]
+        try:
+            seen = {parameter_signature(endpoints[0])}
+            for endpoint in crawler.crawl(target_url):
+                if parameter_signature(endpoint) not in seen:
+                    seen.add(parameter_signature(endpoint))
+                    endpoints.append(endpoint)
+        except Exception as e:
+            logger.error(f"Crawler failed for {target_url}: {str(e)}")
+        
+        return endpoints[:self.config.get('SQLMAP_MAX_ENDPOINTS', 25)]
+    
+    def _run_sqlmap(self, target_url: str, endpoints: Optional[List[Dict[str, Any]]] = None,
+                    previous: Optional[ScanResult] = None) -> Dict[str, Any]:
+        """Run SQLMap on every parameterized endpoint in parallel
+        
+        Endpoints are crawled from target_url unless given. With a previous
+        SQLMap result, endpoints it already tested are carried forward instead
+        of run again.
+        """
+        if endpoints is None:
+            endpoints = self._crawl(target_url)
+        
+        tested = {}
+        if previous is not None:
+            # Endpoints where SQLMap failed (timeout, not installed) are tested again
+            tested = {entry['signature']: entry for entry in previous.raw_data.get('endpoints', [])
+                      if 'signature' in entry and not entry.get('error')}
+        pending = [endpoint for endpoint in endpoints if signature_key(endpoint) not in tested]
+        
+        workers = max(min(self.config.get('SQLMAP_WORKERS', 4), len(pending)), 1)
+        logger.info(f"Running SQLMap on {len(pending)} of {len(endpoints)} endpoints with {workers} workers")
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            runs = dict(zip((signature_key(endpoint) for endpoint in pending),
+                            pool.map(self._run_sqlmap_endpoint, pending)))
+        
+        entries = []
+        for endpoint in endpoints:
+            signature = signature_key(endpoint)
+            if signature not in runs:
+                entry = dict(tested[signature])
+                entry.setdefault('carried_forward_from', previous.raw_data.get('carried_forward_from',
+                                                                               previous.scan_id))
+                entries.append(entry)
+                continue
+            run = runs[signature]
+            vulnerabilities = run.get('vulnerabilities', {}).get('vulnerabilities', [])
+            for vuln in vulnerabilities:
+                vuln.setdefault('url', endpoint['url'])
+            entries.append({
+                'signature': signature,
+                'url': endpoint['url'],
+                'method': endpoint['method'],
+                'data': endpoint.get('data'),
+                'return_code': run.get('return_code'),
+                'error': run.get('error'),
+                'total_found': len(vulnerabilities),
+                'vulnerabilities': vulnerabilities
+            })
+        
+        vulnerabilities = [vuln for entry in entries for vuln in entry.get('vulnerabilities', [])]
+        
+        # Keep the top-level shape of a single run for existing consumers
+        output_data = dict(next(iter(runs.values()), {}))
+        output_data['vulnerabilities'] = {
+            'vulnerabilities': vulnerabilities,
+            'total_found': len(vulnerabilities)
+        }
+        output_data['resources'] = merge_resources([run.get('resources') for run in runs.values()])
+        output_data['endpoints'] = entries
+        if previous is not None:
+            output_data['incremental_targets'] = [endpoint['url'] for endpoint in pending]
+        return output_data
+    
+    def _run_sqlmap_endpoint(self, endpoint: Dict[str, Any]) -> Dict[str, Any]:
+        """Run SQLMap against a single endpoint"""
+        with self.workspace.acquire() as workspace:
+            output_dir = os.path.join(workspace, 'sqlmap_results')
             
             cmd = [
                 'sqlmap',
-                '-u', target_url,
+                '-u', endpoint['url'],
                 '--batch',
                 '--level=2',
                 '--risk=1',
-                f'--output-dir={output_dir}',
-                '--format=json'
+                f'--output-dir={output_dir}'
             ]
+            if endpoint.get('data'):
+                cmd.append(f"--data={endpoint['data']}")
             
             try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,  # 5 minutes timeout
-                    check=False
-                )
+                # Findings are read from the output directory; stdout is only kept for diagnostics
+                result = self.sandbox.run(cmd, timeout=300,  # 5 minutes timeout
+                                          stdout_tail=self.config.get('SQLMAP_STDOUT_TAIL', 8192))
+                
+                if result.timed_out:
+                    return {
+                        'command': ' '.join(cmd),
+                        'error': 'SQLMap scan timed out after 5 minutes',
+                        'return_code': -1,
+                        'resources': result.resources
+                    }
                 
                 # Parse SQLMap output
+                with self.trace.span('parse', tool='sqlmap'):
+                    vulnerabilities = self._parse_sqlmap_output(output_dir, endpoint['url'])
+                
                 output_data = {
                     'command': ' '.join(cmd),
                     'stdout': result.stdout,
                     'stderr': result.stderr,
                     'return_code': result.returncode,
-                    'vulnerabilities': self._parse_sqlmap_output(result.stdout)
+                    'vulnerabilities': vulnerabilities,
+                    'resources': result.resources
                 }
                 
                 return output_data
                 
-            except subprocess.TimeoutExpired:
-                return {
-                    'command': ' '.join(cmd),
-                    'error': 'SQLMap scan timed out after 5 minutes',
-                    'return_code': -1
-                }
             except FileNotFoundError:
                 return {
                     'command': ' '.join(cmd),
@@ -122,59 +366,42 @@ class ScannerService:
         parsed_url = urlparse(target_url)
         target_host = parsed_url.netloc or parsed_url.path
         
-        with tempfile.NamedTemporaryFile(mode='w+', suffix='.xml', delete=False) as temp_file:
-            output_file = temp_file.name
+        # The XML report is streamed over stdout, so no output file is needed
+        cmd = [
+            'nmap',
+            '-T4',
+            '-F',
+            '-Pn',
+            target_host,
+            '-oX', '-'
+        ]
         
         try:
-            cmd = [
-                'nmap',
-                '-T4',
-                '-F',
-                '-Pn',
-                target_host,
-                '-oX', output_file
-            ]
+            result = self.sandbox.run(cmd, timeout=300)  # 5 minutes timeout
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minutes timeout
-                check=False
-            )
+            if result.timed_out:
+                return {
+                    'command': ' '.join(cmd),
+                    'error': 'Nmap scan timed out after 5 minutes',
+                    'return_code': -1,
+                    'resources': result.resources
+                }
             
-            # Read XML output
-            xml_content = ""
-            try:
-                with open(output_file, 'r') as f:
-                    xml_content = f.read()
-            except:
-                pass
-            finally:
-                # Cleanup temp file
-                try:
-                    os.unlink(output_file)
-                except:
-                    pass
+            with self.trace.span('parse', tool='nmap'):
+                parsed_results = self._parse_nmap_output(result.stdout)
             
             output_data = {
                 'command': ' '.join(cmd),
                 'target': target_host,
-                'stdout': result.stdout,
                 'stderr': result.stderr,
                 'return_code': result.returncode,
-                'xml_output': xml_content,
-                'parsed_results': self._parse_nmap_output(xml_content)
+                'xml_output': result.stdout,
+                'parsed_results': parsed_results,
+                'resources': result.resources
             }
             
             return output_data
             
-        except subprocess.TimeoutExpired:
-            return {
-                'command': ' '.join(cmd),
-                'error': 'Nmap scan timed out after 5 minutes',
-                'return_code': -1
-            }
         except FileNotFoundError:
             return {
                 'command': ' '.join(cmd),
@@ -184,10 +411,9 @@ class ScannerService:
     
     def _run_nikto(self, target_url: str) -> Dict[str, Any]:
         """Run Nikto scan"""
-        with tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False) as temp_file:
-            output_file = temp_file.name
-        
-        try:
+        # Nikto can only write its JSON report to a file, kept in a pooled tmpfs workspace
+        with self.workspace.acquire() as workspace:
+            output_file = os.path.join(workspace, 'nikto.json')
             cmd = [
                 'nikto',
                 '-h', target_url,
@@ -197,72 +423,50 @@ class ScannerService:
                 '-Format', 'json'
             ]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600,  # 10 minutes timeout for Nikto
-                check=False
-            )
-            
-            # Read JSON output
-            json_content = ""
             try:
-                with open(output_file, 'r') as f:
-                    json_content = f.read()
-            except:
-                pass
-            finally:
-                # Cleanup temp file
-                try:
-                    os.unlink(output_file)
-                except:
-                    pass
-            
-            output_data = {
-                'command': ' '.join(cmd),
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'return_code': result.returncode,
-                'json_output': json_content,
-                'parsed_results': self._parse_nikto_output(json_content)
-            }
+                result = self.sandbox.run(cmd, timeout=600)  # 10 minutes timeout for Nikto
+            except FileNotFoundError:
+                return {
+                    'command': ' '.join(cmd),
+                    'error': 'Nikto not found. Please install nikto.',
+                    'return_code': -1
+                }
             
-            return output_data
+            if result.timed_out:
+                return {
+                    'command': ' '.join(cmd),
+                    'error': 'Nikto scan timed out after 10 minutes',
+                    'return_code': -1,
+                    'resources': result.resources
+                }
             
-        except subprocess.TimeoutExpired:
-            return {
-                'command': ' '.join(cmd),
-                'error': 'Nikto scan timed out after 10 minutes',
-                'return_code': -1
-            }
-        except FileNotFoundError:
-            return {
-                'command': ' '.join(cmd),
-                'error': 'Nikto not found. Please install nikto.',
-                'return_code': -1
-            }
-    
-    def _parse_sqlmap_output(self, stdout: str) -> Dict[str, Any]:
-        """Parse SQLMap output for vulnerabilities"""
-        vulnerabilities = []
-        
-        # Look for common SQLMap vulnerability indicators
-        if 'vulnerable' in stdout.lower():
-            lines = stdout.split('\n')
-            for line in lines:
-                if 'vulnerable' in line.lower() or 'injection' in line.lower():
-                    vulnerabilities.append({
-                        'type': 'SQL Injection',
-                        'description': line.strip(),
-                        'severity': 'high'
-                    })
+            # Findings are streamed from the report file, which is never held in memory
+            with self.trace.span('parse', tool='nikto'):
+                parsed_results = self._parse_nikto_output(output_file)
         
         return {
-            'vulnerabilities': vulnerabilities,
-            'total_found': len(vulnerabilities)
+            'command': ' '.join(cmd),
+            'stdout': result.stdout,
+            'stderr': result.stderr,
+            'return_code': result.returncode,
+            'parsed_results': parsed_results,
+            'resources': result.resources
         }
     
+    def _run_http_checks(self, target_url: str) -> Dict[str, Any]:
+        """Run lightweight in-process HTTP checks"""
+        engine = CheckEngine(
+            concurrency=self.config.get('HTTP_CHECKS_CONCURRENCY', 50),
+            timeout=self.config.get('HTTP_CHECKS_TIMEOUT', 10)
+        )
+        return engine.run(target_url)
+    
+    def _parse_sqlmap_output(self, output_dir: str, url: str = '') -> Dict[str, Any]:
+        """Read deduplicated injection points from a SQLMap output directory"""
+        ingester = SqlmapIngester()
+        ingester.ingest_dir(output_dir, url)
+        return ingester.result()
+    
     def _parse_nmap_output(self, xml_content: str) -> Dict[str, Any]:
         """Parse Nmap XML output for open ports"""
         import xml.etree.ElementTree as ET
@@ -286,7 +490,8 @@ class ScannerService:
                             service_elem = port.find('service')
                             service_name = service_elem.get('name') if service_elem is not None else 'unknown'
                             
-                            if state == 'open':
+                            # Damaged reports can lack the port number; skip those ports
+                            if state == 'open' and port_id and port_id.isdigit():
                                 ports.append({
                                     'port': int(port_id),
                                     'protocol': protocol,
@@ -305,37 +510,13 @@ class ScannerService:
             'total_ports': len(ports)
         }
     
-    def _parse_nikto_output(self, json_content: str) -> Dict[str, Any]:
-        """Parse Nikto JSON output for vulnerabilities"""
-        vulnerabilities = []
-        
+    def _parse_nikto_output(self, report_path: str) -> Dict[str, Any]:
+        """Stream normalized findings out of a Nikto JSON report file"""
         try:
-            if json_content:
-                data = json.loads(json_content)
-                
-                # Nikto JSON structure may vary, adapt as needed
-                if isinstance(data, dict) and 'vulnerabilities' in data:
-                    for vuln in data['vulnerabilities']:
-                        vulnerabilities.append({
-                            'type': vuln.get('type', 'Web Vulnerability'),
-                            'description': vuln.get('description', ''),
-                            'severity': vuln.get('severity', 'medium'),
-                            'url': vuln.get('url', '')
-                        })
-                
-        except json.JSONDecodeError:
-            # If JSON parsing fails, try to extract from text
-            if 'ERROR' in json_content or 'OSVDB' in json_content:
-                vulnerabilities.append({
-                    'type': 'Web Vulnerability',
-                    'description': 'Nikto found potential issues',
-                    'severity': 'medium'
-                })
-        
-        return {
-            'vulnerabilities': vulnerabilities,
-            'total_found': len(vulnerabilities)
-        }
+            with open(report_path, encoding='utf-8', errors='replace') as f:
+                return parse_nikto_report(f)
+        except OSError:
+            return {'vulnerabilities': [], 'total_found': 0, 'hosts': []}
     
     def _count_vulnerabilities(self, tool_name: str, result: Dict[str, Any]) -> int:
         """Count vulnerabilities found by a tool"""
@@ -345,5 +526,7 @@ class ScannerService:
             return result.get('parsed_results', {}).get('total_ports', 0)
         elif tool_name == 'nikto':
             return result.get('parsed_results', {}).get('total_found', 0)
+        elif tool_name == 'http_checks':
+            return result.get('total_found', 0)
         
         return 0
\ No newline at end of file
@@ -1,4 +1,5 @@
 from celery import Celery
+from flask import has_app_context
 
 def make_celery(app):
     """Create Celery instance with Flask app context"""
@@ -6,7 +7,8 @@ def make_celery(app):
     celery = Celery(
         app.import_name,
         backend=app.config['CELERY_RESULT_BACKEND'],
-        broker=app.config['CELERY_BROKER_URL']
+        broker=app.config['CELERY_BROKER_URL'],
+        include=['app.tasks.scan_tasks', 'app.tasks.schedule_tasks', 'app.tasks.report_tasks']
     )
     
     celery.conf.update(
@@ -19,15 +21,29 @@ def make_celery(app):
         task_acks_late=True,
         worker_prefetch_multiplier=1,
         result_expires=3600,  # 1 hour
+        beat_schedule={
+            'enqueue-due-scans': {
+                'task': 'app.tasks.schedule_tasks.enqueue_due_scans',
+                'schedule': app.config['SCHEDULER_INTERVAL']
+            }
+        },
     )
     
     # Update task base classes to be compatible with Flask
     class ContextTask(celery.Task):
         """Make celery tasks work with Flask app context."""
         def __call__(self, *args, **kwargs):
+            # Called in-process (apply(), tests) the caller's app context is used
+            if has_app_context():
+                return self.run(*args, **kwargs)
             with app.app_context():
                 return self.run(*args, **kwargs)
     
     celery.Task = ContextTask
     
+    # Export metrics from worker pool processes
+    if app.config.get('METRICS_ENABLED', True):
+        from ..utils.metrics import init_worker_metrics
+        init_worker_metrics(celery, app)
+    
     return celery
\ No newline at end of file
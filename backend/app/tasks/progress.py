@@ -0,0 +1,65 @@
+import time
+from flask import current_app
+
+from ..extensions import db
+from ..utils.tracing import NULL_TRACE
+
+class ProgressReporter:
+    """Throttled progress writes for a running scan
+
+    Intermediate progress is held in memory and only written when it moved by
+    PROGRESS_MIN_DELTA points and PROGRESS_MIN_INTERVAL seconds passed since the
+    last write. State transitions and finished tool results are always written,
+    each in a single commit.
+    """
+
+    def __init__(self, scan, min_delta=None, min_interval=None, trace=None):
+        self.scan = scan
+        self.trace = trace or NULL_TRACE
+        self.min_delta = min_delta if min_delta is not None else current_app.config.get('PROGRESS_MIN_DELTA', 10)
+        self.min_interval = (min_interval if min_interval is not None
+                             else current_app.config.get('PROGRESS_MIN_INTERVAL', 5))
+        self.progress = scan.progress or 0
+        self.writes = 0
+        self._written = self.progress
+        self._written_at = time.monotonic()
+        self._unsaved_results = False
+
+    def add_result(self, result):
+        """Stage a finished tool's result; the next update() writes it, unthrottled"""
+        db.session.add(result)
+        self._unsaved_results = True
+
+    def update(self, progress):
+        """Record progress (0-100); returns True if it was written"""
+        progress = min(int(progress), 100)
+        moved = progress > self.progress
+        self.progress = max(progress, self.progress)
+
+        if not self._unsaved_results and (
+                not moved
+                or self.progress - self._written < self.min_delta
+                or time.monotonic() - self._written_at < self.min_interval):
+            return False
+
+        self.scan.progress = self.progress
+        self._commit('result' if self._unsaved_results else 'progress')
+        return True
+
+    def transition(self, status, progress=None, **fields):
+        """Write a status change together with the latest progress and any other fields"""
+        if progress is not None:
+            self.progress = progress
+        self.scan.status = status
+        self.scan.progress = self.progress
+        for name, value in fields.items():
+            setattr(self.scan, name, value)
+        self._commit(status)
+
+    def _commit(self, kind):
+        with self.trace.span('db_write', kind=kind):
+            db.session.commit()
+        self.writes += 1
+        self._unsaved_results = False
+        self._written = self.progress
+        self._written_at = time.monotonic()
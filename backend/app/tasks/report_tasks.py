@@ -0,0 +1,20 @@
+import logging
+from celery import current_app
+
+from ..models.report import Report
+from ..services.report_services import ReportService
+
+logger = logging.getLogger(__name__)
+
+@current_app.task(bind=True)
+def generate_report(self, report_id):
+    """Render a report file in the background"""
+    report = Report.query.get(report_id)
+    if not report:
+        logger.error(f"Report {report_id} not found")
+        return {'success': False, 'error': 'Report not found'}
+
+    report = ReportService().render(report)
+    logger.info(f"Report {report_id} finished with status {report.status}")
+
+    return {'success': report.status == 'ready', 'report_id': report_id, 'status': report.status}
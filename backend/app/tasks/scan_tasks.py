@@ -2,17 +2,27 @@ import os
 import logging
 from celery import current_app
 from datetime import datetime
+from sqlalchemy import inspect
 
-from ..services.scanner_service import ScannerService
+from ..services.diff_services import DiffService
 from ..models.scan import Scan
+from ..models.scan_result import ScanResult
+from ..models.user_scan_stats import UserScanStats
+from ..scanner.findings import normalize_results, count_by_severity
 from ..extensions import db
+from ..utils.tracing import ScanTrace
+from ..utils.metrics import SCANS_IN_FLIGHT, SCANS_FINISHED
+from .progress import ProgressReporter
 
 logger = logging.getLogger(__name__)
 
 @current_app.task(bind=True)
+@SCANS_IN_FLIGHT.track_inprogress()
 def run_vulnerability_scan(self, scan_id):
     """Celery task to run vulnerability scan in background"""
     
+    trace = ScanTrace(scan_id, task_id=self.request.id)
+    
     try:
         # Update scan status to running
         scan = Scan.query.get(scan_id)
@@ -20,26 +30,38 @@ def run_vulnerability_scan(self, scan_id):
             logger.error(f"Scan {scan_id} not found")
             return {'success': False, 'error': 'Scan not found'}
         
-        scan.status = 'running'
-        scan.started_at = datetime.utcnow()
-        scan.progress = 10
-        db.session.commit()
+        # Queue wait spans processes, so it is the one span measured on the wall clock
+        trace.record('queue_wait', max((datetime.utcnow() - scan.started_at).total_seconds(), 0), clock='wall')
+        
+        # The scan row is written at state transitions; tool progress in between is throttled
+        reporter = ProgressReporter(scan, trace=trace)
+        reporter.transition('running', progress=10, started_at=datetime.utcnow())
         
         logger.info(f"Starting vulnerability scan for {scan.target_url}")
         
         # Initialize scanner service
-        scanner = ScannerService()
+        # Imported here so API processes that only enqueue tasks skip the scanner stack (httpx, tools)
+        from ..services.scanner_services import ScannerService
         
-        # Update progress
-        scan.progress = 25
-        db.session.commit()
+        # Each tool's result is committed with the progress write that follows it, so a
+        # crash or timeout later in the scan keeps the output of the tools that finished.
+        # Findings are normalized first, while the raw output is still loaded.
+        findings = {}
         
-        # Run all scans
-        results = scanner.run_all_scans(scan_id, scan.target_url)
+        def store_result(scan_result):
+            with trace.span('normalize', tool=scan_result.tool_name):
+                for key, finding in normalize_results([scan_result]).items():
+                    findings.setdefault(key, finding)
+            reporter.add_result(scan_result)
         
-        # Update progress
-        scan.progress = 80
-        db.session.commit()
+        scanner = ScannerService(progress_callback=lambda fraction: reporter.update(10 + 80 * fraction),
+                                 result_callback=store_result, trace=trace)
+        
+        # Run all scans, or only the changed surface for incremental scans
+        if scan.scan_type == 'incremental':
+            results = scanner.run_incremental_scans(scan_id, scan.target_url, scan.get_previous_scan())
+        else:
+            results = scanner.run_all_scans(scan_id, scan.target_url)
         
         # Process results and update scan
         total_vulnerabilities = sum(
@@ -48,15 +70,47 @@ def run_vulnerability_scan(self, scan_id):
             if result.get('success', False)
         )
         
-        # Count vulnerabilities by severity (this would be done by AI analysis later)
-        scan.total_vulnerabilities = total_vulnerabilities
-        scan.progress = 100
-        scan.status = 'completed'
-        scan.completed_at = datetime.utcnow()
+        # Count vulnerabilities by severity from the normalized findings
+        severity_counts = count_by_severity(findings.values())
+        
+        # Committed results are expired; the identity gives their IDs without reloading raw output
+        for scan_result in scanner.tool_results:
+            identity = inspect(scan_result).identity
+            if identity:
+                results[scan_result.tool_name]['result_id'] = identity[0]
+        
+        # Roll the totals into the user's dashboard stats in the commit with the final state
+        UserScanStats.increment(
+            scan.user_id,
+            completed_scans=1,
+            total_vulnerabilities=total_vulnerabilities,
+            high_severity_count=severity_counts['high'],
+            medium_severity_count=severity_counts['medium'],
+            low_severity_count=severity_counts['low']
+        )
+        
+        reporter.transition(
+            'completed',
+            progress=100,
+            completed_at=datetime.utcnow(),
+            total_vulnerabilities=total_vulnerabilities,
+            high_severity_count=severity_counts['high'],
+            medium_severity_count=severity_counts['medium'],
+            low_severity_count=severity_counts['low']
+        )
+        
+        logger.info(f"Scan {scan_id} completed successfully ({reporter.writes} scan row writes)")
         
-        db.session.commit()
+        # Precompute the diff against the previous scan of the same target
+        try:
+            with trace.span('diff'):
+                DiffService().store_diff(scan)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Diff computation failed for scan {scan_id}: {str(e)}")
         
-        logger.info(f"Scan {scan_id} completed successfully")
+        trace.summary(status='completed')
+        SCANS_FINISHED.labels(status='completed').inc()
         
         return {
             'success': True,
@@ -67,14 +121,18 @@ def run_vulnerability_scan(self, scan_id):
         
     except Exception as e:
         logger.error(f"Scan {scan_id} failed: {str(e)}")
+        trace.summary(status='failed', error=str(e))
+        SCANS_FINISHED.labels(status='failed').inc()
         
         # Update scan status to failed
         try:
+            db.session.rollback()
             scan = Scan.query.get(scan_id)
-            if scan:
+            if scan and scan.status not in ('completed', 'failed'):
                 scan.status = 'failed'
                 scan.error_message = str(e)
                 scan.completed_at = datetime.utcnow()
+                UserScanStats.increment(scan.user_id, failed_scans=1)
                 db.session.commit()
         except:
             pass
@@ -90,16 +148,21 @@ def process_scan_results_with_ai(self, scan_id):
     """Process scan results with AI analysis"""
     
     try:
-        from ..services.ai_service import AIService
+        from ..services.ai_services import AIService
         
+        trace = ScanTrace(scan_id, task_id=self.request.id)
         scan_results = ScanResult.query.filter_by(scan_id=scan_id).all()
         ai_service = AIService()
         
         for result in scan_results:
             if not result.ai_analysis:
-                analysis = ai_service.analyze_scan_result(result.raw_data, result.tool_name)
+                with trace.span('ai_analysis', tool=result.tool_name):
+                    analysis = ai_service.analyze_scan_result(result.raw_data, result.tool_name)
                 result.set_ai_analysis(analysis)
         
+        with trace.span('db_write', kind='ai_analysis'):
+            db.session.commit()
+        trace.summary(status='ai_completed')
         logger.info(f"AI analysis completed for scan {scan_id}")
         
         return {'success': True, 'scan_id': scan_id}
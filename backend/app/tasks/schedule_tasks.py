@@ -0,0 +1,104 @@
+import logging
+from collections import Counter, defaultdict
+from celery import current_app, group
+from datetime import datetime
+from flask import current_app as flask_app
+
+from ..models.user import User
+from ..models.scan import Scan
+from ..models.scan_schedule import ScanSchedule
+from ..models.user_scan_stats import UserScanStats
+from ..models.scan_usage import ScanUsage
+from ..extensions import db
+from .scan_tasks import run_vulnerability_scan
+
+logger = logging.getLogger(__name__)
+
+def _claim_due_schedules(now, batch_size):
+    """Lock a batch of due schedules; concurrent schedulers skip rows already claimed"""
+    return ScanSchedule.query.filter(
+        ScanSchedule.is_active.is_(True),
+        ScanSchedule.next_run_at <= now
+    ).order_by(ScanSchedule.next_run_at).limit(batch_size).with_for_update(skip_locked=True).all()
+
+def _reserve_quota(schedules, now):
+    """Schedules whose owners have quota for a scan, reserved in the current transaction
+
+    Each owner gets as many of their due schedules as their remaining quota
+    covers, in due order, with a single reservation.
+    """
+    by_owner = defaultdict(list)
+    for schedule in schedules:
+        by_owner[schedule.user_id].append(schedule)
+    owners = {user.id: user for user in User.query.filter(User.id.in_(list(by_owner)))}
+
+    allowed = []
+    for user_id, owned in by_owner.items():
+        user = owners.get(user_id)
+        if user is None:
+            continue
+        if not ScanUsage.applies_to(user):
+            allowed += owned
+            continue
+
+        window = ScanUsage.window_for(user)
+        remaining = user.scan_limit - ScanUsage.used_in_window(user_id, window, now)
+        count = min(len(owned), max(remaining, 0))
+        if count and not ScanUsage.reserve(user_id, count, user.scan_limit, window, now):
+            count = 0  # A concurrent submission used up the rest
+        allowed += owned[:count]
+    return allowed
+
+@current_app.task(bind=True)
+def enqueue_due_scans(self):
+    """Create and enqueue scans for every schedule that is due, in batches"""
+    batch_size = flask_app.config.get('SCHEDULER_BATCH_SIZE', 200)
+    now = datetime.utcnow()
+    enqueued = skipped = 0
+
+    while True:
+        schedules = _claim_due_schedules(now, batch_size)
+        if not schedules:
+            break
+
+        # Quota is reserved in the same transaction that creates the scans
+        runnable = _reserve_quota(schedules, now)
+        scans = [
+            Scan(
+                user_id=schedule.user_id,
+                target_url=schedule.target_url,
+                scan_type=schedule.scan_type,
+                status='pending'
+            )
+            for schedule in runnable
+        ]
+        db.session.add_all(scans)
+        db.session.flush()
+
+        scans_per_user = Counter(scan.user_id for scan in scans)
+        for user_id, count in scans_per_user.items():
+            UserScanStats.increment(user_id, total_scans=count, last_scan_at=now)
+
+        for schedule, scan in zip(runnable, scans):
+            schedule.last_scan_id = scan.id
+
+        # Over-quota schedules skip this run and fire again at their next cron time
+        for schedule in schedules:
+            schedule.advance(now)
+        skipped += len(schedules) - len(runnable)
+
+        db.session.commit()
+
+        if scans:
+            group(run_vulnerability_scan.s(scan.id) for scan in scans).apply_async()
+        enqueued += len(scans)
+
+        if len(schedules) < batch_size:
+            break
+
+    if enqueued:
+        logger.info(f"Enqueued {enqueued} scheduled scans")
+    if skipped:
+        logger.warning(f"Skipped {skipped} scheduled scans whose owners are over their scan quota")
+
+    return {'success': True, 'enqueued': enqueued, 'skipped': skipped}
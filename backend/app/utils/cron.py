@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+
+ALIASES = {
+    '@hourly': '0 * * * *',
+    '@daily': '0 0 * * *',
+    '@midnight': '0 0 * * *',
+    '@weekly': '0 0 * * 0',
+    '@monthly': '0 0 1 * *'
+}
+
+# (minimum, maximum) for minute, hour, day of month, month, day of week (0 and 7 are Sunday)
+FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+class CronError(ValueError):
+    """Raised for cron expressions that cannot be parsed"""
+
+def _parse_field(field, minimum, maximum):
+    values = set()
+    for part in field.split(','):
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            if not step_text.isdigit() or int(step_text) == 0:
+                raise CronError(f'Invalid step: {step_text}')
+            step = int(step_text)
+
+        if part == '*':
+            start, end = minimum, maximum
+        elif '-' in part:
+            start_text, end_text = part.split('-', 1)
+            if not (start_text.isdigit() and end_text.isdigit()):
+                raise CronError(f'Invalid range: {part}')
+            start, end = int(start_text), int(end_text)
+        elif part.isdigit():
+            start = int(part)
+            end = maximum if step > 1 else start
+        else:
+            raise CronError(f'Invalid value: {part}')
+
+        if start < minimum or end > maximum or start > end:
+            raise CronError(f'Value out of range: {part}')
+        values.update(range(start, end + 1, step))
+    return values
+
+class CronSpec:
+    """Five-field cron expression (minute hour day-of-month month day-of-week)"""
+
+    def __init__(self, expression):
+        self.expression = expression.strip()
+        fields = ALIASES.get(self.expression, self.expression).split()
+        if len(fields) != 5:
+            raise CronError('Cron expression must have 5 fields')
+
+        self.minutes, self.hours, self.days, self.months, self.weekdays = [
+            _parse_field(field, minimum, maximum)
+            for field, (minimum, maximum) in zip(fields, FIELD_RANGES)
+        ]
+        if 7 in self.weekdays:
+            self.weekdays = (self.weekdays - {7}) | {0}
+        # Standard cron semantics: if both day fields are restricted, either may match
+        self.any_day = fields[2] == '*'
+        self.any_weekday = fields[4] == '*'
+
+    def _day_matches(self, moment):
+        day_match = moment.day in self.days
+        weekday_match = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day_match and weekday_match
+        return day_match or weekday_match
+
+    def next_after(self, moment):
+        """Get the first matching minute strictly after moment"""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+
+        while candidate < limit:
+            if candidate.month not in self.months:
+                candidate = (candidate.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise CronError(f'Cron expression never matches: {self.expression}')
+
+def validate_cron(expression):
+    """Return an error message if the cron expression is invalid, else None"""
+    try:
+        CronSpec(expression).next_after(datetime.utcnow())
+    except CronError as e:
+        return str(e)
+    return None
@@ -0,0 +1,63 @@
+from contextlib import contextmanager
+from functools import wraps
+from flask import g, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+REPLICA_BIND = 'replica'
+_WROTE = '_db_wrote'  # session.info key: the current transaction has written to the primary
+
+class RoutingSession(Session):
+    """Session that sends reads to the replica bind while replica reads are enabled
+
+    Writes, locking reads, and any read once the session has pending changes
+    or has written in the current transaction go to the primary, so a request
+    always sees its own writes. Without a 'replica' bind configured every
+    statement uses the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if clause is not None and getattr(clause, 'is_dml', False):
+            self.info[_WROTE] = True
+        elif bind is None and self._replica_allowed(clause):
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _replica_allowed(self, clause):
+        if not (has_app_context() and g.get('_db_use_replica')):
+            return False
+        if self._flushing or self.new or self.dirty or self.deleted or self.info.get(_WROTE):
+            return False
+        if clause is not None and getattr(clause, '_for_update_arg', None) is not None:
+            return False
+        return True
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _mark_written(session, flush_context):
+    session.info[_WROTE] = True
+
+@event.listens_for(RoutingSession, 'after_transaction_end')
+def _clear_written(session, transaction):
+    # Once the outermost transaction ends the replica may serve reads again
+    if transaction.parent is None:
+        session.info.pop(_WROTE, None)
+
+@contextmanager
+def use_replica():
+    """Route reads in this block to the replica (when one is configured)"""
+    previous = g.get('_db_use_replica', False)
+    g._db_use_replica = True
+    try:
+        yield
+    finally:
+        g._db_use_replica = previous
+
+def read_replica(f):
+    """Run a read-only handler against the replica; place below @jwt_required()"""
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        with use_replica():
+            return f(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,45 @@
+from functools import wraps
+from flask import request, make_response
+from werkzeug.http import quote_etag
+
+from .metrics import record_cache
+
+def make_etag(*parts):
+    """Build an ETag value from version parts"""
+    return '-'.join(str(part) for part in parts)
+
+def etag_conditional(get_etag):
+    """Answer If-None-Match with 304 before running the wrapped handler
+
+    get_etag receives the handler's arguments and returns the current ETag
+    value, or None when the resource does not exist (the handler then runs
+    normally). Place it above marshalling decorators so a 304 also skips
+    serialization.
+    """
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            etag = get_etag(*args, **kwargs)
+            if etag is None:
+                return f(*args, **kwargs)
+
+            header = quote_etag(etag, weak=True)
+            hit = request.if_none_match.contains_weak(etag)
+            record_cache('etag', hit)
+            if hit:
+                response = make_response('', 304)
+                response.headers['ETag'] = header
+                return response
+
+            result = f(*args, **kwargs)
+            if not isinstance(result, tuple):
+                result = (result, 200)
+            data, code = result[0], result[1]
+            headers = dict(result[2]) if len(result) > 2 else {}
+
+            if code == 200:
+                headers['ETag'] = header
+                headers.setdefault('Cache-Control', 'private, no-cache')
+            return data, code, headers
+        return wrapper
+    return decorator
@@ -0,0 +1,28 @@
+import json
+from flask import current_app, make_response
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is used without it
+    orjson = None
+
+def dumps(data):
+    """Serialize to JSON bytes with orjson when enabled and available"""
+    if orjson is not None and current_app.config.get('JSON_FAST_ENCODER', True):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Types orjson can't handle (e.g. Decimal) fall back to the stdlib
+    return json.dumps(data, separators=(',', ':'), default=str).encode('utf-8')
+
+def output_json(data, code, headers=None):
+    """Flask-RESTX JSON representation using the fast encoder"""
+    response = make_response(dumps(data), code)
+    response.mimetype = 'application/json'
+    response.headers.extend(headers or {})
+    return response
+
+def register_json_representation(api):
+    """Replace the RESTX default (stdlib json, pretty in debug) on an Api instance"""
+    api.representations['application/json'] = output_json
+    return api
@@ -0,0 +1,218 @@
+import os
+import time
+import logging
+from contextlib import ContextDecorator
+
+from flask import Response, g, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Read from the environment (like Config.METRICS_ENABLED) because the metrics
+# below are created at import, before any app exists
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+
+class _NullTracker(ContextDecorator):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class NullMetric:
+    """Stands in for Counter, Gauge and Histogram when metrics are disabled"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def labels(self, *args, **kwargs):
+        return self
+
+    def inc(self, amount=1):
+        pass
+
+    def dec(self, amount=1):
+        pass
+
+    def set(self, value):
+        pass
+
+    def observe(self, amount):
+        pass
+
+    def track_inprogress(self):
+        return _NullTracker()
+
+    def time(self):
+        return _NullTracker()
+
+if METRICS_ENABLED:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+        generate_latest, multiprocess, start_http_server
+    )
+    from prometheus_client.core import GaugeMetricFamily
+else:
+    # prometheus_client is never imported; init_metrics and init_worker_metrics are not called
+    Counter = Gauge = Histogram = NullMetric
+
+# Prometheus reads this when the metric values are created, so it has to be in
+# the environment before the process starts (gunicorn workers, celery children)
+MULTIPROC_DIR = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'API request latency',
+    ['namespace', 'method'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+REQUESTS = Counter(
+    'http_requests_total', 'API requests by response status class',
+    ['namespace', 'method', 'status']
+)
+SCANS_IN_FLIGHT = Gauge(
+    'scans_in_flight', 'Scans currently executing in workers',
+    multiprocess_mode='livesum'
+)
+SCANS_FINISHED = Counter(
+    'scans_finished_total', 'Scans that reached a final state', ['status']
+)
+TOOL_DURATION = Histogram(
+    'scan_tool_duration_seconds', 'Wall time of one scanner tool per scan',
+    ['tool', 'outcome'],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 900, 1800)
+)
+CACHE_LOOKUPS = Counter(
+    'cache_lookups_total', 'Cache lookups by cache and result (hit/miss)', ['cache', 'result']
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out_connections', 'Pooled connections currently in use',
+    ['bind'], multiprocess_mode='livesum'
+)
+DB_POOL_CAPACITY = Gauge(
+    'db_pool_capacity_connections', 'Pool size plus overflow of live processes',
+    ['bind'], multiprocess_mode='livesum'
+)
+
+def record_cache(cache, hit):
+    """Count a lookup in a named cache; the hit ratio is derived at query time"""
+    CACHE_LOOKUPS.labels(cache=cache, result='hit' if hit else 'miss').inc()
+
+def request_namespace():
+    """Bounded label for the current request: the API namespace or the endpoint name"""
+    rule = request.url_rule
+    if rule is None:
+        return 'unmatched'
+    parts = rule.rule.strip('/').split('/')
+    if len(parts) >= 3 and parts[0] == 'api':
+        return parts[2]
+    return request.endpoint or 'unmatched'
+
+class QueueDepthCollector:
+    """Reports the number of tasks waiting in the Celery broker at scrape time"""
+
+    def __init__(self, broker_url, queues):
+        self.broker_url = broker_url
+        self.queues = queues
+        self._client = None
+
+    def collect(self):
+        family = GaugeMetricFamily('celery_queue_depth', 'Tasks waiting in the broker queue', labels=['queue'])
+        if self.broker_url and self.broker_url.startswith(('redis://', 'rediss://')):
+            try:
+                if self._client is None:
+                    import redis
+                    self._client = redis.Redis.from_url(self.broker_url, socket_timeout=0.5,
+                                                        socket_connect_timeout=0.5)
+                for queue in self.queues:
+                    family.add_metric([queue], self._client.llen(queue))
+            except Exception as e:
+                logger.warning(f"Queue depth unavailable: {e}")
+        yield family
+
+def _pool_capacity(pool):
+    size = getattr(pool, 'size', None)
+    if not callable(size):
+        return 1  # Single-connection pools (SQLite)
+    return size() + max(getattr(pool, '_max_overflow', 0), 0)
+
+def instrument_engine(bind, engine):
+    """Track checked-out connections and pool capacity through pool events"""
+    checked_out = DB_POOL_CHECKED_OUT.labels(bind=bind)
+    capacity = DB_POOL_CAPACITY.labels(bind=bind)
+
+    # Engine-level listeners carry over to the pool recreated by engine.dispose()
+    @event.listens_for(engine, 'first_connect')
+    def _first_connect(dbapi_connection, connection_record):
+        capacity.set(_pool_capacity(engine.pool))
+
+    @event.listens_for(engine, 'checkout')
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_out.inc()
+
+    @event.listens_for(engine, 'checkin')
+    def _checkin(dbapi_connection, connection_record):
+        checked_out.dec()
+
+def exposition_registry():
+    """Registry to render: all processes' files in multiprocess mode, else this process"""
+    if not MULTIPROC_DIR:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+def init_metrics(app):
+    """Time API requests and expose them, with the worker metrics, on /metrics"""
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+
+    from ..extensions import db
+
+    with app.app_context():
+        for bind, engine in db.engines.items():
+            instrument_engine(bind or 'default', engine)
+
+    queue_registry = CollectorRegistry()
+    queue_registry.register(QueueDepthCollector(app.config.get('CELERY_BROKER_URL'),
+                                                app.config.get('METRICS_QUEUES', ['celery'])))
+
+    @app.before_request
+    def _start_timer():
+        g._metrics_start = time.perf_counter()
+
+    @app.after_request
+    def _observe_request(response):
+        start = g.pop('_metrics_start', None)
+        if start is not None and request.endpoint != 'metrics':
+            namespace = request_namespace()
+            REQUEST_LATENCY.labels(namespace=namespace, method=request.method).observe(time.perf_counter() - start)
+            REQUESTS.labels(namespace=namespace, method=request.method,
+                            status=f'{response.status_code // 100}xx').inc()
+        return response
+
+    @app.route('/metrics', endpoint='metrics')
+    def metrics():
+        body = generate_latest(exposition_registry()) + generate_latest(queue_registry)
+        return Response(body, mimetype=CONTENT_TYPE_LATEST)
+
+def init_worker_metrics(celery, app):
+    """Serve worker metrics and clean up after pool processes
+
+    Workers on the same host as the API can share PROMETHEUS_MULTIPROC_DIR and
+    are then included in the API's /metrics. Elsewhere, METRICS_WORKER_PORT
+    starts an exporter in the worker's main process aggregating its children.
+    """
+    from celery.signals import worker_init, worker_process_shutdown
+
+    port = app.config.get('METRICS_WORKER_PORT')
+
+    @worker_init.connect(weak=False)
+    def _start_exporter(**kwargs):
+        if port:
+            start_http_server(int(port), registry=exposition_registry())
+            logger.info(f"Worker metrics on :{port}")
+
+    @worker_process_shutdown.connect(weak=False)
+    def _mark_dead(pid=None, **kwargs):
+        if MULTIPROC_DIR:
+            multiprocess.mark_process_dead(pid or os.getpid())
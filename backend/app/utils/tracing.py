@@ -0,0 +1,76 @@
+import time
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+# structlog is imported where it is used, so processes that never trace (the
+# API with STRUCTLOG_ENABLED off) don't load it
+
+def configure_structlog():
+    """Render structlog events as JSON through the stdlib logging handlers"""
+    import structlog
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt='iso', utc=True),
+            structlog.processors.JSONRenderer()
+        ],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True
+    )
+
+class ScanTrace:
+    """Timed spans for one scan, each emitted as a structured 'span' event
+
+    Durations come from time.perf_counter(), so they are immune to wall-clock
+    adjustments. Spans may be recorded from several threads (parallel SQLMap runs).
+    """
+
+    def __init__(self, scan_id, **context):
+        import structlog
+        self.log = structlog.get_logger('scan.trace').bind(scan_id=scan_id, **context)
+        self.totals = defaultdict(float)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name, **fields):
+        """Time the enclosed block; the yielded dict can collect extra fields"""
+        start = time.perf_counter()
+        status = 'ok'
+        try:
+            yield fields
+        except BaseException:
+            status = 'error'
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start, status=status, **fields)
+
+    def record(self, name, seconds, **fields):
+        """Emit a span measured elsewhere (e.g. by the tool sandbox)"""
+        with self._lock:
+            self.totals[name] += seconds
+        self.log.info('span', span=name, duration_ms=round(seconds * 1000, 3), **fields)
+
+    def summary(self, **fields):
+        """Emit per-span totals for the scan"""
+        with self._lock:
+            totals = {name: round(seconds * 1000, 3) for name, seconds in self.totals.items()}
+        self.log.info('scan_timing', totals_ms=totals, **fields)
+        return totals
+
+class NullTrace:
+    """Drop-in trace that records nothing"""
+
+    @contextmanager
+    def span(self, name, **fields):
+        yield fields
+
+    def record(self, name, seconds, **fields):
+        pass
+
+    def summary(self, **fields):
+        return {}
+
+NULL_TRACE = NullTrace()
@@ -2,12 +2,12 @@
 """
 Celery application entry point
 Usage: celery -A celery_app.celery worker --loglevel=info
+       celery -A celery_app.celery beat --loglevel=info  (recurring scans)
 """
 from app import create_app
-from app.tasks.celery_config import make_celery
 
 app = create_app()
-celery = make_celery(app)
+celery = app.extensions['celery']
 
 if __name__ == '__main__':
     celery.start()
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Gunicorn settings for production serving
+Usage: gunicorn -c gunicorn.conf.py wsgi:app
+
+Reload workers gracefully with `kill -HUP $(cat $GUNICORN_PID)`. Because the
+app is preloaded, HUP does not pick up new code; deploy code with USR2 (start a
+new master) followed by WINCH and QUIT on the old one.
+
+Export PROMETHEUS_MULTIPROC_DIR (an empty, writable directory) so /metrics
+aggregates all workers instead of reporting whichever one served the scrape.
+"""
+import os
+import multiprocessing
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Pre-fork workers, each with a thread pool; requests mostly wait on the database
+worker_class = 'gthread'
+workers = int(os.environ.get('GUNICORN_WORKERS') or multiprocessing.cpu_count() * 2 + 1)
+threads = int(os.environ.get('GUNICORN_THREADS') or 4)
+
+# Run create_app once in the master and fork copies of it
+preload_app = True
+
+# Keep-alive should exceed the idle timeout of the proxy/load balancer in front
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE') or 75)
+timeout = int(os.environ.get('GUNICORN_TIMEOUT') or 30)
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT') or 30)
+
+# Recycle workers periodically; jitter avoids restarting them all at once
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS') or 2000)
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER') or 200)
+
+# Heartbeat files on tmpfs so a slow disk can't get workers killed
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+pidfile = os.environ.get('GUNICORN_PID')
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+def on_starting(server):
+    """Start from an empty metrics directory; stale files would be summed in"""
+    metrics_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if metrics_dir and os.path.isdir(metrics_dir):
+        for name in os.listdir(metrics_dir):
+            if name.endswith('.db'):
+                os.remove(os.path.join(metrics_dir, name))
+
+def child_exit(server, worker):
+    """Drop live gauges of a worker that exited or was recycled"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
+
+def post_fork(server, worker):
+    """Drop database connections inherited from the preloading master"""
+    from app.extensions import db
+
+    app = worker.app.wsgi()
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
@@ -2,6 +2,7 @@
 """
 Development server entry point for Web Vulnerability Scanner
 Usage: python run.py [--port PORT] [--host HOST] [--debug]
+For production use gunicorn instead: gunicorn -c gunicorn.conf.py wsgi:app
 """
 import os
 import sys
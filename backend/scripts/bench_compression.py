@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON encoding and response compression on large scan results
+Usage: python scripts/bench_compression.py [--results N] [--raw-kb KB] [--repeat N]
+"""
+import os
+import sys
+import json
+import time
+import random
+import string
+import argparse
+from datetime import datetime
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.compression import compress, brotli
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def build_payload(results, raw_kb):
+    """Build a ScanResults.get style payload with large raw tool output"""
+    random.seed(42)
+    line = lambda: f"[{datetime.utcnow():%H:%M:%S}] [INFO] testing '{random.choice(string.ascii_letters) * 8}' " \
+                   f"on parameter 'id' ({random.randint(1, 10**6)})\n"
+
+    payload = {'scan': {'id': 1, 'target_url': 'https://example.com', 'status': 'completed'}, 'results': []}
+    for index in range(results):
+        stdout = ''
+        while len(stdout) < raw_kb * 1024:
+            stdout += line()
+        payload['results'].append({
+            'id': index,
+            'scan_id': 1,
+            'tool_name': ('sqlmap', 'nmap', 'nikto')[index % 3],
+            'created_at': datetime.utcnow().isoformat(),
+            'raw_data': {'stdout': stdout, 'stderr': '', 'return_code': 0},
+            'ai_analysis': None
+        })
+    return payload
+
+def timed(func, repeat):
+    """Return (result, best time in ms) over repeat runs"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark API response encoding')
+    parser.add_argument('--results', type=int, default=3, help='Number of tool results in the payload')
+    parser.add_argument('--raw-kb', type=int, default=512, help='Size of each raw output in KB')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement (best is reported)')
+    args = parser.parse_args()
+
+    payload = build_payload(args.results, args.raw_kb)
+
+    print("📦 Response encoding benchmark")
+    print("=" * 60)
+
+    body, stdlib_ms = timed(lambda: json.dumps(payload).encode('utf-8'), args.repeat)
+    print(f"{'json (stdlib)':<22} {len(body):>12,} bytes {stdlib_ms:>9.2f} ms")
+    if orjson is not None:
+        _, orjson_ms = timed(lambda: orjson.dumps(payload), args.repeat)
+        print(f"{'orjson':<22} {len(body):>12,} bytes {orjson_ms:>9.2f} ms  ({stdlib_ms / orjson_ms:.1f}x faster)")
+    else:
+        print("orjson                 not installed, skipped")
+
+    print("-" * 60)
+    codecs = [('gzip', {'COMPRESS_GZIP_LEVEL': level}, f'gzip -{level}') for level in (1, 6, 9)]
+    if brotli is not None:
+        codecs += [('br', {'COMPRESS_BR_LEVEL': level}, f'brotli q{level}') for level in (1, 4, 6)]
+    else:
+        print("brotli                 not installed, skipped")
+
+    for encoding, config, label in codecs:
+        compressed, ms = timed(lambda: compress(body, encoding, config), args.repeat)
+        saved = len(body) - len(compressed)
+        print(f"{label:<22} {len(compressed):>12,} bytes {ms:>9.2f} ms  "
+              f"(saves {saved:,} bytes, {100 * saved / len(body):.1f}%)")
+
+    print("=" * 60)
+
+if __name__ == '__main__':
+    main()
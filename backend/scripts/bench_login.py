@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark password verification cost to choose PASSWORD_HASH_METHOD
+Usage: python scripts/bench_login.py [--method METHOD ...] [--rounds N] [--processes N]
+"""
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from werkzeug.security import generate_password_hash, check_password_hash
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import Config
+
+DEFAULT_METHODS = [
+    'pbkdf2:sha256:260000',
+    'pbkdf2:sha256:600000',
+    'pbkdf2:sha256:1000000',
+    'scrypt:16384:8:1',
+    'scrypt:32768:8:1',
+]
+
+PASSWORD = 'CorrectHorse42'
+
+def verify_many(stored_hash, rounds):
+    """Verify the password rounds times; returns elapsed seconds"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        check_password_hash(stored_hash, PASSWORD)
+    return time.perf_counter() - start
+
+def bench(method, rounds, processes):
+    """Return (ms per login, logins/s on one core, logins/s across processes)"""
+    stored_hash = generate_password_hash(PASSWORD, method=method)
+    verify_many(stored_hash, 1)  # Warm up
+
+    elapsed = verify_many(stored_hash, rounds)
+    per_core = rounds / elapsed
+
+    total = None
+    if processes > 1:
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            list(pool.map(verify_many, [stored_hash] * processes, [rounds] * processes))
+        total = rounds * processes / (time.perf_counter() - start)
+
+    return elapsed / rounds * 1000, per_core, total
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark login hashing throughput')
+    parser.add_argument('--method', action='append', help='werkzeug hash method (repeatable)')
+    parser.add_argument('--rounds', type=int, default=20, help='Verifications per measurement')
+    parser.add_argument('--processes', type=int, default=1, help='Also measure aggregate throughput over N processes')
+    args = parser.parse_args()
+
+    methods = args.method or DEFAULT_METHODS
+    configured = os.environ.get('PASSWORD_HASH_METHOD') or Config.PASSWORD_HASH_METHOD
+
+    print("🔐 Login hashing benchmark")
+    print(f"   Configured PASSWORD_HASH_METHOD: {configured}")
+    print("=" * 72)
+    print(f"{'method':<26} {'ms/login':>10} {'logins/s/core':>15}" + (f" {'logins/s x' + str(args.processes):>16}" if args.processes > 1 else ''))
+
+    for method in methods:
+        ms, per_core, total = bench(method, args.rounds, args.processes)
+        marker = ' ⬅ configured' if method == configured else ''
+        line = f"{method:<26} {ms:>10.1f} {per_core:>15.1f}"
+        if total is not None:
+            line += f" {total:>16.1f}"
+        print(line + marker)
+
+    print("=" * 72)
+    print("💡 Changing the method rehashes each user's password on their next login")
+
+if __name__ == '__main__':
+    main()
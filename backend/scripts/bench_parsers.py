@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Benchmark and fuzz the tool output parsers of ScannerService
+Usage: python scripts/bench_parsers.py [--sizes KB,KB,...] [--runs N] [--tool NAME ...]
+                                       [--save FILE | --compare FILE [--tolerance F]]
+       python scripts/bench_parsers.py --fuzz N [--seed S]
+
+The corpus is the real-world samples in scripts/parser_corpus plus larger
+outputs generated by the fake tools (cached under instance/parser_corpus,
+sizes up to hundreds of MB). Each parser is timed on every file and its peak
+allocation measured with tracemalloc. --compare exits non-zero when a parser
+got slower or allocates more than the saved baseline allows.
+
+The same parsers run under pytest-benchmark in tests/test_parser_benchmarks.py
+(seed samples and 1 MB generated reports); this script covers the larger sizes.
+"""
+import os
+import sys
+import json
+import logging
+import random
+import hashlib
+import argparse
+import functools
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED_DIR = os.path.join(BACKEND_DIR, 'scripts', 'parser_corpus')
+FAKE_TOOLS_DIR = os.path.join(BACKEND_DIR, 'scripts', 'fake_tools')
+sys.path.insert(0, BACKEND_DIR)
+
+def iter_lines(content):
+    """Lines of content without copying all of it (as reading the log file would)"""
+    start = 0
+    while start < len(content):
+        end = content.find('\n', start)
+        end = len(content) if end == -1 else end + 1
+        yield content[start:end]
+        start = end
+
+def parse_sqlmap(service, content):
+    """SQLMap findings come from its log, whose injection point blocks the console output repeats"""
+    from app.scanner.tools.sqlmap_results import SqlmapIngester
+    ingester = SqlmapIngester()
+    ingester.ingest_lines(iter_lines(content))
+    return ingester.result()
+
+class ContentReader:
+    """File-like read() over a string, without the copy io.StringIO makes"""
+
+    def __init__(self, content):
+        self.content = content
+        self.pos = 0
+
+    def read(self, size):
+        chunk = self.content[self.pos:self.pos + size]
+        self.pos += len(chunk)
+        return chunk
+
+def parse_nikto(content):
+    """Nikto findings are streamed from the report file in chunks"""
+    from app.scanner.tools.nikto_results import parse_nikto_report
+    return parse_nikto_report(ContentReader(content))
+
+PARSERS = {
+    'sqlmap': parse_sqlmap,
+    'nmap': lambda service, content: service._parse_nmap_output(content),
+    'nikto': lambda service, content: parse_nikto(content),
+}
+
+# How each fake tool is asked to write a report to path
+GENERATE = {
+    'sqlmap': lambda path: (['sqlmap', '-u', 'http://bench.example/item?id=1&sort=asc', '--batch'], path),
+    'nmap': lambda path: (['nmap', '-T4', '-F', '-Pn', 'bench.example', '-oX', path], None),
+    'nikto': lambda path: (['nikto', '-h', 'http://bench.example/', '-o', path, '-Format', 'json'], None),
+}
+EXTENSIONS = {'sqlmap': 'txt', 'nmap': 'xml', 'nikto': 'json'}
+
+def generate(tool, size_kb, corpus_dir):
+    """Write a fake-tool report of about size_kb to the corpus cache (once)"""
+    path = os.path.join(corpus_dir, tool, f'generated-{size_kb}kb.{EXTENSIONS[tool]}')
+    if os.path.exists(path):
+        return path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    cmd, stdout_path = GENERATE[tool](path)
+    cmd[0] = os.path.join(FAKE_TOOLS_DIR, cmd[0])
+    env = dict(os.environ, FAKE_TOOL_LATENCY='0', FAKE_TOOL_SIZE_KB=str(size_kb), FAKE_TOOL_FINDINGS='25')
+    with open(stdout_path or os.devnull, 'w') as stdout:
+        subprocess.run(cmd, env=env, stdout=stdout, check=True)
+    return path
+
+def corpus_files(tools, sizes, corpus_dir):
+    """(tool, path) pairs: seed samples first, then generated files by size"""
+    files = []
+    for tool in tools:
+        seed_dir = os.path.join(SEED_DIR, tool)
+        files += [(tool, os.path.join(seed_dir, name)) for name in sorted(os.listdir(seed_dir))]
+        files += [(tool, generate(tool, size_kb, corpus_dir)) for size_kb in sizes]
+    return files
+
+def measure(parse, content, runs):
+    """Median and best parse time in seconds, and peak traced allocation in bytes"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        parse(content)
+        times.append(time.perf_counter() - start)
+
+    # Allocation tracing slows parsing down, so it gets its own run
+    tracemalloc.start()
+    try:
+        parse(content)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return statistics.median(times), min(times), peak
+
+def run_benchmark(service, files, runs):
+    results = {}
+    print(f"{'file':<36} {'size MB':>9} {'median ms':>11} {'min ms':>9} {'MB/s':>8} {'peak alloc MB':>14}")
+    for tool, path in files:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            content = f.read()
+        size = len(content.encode('utf-8'))
+        # Very large inputs get fewer timed runs
+        file_runs = max(1, runs if size < 50 * 1024 * 1024 else 1)
+        median, best, peak = measure(functools.partial(PARSERS[tool], service), content, file_runs)
+
+        name = f'{tool}/{os.path.basename(path)}'
+        results[name] = {'bytes': size, 'median_s': median, 'min_s': best, 'peak_alloc': peak}
+        throughput = size / median / 1024 / 1024 if median else 0
+        print(f"{name:<36} {size / 1024 / 1024:>9.2f} {median * 1000:>11.2f} {best * 1000:>9.2f} "
+              f"{throughput:>8.1f} {peak / 1024 / 1024:>14.2f}")
+    return results
+
+def compare(results, baseline, tolerance):
+    """Regressions beyond tolerance against a saved run; returns their descriptions"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        # Best times are the least noisy; tiny files are ignored for timing altogether
+        if previous['min_s'] > 0.005 and current['min_s'] > previous['min_s'] * (1 + tolerance):
+            regressions.append(f"{name}: {previous['min_s'] * 1000:.2f} ms -> {current['min_s'] * 1000:.2f} ms")
+        if current['peak_alloc'] > previous['peak_alloc'] * (1 + tolerance) + 64 * 1024:
+            regressions.append(f"{name}: peak alloc {previous['peak_alloc'] / 1024:.0f} KB -> "
+                               f"{current['peak_alloc'] / 1024:.0f} KB")
+    return regressions
+
+def mutate(content, rng):
+    """Damage a report the way truncated or corrupted tool output looks"""
+    data = bytearray(content.encode('utf-8'))
+    if not data:
+        return ''
+    kind = rng.choice(['truncate', 'flip', 'insert', 'duplicate', 'delete'])
+    position = rng.randrange(len(data))
+    if kind == 'truncate':
+        data = data[:position]
+    elif kind == 'flip':
+        for _ in range(rng.randint(1, 16)):
+            data[rng.randrange(len(data))] = rng.randrange(256)
+    elif kind == 'insert':
+        data[position:position] = rng.choice([b'<', b'>', b'"', b'{', b'}', b'[', b'\x00', b'&', b'vulnerable',
+                                              b'portid="x"', b'<port portid="99999999999999999999">', b'\xff\xfe'])
+    elif kind == 'duplicate':
+        end = min(len(data), position + rng.randint(1, 4096))
+        data[position:position] = data[position:end]
+    else:
+        del data[position:position + rng.randint(1, 512)]
+    return data.decode('utf-8', errors='replace')
+
+def run_fuzz(service, tools, iterations, seed, corpus_dir):
+    """Feed mutated seed samples to each parser; crashing inputs are saved for replay"""
+    rng = random.Random(seed)
+    crash_dir = os.path.join(corpus_dir, 'crashes')
+    crashes = 0
+    for tool in tools:
+        parse = functools.partial(PARSERS[tool], service)
+        seed_dir = os.path.join(SEED_DIR, tool)
+        seeds = []
+        for name in sorted(os.listdir(seed_dir)):
+            with open(os.path.join(seed_dir, name), encoding='utf-8') as f:
+                seeds.append(f.read())
+
+        failures = {}
+        for _ in range(iterations):
+            content = mutate(rng.choice(seeds), rng)
+            try:
+                result = parse(content)
+                if not isinstance(result, dict):
+                    raise TypeError(f'parser returned {type(result).__name__}')
+            except Exception as e:
+                key = f'{type(e).__name__}: {e}'[:120]
+                if key not in failures:
+                    os.makedirs(crash_dir, exist_ok=True)
+                    digest = hashlib.sha1(content.encode('utf-8')).hexdigest()[:12]
+                    path = os.path.join(crash_dir, f'{tool}-{digest}.{EXTENSIONS[tool]}')
+                    with open(path, 'w', encoding='utf-8') as f:
+                        f.write(content)
+                    failures[key] = path
+        crashes += len(failures)
+        status = '✅' if not failures else '❌'
+        print(f"{status} {tool:<8} {iterations} inputs, {len(failures)} distinct failures")
+        for key, path in failures.items():
+            print(f"   {key}\n      saved to {path}")
+    return crashes
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark and fuzz the tool output parsers')
+    parser.add_argument('--tool', action='append', choices=sorted(PARSERS), help='Limit to a parser (repeatable)')
+    parser.add_argument('--sizes', default='64,1024,16384',
+                        help='Generated corpus sizes in KB, e.g. 64,1024,262144 for up to 256 MB')
+    parser.add_argument('--runs', type=int, default=5, help='Timed runs per file')
+    parser.add_argument('--corpus-dir', default=os.path.join(BACKEND_DIR, 'instance', 'parser_corpus'),
+                        help='Cache for generated files and fuzz crashes')
+    parser.add_argument('--save', help='Write results to a JSON baseline')
+    parser.add_argument('--compare', help='Compare against a JSON baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed slowdown/allocation growth')
+    parser.add_argument('--fuzz', type=int, default=0, help='Fuzz each parser with N mutated inputs instead')
+    parser.add_argument('--seed', type=int, default=0, help='Fuzzing seed')
+    args = parser.parse_args()
+
+    # Damaged inputs make parsers log warnings; only the summary matters here
+    logging.disable(logging.WARNING)
+    from app.services.scanner_services import ScannerService
+    service = ScannerService()
+    tools = args.tool or list(PARSERS)
+
+    if args.fuzz:
+        print(f"🧪 Fuzzing parsers ({args.fuzz} inputs each, seed {args.seed})")
+        print("=" * 60)
+        sys.exit(1 if run_fuzz(service, tools, args.fuzz, args.seed, args.corpus_dir) else 0)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    print(f"⏱️  Parser benchmark ({args.runs} runs per file, generated sizes {sizes} KB)")
+    print("=" * 96)
+    results = run_benchmark(service, corpus_files(tools, sizes, args.corpus_dir), args.runs)
+    print("=" * 96)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"💾 Baseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} regressions beyond {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            sys.exit(1)
+        print(f"✅ No regressions beyond {args.tolerance:.0%}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Benchmark the scan pipeline end to end with fake sqlmap/nmap/nikto binaries
+Usage: python scripts/bench_pipeline.py [--scans N] [--concurrency N] [--database URL]
+                                        [--latency SECONDS] [--findings N] [--size-kb KB]
+                                        [--workspace-dir DIR]
+
+Scans run through the real run_vulnerability_scan task in worker processes
+(like a prefork Celery worker), against a local HTTP target and the fake tools
+in scripts/fake_tools. The database defaults to a temporary SQLite file; pass a
+PostgreSQL URL to measure against the production database engine.
+"""
+import os
+import sys
+import time
+import shutil
+import logging
+import argparse
+import resource
+import tempfile
+import threading
+import multiprocessing
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FAKE_TOOLS_DIR = os.path.join(BACKEND_DIR, 'scripts', 'fake_tools')
+sys.path.insert(0, BACKEND_DIR)
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a sorted list"""
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, int(round(fraction * (len(samples) - 1))))
+    return samples[index]
+
+class TargetHandler(BaseHTTPRequestHandler):
+    """Small site with parameterized links and a form for the crawler and checks"""
+
+    pages = 5
+
+    def do_GET(self):
+        links = ''.join(f'<a href="/item/{i}?id={i}&amp;sort=asc">item {i}</a>' for i in range(self.pages))
+        form = '<form action="/search" method="post"><input name="q"><input name="page" value="1"></form>'
+        body = f'<html><head><title>bench target</title></head><body>{links}{form}</body></html>'.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, format, *args):
+        pass
+
+def start_target(pages):
+    """Serve the target site on a free local port; returns its URL"""
+    TargetHandler.pages = pages
+    server = ThreadingHTTPServer(('127.0.0.1', 0), TargetHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f'http://127.0.0.1:{server.server_port}/'
+
+def setup_scans(config_name, target_url, count):
+    """Create a benchmark user and its pending scans; returns the scan IDs"""
+    from app import create_app
+    from app.extensions import db
+    from app.models import User, Scan
+
+    app = create_app(config_name)
+    with app.app_context():
+        db.create_all()
+        stamp = int(time.time() * 1000)
+        user = User(f'bench-{stamp}@example.com', f'bench{stamp}', 'bench-password')
+        user.scan_limit = count
+        db.session.add(user)
+        db.session.flush()
+        scans = [Scan(user_id=user.id, target_url=target_url, scan_type='full') for _ in range(count)]
+        db.session.add_all(scans)
+        db.session.commit()
+        scan_ids = [scan.id for scan in scans]
+        for engine in db.engines.values():
+            engine.dispose()
+    return scan_ids
+
+def summarize_scans(config_name, scan_ids):
+    """Final statuses and the largest tool RSS recorded by the sandbox"""
+    from app import create_app
+    from app.extensions import db
+    from app.models import Scan, ScanResult
+
+    app = create_app(config_name)
+    with app.app_context():
+        statuses = dict(db.session.query(Scan.status, db.func.count(Scan.id))
+                        .filter(Scan.id.in_(scan_ids)).group_by(Scan.status).all())
+        results = ScanResult.query.filter(ScanResult.scan_id.in_(scan_ids))
+        tool_rss = results.with_entities(db.func.max(ScanResult.peak_rss_kb)).scalar() or 0
+        result_count = results.count()
+    return statuses, result_count, tool_rss
+
+_task = None
+
+def init_worker(config_name):
+    """Build the app and Celery once per worker process, as a Celery worker does"""
+    global _task
+    logging.disable(logging.WARNING)
+    from app import create_app
+
+    create_app(config_name)
+    from app.tasks.scan_tasks import run_vulnerability_scan
+    _task = run_vulnerability_scan
+
+def run_scan(scan_id):
+    """Run one scan task in this process; returns (scan_id, seconds, success, worker peak RSS KB)"""
+    start = time.perf_counter()
+    result = _task.apply(args=[scan_id]).get()
+    elapsed = time.perf_counter() - start
+    return scan_id, elapsed, result.get('success', False), resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the scan pipeline with fake tools')
+    parser.add_argument('--scans', type=int, default=20, help='Scans to run')
+    parser.add_argument('--concurrency', type=int, default=4, help='Worker processes')
+    parser.add_argument('--database', help='Database URL (default: temporary SQLite file)')
+    parser.add_argument('--config', default='production', help='Config name passed to create_app')
+    parser.add_argument('--latency', type=float, default=0.2, help='Seconds each fake tool run takes')
+    parser.add_argument('--findings', type=int, default=3, help='Findings per fake tool run')
+    parser.add_argument('--size-kb', type=int, default=64, help='Output size per fake tool run')
+    parser.add_argument('--pages', type=int, default=5, help='Parameterized pages on the target (SQLMap runs per scan)')
+    parser.add_argument('--workspace-dir', help='Scratch directory for tool output files (default: /dev/shm), '
+                                                'e.g. a disk path to compare against tmpfs')
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp(prefix='bench-pipeline-')
+    database = args.database or f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+
+    # Worker processes inherit these; the config reads DATABASE_URL at import
+    os.environ['DATABASE_URL'] = database
+    os.environ['PATH'] = FAKE_TOOLS_DIR + os.pathsep + os.environ.get('PATH', '')
+    os.environ.setdefault('SECRET_KEY', 'bench-secret')
+    os.environ.setdefault('JWT_SECRET_KEY', 'bench-jwt-secret')
+    os.environ['FAKE_TOOL_LATENCY'] = str(args.latency)
+    os.environ['FAKE_TOOL_FINDINGS'] = str(args.findings)
+    os.environ['FAKE_TOOL_SIZE_KB'] = str(args.size_kb)
+    if args.workspace_dir:
+        os.environ['TOOL_WORKSPACE_DIR'] = args.workspace_dir
+    logging.disable(logging.WARNING)
+
+    target_url = start_target(args.pages)
+    print(f"🚀 Pipeline benchmark: {args.scans} scans, {args.concurrency} workers")
+    print(f"   Database: {database.split('@')[-1]}")
+    print(f"   Fake tools: {args.latency}s latency, {args.findings} findings, {args.size_kb} KB output")
+    print(f"   Tool workspace: {args.workspace_dir or 'default (tmpfs)'}")
+    print("=" * 60)
+
+    try:
+        scan_ids = setup_scans(args.config, target_url, args.scans)
+
+        # Fresh interpreters, so no database connections or threads are inherited
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(args.concurrency, initializer=init_worker, initargs=(args.config,)) as pool:
+            # Wait for every worker to finish start-up before the clock starts
+            pool.map(time.sleep, [0.1] * args.concurrency, chunksize=1)
+
+            started = time.perf_counter()
+            end_to_end, service, failures, worker_rss = [], [], 0, 0
+            for scan_id, elapsed, success, rss_kb in pool.imap_unordered(run_scan, scan_ids):
+                end_to_end.append(time.perf_counter() - started)
+                service.append(elapsed)
+                failures += not success
+                worker_rss = max(worker_rss, rss_kb)
+            wall = time.perf_counter() - started
+
+        statuses, result_count, tool_rss = summarize_scans(args.config, scan_ids)
+    finally:
+        if not args.database:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    end_to_end.sort()
+    service.sort()
+    print(f"{'throughput':<22} {len(scan_ids) / wall * 60:>10.1f} scans/min ({wall:.1f}s wall)")
+    print(f"{'latency (queued)':<22} p50 {percentile(end_to_end, 0.5):>7.2f}s   p99 {percentile(end_to_end, 0.99):>7.2f}s")
+    print(f"{'latency (task)':<22} p50 {percentile(service, 0.5):>7.2f}s   p99 {percentile(service, 0.99):>7.2f}s")
+    print(f"{'peak worker RSS':<22} {worker_rss / 1024:>10.1f} MB")
+    print(f"{'peak tool RSS':<22} {tool_rss / 1024:>10.1f} MB")
+    print(f"{'scan statuses':<22} {statuses} ({result_count} tool results)")
+    print("=" * 60)
+    if failures:
+        print(f"❌ {failures} scans failed")
+        sys.exit(1)
+    print("✅ All scans completed")
+
+if __name__ == '__main__':
+    main()
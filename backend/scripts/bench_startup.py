@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold start of API and worker processes (time and peak RSS)
+Usage: python scripts/bench_startup.py [--runs N] [--config NAME] [--audit [N]]
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each target runs in a fresh interpreter so nothing is already imported
+TARGETS = {
+    'api': "from app import create_app; create_app({config!r})",
+    'worker': "from app import create_app; create_app({config!r}); "
+              "import app.tasks.scan_tasks, app.tasks.schedule_tasks, app.tasks.report_tasks",
+}
+
+PROBE = """
+import time, resource, json, logging
+logging.disable(logging.CRITICAL)
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000, 'rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+def measure(code):
+    """Run code in a new interpreter; returns (ms, peak RSS in KB)"""
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(code=code)],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return result['ms'], result['rss_kb']
+
+def audit(code, top):
+    """Print the modules with the largest cumulative import time"""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=BACKEND_DIR, capture_output=True, text=True
+    ).stderr
+
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        rows.append((int(cumulative), name.strip()))
+
+    print(f"\n🔎 Slowest imports (cumulative) for the worker target")
+    for cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"   {cumulative / 1000:>8.1f} ms  {name}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark app startup')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters per target')
+    parser.add_argument('--config', default='testing', help='Config name passed to create_app')
+    parser.add_argument('--audit', type=int, nargs='?', const=25, default=0, help='Show the N slowest imports')
+    args = parser.parse_args()
+
+    print(f"🚀 Startup benchmark ({args.runs} runs per target, config={args.config})")
+    print("=" * 60)
+    print(f"{'target':<16} {'median ms':>10} {'min ms':>10} {'peak RSS MB':>13}")
+
+    for name, template in TARGETS.items():
+        code = template.format(config=args.config)
+        try:
+            samples = [measure(code) for _ in range(args.runs)]
+        except subprocess.CalledProcessError as e:
+            print(f"{name:<16} ❌ failed: {e.stderr.strip().splitlines()[-1] if e.stderr else e}")
+            continue
+        times = [ms for ms, _ in samples]
+        rss = max(kb for _, kb in samples) / 1024
+        print(f"{name:<16} {statistics.median(times):>10.1f} {min(times):>10.1f} {rss:>13.1f}")
+
+    print("=" * 60)
+
+    if args.audit:
+        audit(TARGETS['worker'].format(config=args.config), args.audit)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Shared behaviour of the fake sqlmap/nmap/nikto executables used by bench_pipeline.py
+
+Output is deterministic for a given seed, tool and target. Knobs (environment,
+FAKE_<TOOL>_* overrides FAKE_TOOL_* for one tool):
+  FAKE_TOOL_LATENCY   seconds each run takes (default 0.2)
+  FAKE_TOOL_JITTER    +/- fraction applied to the latency (default 0.2)
+  FAKE_TOOL_FINDINGS  findings reported per run (default 3)
+  FAKE_TOOL_SIZE_KB   approximate output size per run (default 64)
+  FAKE_TOOL_SEED      seed mixed into every run (default 0)
+"""
+import os
+import sys
+import time
+import random
+
+def setting(tool, name, default, cast=float):
+    value = os.environ.get(f'FAKE_{tool.upper()}_{name}', os.environ.get(f'FAKE_TOOL_{name}'))
+    return cast(value) if value not in (None, '') else default
+
+class FakeRun:
+    """Settings and random source for one invocation of a fake tool"""
+
+    def __init__(self, tool, target):
+        self.tool = tool
+        self.latency = setting(tool, 'LATENCY', 0.2)
+        self.jitter = setting(tool, 'JITTER', 0.2)
+        self.findings = setting(tool, 'FINDINGS', 3, int)
+        self.size = setting(tool, 'SIZE_KB', 64) * 1024
+        seed = setting(tool, 'SEED', 0, int)
+        self.random = random.Random(f'{seed}:{tool}:{target}')
+
+    def wait(self):
+        """Sleep for the configured latency, spread deterministically by the jitter"""
+        spread = 1 + self.random.uniform(-self.jitter, self.jitter)
+        time.sleep(max(self.latency * spread, 0))
+
+    def pad(self, make_line, used=0):
+        """Lines from make_line(i) until about size bytes (including used) are produced"""
+        lines = []
+        index = 0
+        while used < self.size:
+            line = make_line(index)
+            lines.append(line)
+            used += len(line) + 1
+            index += 1
+        return lines
+
+def arg_value(argv, flag):
+    """Value following flag (or joined as flag=value), None when absent"""
+    for index, arg in enumerate(argv):
+        if arg == flag and index + 1 < len(argv):
+            return argv[index + 1]
+        if arg.startswith(flag + '='):
+            return arg.split('=', 1)[1]
+    return None
+
+def write_output(path, text):
+    """Write to a file, or to stdout when path is '-'"""
+    if path == '-':
+        sys.stdout.write(text)
+    else:
+        with open(path, 'w') as f:
+            f.write(text)
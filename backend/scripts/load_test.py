@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Load-test the API's hot endpoints and report requests per second and latency
+Usage: python scripts/load_test.py --email EMAIL --password PASSWORD [--base-url URL] [--path PATH ...]
+                                   [--scan-id ID] [--concurrency N] [--duration SECONDS]
+
+By default the scan list, a scan's detail and the scan stats are requested as
+the given user (or with --token). {scan_id} in a path is replaced by --scan-id,
+or by the user's most recent scan. Example with a custom path:
+    python scripts/load_test.py --token TOKEN --path /api/v1/scans/stats --path /health
+"""
+import sys
+import time
+import asyncio
+import argparse
+from collections import defaultdict
+
+import httpx
+
+DEFAULT_PATHS = ['/api/v1/scans/', '/api/v1/scans/{scan_id}', '/api/v1/scans/stats']
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a sorted list"""
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, int(round(fraction * (len(samples) - 1))))
+    return samples[index]
+
+async def login(client, email, password):
+    """Obtain an access token through the login endpoint"""
+    response = await client.post('/api/v1/auth/login', json={'email': email, 'password': password})
+    response.raise_for_status()
+    return response.json()['access_token']
+
+async def latest_scan_id(client):
+    """ID of the user's most recent scan, or None without scans"""
+    response = await client.get('/api/v1/scans/')
+    response.raise_for_status()
+    scans = response.json()
+    return scans[0]['id'] if scans else None
+
+async def worker(client, paths, deadline, offset, latencies, failures):
+    """Cycle through paths until the deadline, recording per-path latency"""
+    index = offset
+    while time.monotonic() < deadline:
+        path = paths[index % len(paths)]
+        index += 1
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                failures[path] += 1
+                continue
+        except httpx.HTTPError:
+            failures[path] += 1
+            continue
+        latencies[path].append((time.perf_counter() - start) * 1000)
+
+async def run(args):
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        token = args.token
+        if not token and args.email:
+            token = await login(client, args.email, args.password)
+        if token:
+            client.headers['Authorization'] = f'Bearer {token}'
+
+        if any('{scan_id}' in path for path in args.path):
+            scan_id = args.scan_id or await latest_scan_id(client)
+            if scan_id is None:
+                print("⚠️  The user has no scans; skipping paths that need {scan_id}")
+                args.path = [path for path in args.path if '{scan_id}' not in path]
+            else:
+                args.path = [path.replace('{scan_id}', str(scan_id)) for path in args.path]
+
+        latencies = defaultdict(list)
+        failures = defaultdict(int)
+
+        if args.warmup:
+            warmup_deadline = time.monotonic() + args.warmup
+            await asyncio.gather(*(worker(client, args.path, warmup_deadline, i, defaultdict(list), defaultdict(int))
+                                   for i in range(args.concurrency)))
+
+        start = time.monotonic()
+        deadline = start + args.duration
+        await asyncio.gather(*(worker(client, args.path, deadline, i, latencies, failures)
+                               for i in range(args.concurrency)))
+        elapsed = time.monotonic() - start
+
+    return latencies, failures, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test the backend API')
+    parser.add_argument('--base-url', default='http://127.0.0.1:5000', help='Server base URL')
+    parser.add_argument('--path', action='append', help='Path to request (repeatable)')
+    parser.add_argument('--concurrency', type=int, default=32, help='Concurrent connections')
+    parser.add_argument('--duration', type=float, default=15, help='Measured seconds')
+    parser.add_argument('--warmup', type=float, default=2, help='Unmeasured warm-up seconds')
+    parser.add_argument('--timeout', type=float, default=10, help='Per-request timeout in seconds')
+    parser.add_argument('--email', help='Log in as this user for authenticated paths')
+    parser.add_argument('--password', help='Password for --email')
+    parser.add_argument('--token', help='Use this access token instead of logging in')
+    parser.add_argument('--scan-id', type=int, help='Scan for {scan_id} paths (default: the latest scan)')
+    args = parser.parse_args()
+    args.path = args.path or DEFAULT_PATHS
+    if args.path is DEFAULT_PATHS and not (args.token or args.email):
+        parser.error('the default scan endpoints need --email/--password or --token')
+
+    print(f"🔥 Load test: {args.base_url} with {args.concurrency} connections for {args.duration:.0f}s")
+
+    try:
+        latencies, failures, elapsed = asyncio.run(run(args))
+    except httpx.HTTPError as e:
+        print(f"❌ Could not reach {args.base_url}: {e}")
+        sys.exit(1)
+
+    print("=" * 84)
+    print(f"{'path':<32} {'ok':>8} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    total = 0
+    for path in args.path:
+        samples = sorted(latencies[path])
+        total += len(samples)
+        print(f"{path:<32} {len(samples):>8} {failures[path]:>7} {len(samples) / elapsed:>9.1f} "
+              f"{percentile(samples, 0.50):>8.1f} {percentile(samples, 0.95):>8.1f} {percentile(samples, 0.99):>8.1f}")
+    print("=" * 84)
+    print(f"✅ {total / elapsed:.1f} successful requests/s overall ({sum(failures.values())} errors)")
+
+if __name__ == '__main__':
+    main()
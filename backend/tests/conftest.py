@@ -0,0 +1,28 @@
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.auth.identity import user_cache, issue_tokens
+
+@pytest.fixture
+def app():
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+    user_cache.clear()
+
+@pytest.fixture
+def user(app):
+    from app.models import User
+    user = User(email='tester@example.com', username='tester', password='password123')
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+@pytest.fixture
+def auth_headers(user):
+    access_token, _ = issue_tokens(user)
+    return {'Authorization': f'Bearer {access_token}'}
@@ -0,0 +1,104 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+from app.extensions import db
+from app.models import Scan
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_resource_namespaces_are_mounted(app):
+    rules = {rule.rule for rule in app.url_map.iter_rules()}
+    for path in ('/api/v1/scans/', '/api/v1/scans/<int:scan_id>/diff', '/api/v1/scans/bulk',
+                 '/api/v1/scans/batches/<string:batch_id>', '/api/v1/scans/stats',
+                 '/api/v1/schedules/', '/api/v1/reports/'):
+        assert path in rules
+
+def test_unprotected_user_routes_are_not_mounted(client, user):
+    assert client.get(f'/api/v1/users/{user.id}').status_code == 404
+    assert client.delete(f'/api/v1/users/{user.id}').status_code == 404
+    assert db.session.get(type(user), user.id) is not None
+
+def test_scan_list_answers_if_none_match(client, user, auth_headers):
+    db.session.add(Scan(user_id=user.id, target_url='http://example.com/', scan_type='quick'))
+    db.session.commit()
+
+    response = client.get('/api/v1/scans/', headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.get_json()) == 1
+    etag = response.headers['ETag']
+
+    cached = client.get('/api/v1/scans/', headers=dict(auth_headers, **{'If-None-Match': etag}))
+    assert cached.status_code == 304
+    assert cached.headers['ETag'] == etag
+
+def test_scan_stats_through_create_app(client, auth_headers):
+    response = client.get('/api/v1/scans/stats', headers=auth_headers)
+    assert response.status_code == 200
+    assert response.get_json()['total_scans'] == 0
+
+def test_mounted_namespaces_use_the_fast_json_representation(client, user, auth_headers):
+    db.session.add(Scan(user_id=user.id, target_url='http://example.com/', scan_type='quick'))
+    db.session.commit()
+
+    response = client.get('/api/v1/scans/', headers=auth_headers)
+    # The RESTX default writes ', '/': ' separators and a trailing newline
+    assert response.mimetype == 'application/json'
+    assert b'": ' not in response.data
+    assert not response.data.endswith(b'\n')
+
+def test_api_tasks_use_the_configured_celery_app():
+    # A fresh interpreter: test modules import the tasks before any app exists
+    code = ("from app import create_app; app = create_app('testing'); "
+            "from app.api.scans import run_vulnerability_scan as task; "
+            "assert task.app is app.extensions['celery'], task.app")
+    subprocess.run([sys.executable, '-c', code], cwd=BACKEND_DIR, check=True)
+
+def test_optional_modules_stay_unloaded_when_disabled():
+    code = ("import sys; from app import create_app; app = create_app('testing'); "
+            "assert 'structlog' not in sys.modules; "
+            "assert 'app.utils.compression' not in sys.modules; "
+            "assert '/metrics' not in {rule.rule for rule in app.url_map.iter_rules()}; "
+            "import app.tasks.scan_tasks, app.services.scanner_services, app.services.report_services; "
+            "from app.utils.metrics import record_cache, SCANS_IN_FLIGHT; "
+            "record_cache('user', True); SCANS_IN_FLIGHT.track_inprogress()(lambda: None)(); "
+            "assert 'prometheus_client' not in sys.modules")
+    env = dict(os.environ, STRUCTLOG_ENABLED='false', COMPRESS_ENABLED='false', METRICS_ENABLED='false')
+    subprocess.run([sys.executable, '-c', code], cwd=BACKEND_DIR, env=env, check=True)
+
+def test_optional_modules_load_when_enabled(app):
+    assert 'prometheus_client' in sys.modules
+    assert 'structlog' in sys.modules
+    assert 'app.utils.compression' in sys.modules
+    assert '/metrics' in {rule.rule for rule in app.url_map.iter_rules()}
+
+@pytest.mark.parametrize('payload', [
+    {'target_url': 'ftp://example.com/'},
+    {'target_url': 'not a url'},
+    {'target_url': 5},
+    {'target_url': 'http://example.com/', 'scan_type': 'fulll'},
+])
+def test_scan_submission_is_validated(client, auth_headers, payload):
+    response = client.post('/api/v1/scans/', json=payload, headers=auth_headers)
+
+    assert response.status_code == 400
+    assert Scan.query.count() == 0
+
+def test_bulk_submission_checks_scan_type(client, auth_headers):
+    response = client.post('/api/v1/scans/bulk', json={'targets': ['http://example.com/'], 'scan_type': 'fulll'},
+                           headers=auth_headers)
+
+    assert response.status_code == 400
+    assert Scan.query.count() == 0
+
+def test_single_scan_stores_the_stripped_target(client, auth_headers, monkeypatch):
+    from app.api import scans
+    monkeypatch.setattr(scans.run_vulnerability_scan, 'delay', lambda scan_id: None)
+
+    response = client.post('/api/v1/scans/', json={'target_url': '  http://example.com/  ', 'scan_type': 'quick'},
+                           headers=auth_headers)
+
+    assert response.status_code == 201
+    assert Scan.query.one().target_url == 'http://example.com/'
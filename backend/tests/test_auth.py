@@ -0,0 +1,35 @@
+from sqlalchemy import event
+
+from app.extensions import db
+
+def test_me_returns_the_current_user(client, user, auth_headers):
+    response = client.get('/api/v1/auth/me', headers=auth_headers)
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['user']['email'] == 'tester@example.com'
+    assert body['permissions']['is_admin'] is False
+
+def test_me_requires_a_token(client):
+    assert client.get('/api/v1/auth/me').status_code == 401
+
+def test_me_reads_the_user_from_the_cache(client, user, auth_headers):
+    client.get('/api/v1/auth/me', headers=auth_headers)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        assert client.get('/api/v1/auth/me', headers=auth_headers).status_code == 200
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+    assert not [statement for statement in statements if 'FROM users' in statement]
+
+def test_disabled_user_is_rejected(client, user, auth_headers):
+    user.is_active = False
+    db.session.commit()
+
+    assert client.get('/api/v1/auth/me', headers=auth_headers).status_code == 401
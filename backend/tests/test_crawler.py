@@ -0,0 +1,96 @@
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qsl
+
+import pytest
+
+from app.scanner.tools.crawler import Crawler
+from app.scanner.tools.runner import ToolRun
+from app.services.scanner_services import ScannerService
+
+PAGES = {
+    '/': '''<html><body>
+        <a href="/item?id=1">one</a>
+        <a href="/item?id=2">same parameters as one</a>
+        <a href="/item?id=3&amp;sort=asc">more parameters</a>
+        <a href="/about">about</a>
+        <a href="http://other.invalid/offsite?id=1">offsite</a>
+        <form action="/search" method="post"><input name="q"><input name="page" value="1"></form>
+        <form action="/find"><input name="term"></form>
+    </body></html>''',
+    '/about': '<a href="/team">team</a>',
+    '/team': '<a href="/member?name=x">member</a>',
+}
+
+class SiteHandler(BaseHTTPRequestHandler):
+    requested = []
+
+    def do_GET(self):
+        self.requested.append(self.path)
+        body = PAGES.get(urlparse(self.path).path, '<html>leaf</html>').encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def site():
+    SiteHandler.requested = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SiteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+def signatures(endpoints):
+    return {(e['method'], urlparse(e['url']).path, tuple(sorted(dict(parse_qsl(e['data'] or urlparse(e['url']).query)))))
+            for e in endpoints}
+
+def test_crawl_dedups_same_origin_parameterized_endpoints(site):
+    endpoints = Crawler(max_depth=2, max_pages=50).crawl(f'{site}/')
+
+    assert signatures(endpoints) == {
+        ('GET', '/item', ('id',)),
+        ('GET', '/item', ('id', 'sort')),
+        ('POST', '/search', ('page', 'q')),
+        ('GET', '/find', ('term',)),
+        ('GET', '/member', ('name',)),
+    }
+    assert all(urlparse(e['url']).netloc == urlparse(site).netloc for e in endpoints)
+    post = next(e for e in endpoints if e['method'] == 'POST')
+    assert post['data'] == 'q=1&page=1'
+
+def test_crawl_depth_budget(site):
+    endpoints = Crawler(max_depth=1, max_pages=50).crawl(f'{site}/')
+
+    # /team is two links away from the start page, so its links are never seen
+    assert '/team' not in SiteHandler.requested
+    assert ('GET', '/member', ('name',)) not in signatures(endpoints)
+
+def test_crawl_page_budget(site):
+    Crawler(max_depth=5, max_pages=3).crawl(f'{site}/')
+
+    assert len(SiteHandler.requested) == 3
+
+def test_sqlmap_gets_data_for_post_endpoints(app, site, monkeypatch):
+    service = ScannerService()
+    commands = []
+
+    def fake_run(command, timeout, stdout_tail=None):
+        commands.append(command)
+        run = ToolRun(command)
+        run.returncode = 0
+        return run
+
+    monkeypatch.setattr(service.sandbox, 'run', fake_run)
+    result = service._run_sqlmap(f'{site}/')
+
+    urls = {cmd[cmd.index('-u') + 1]: cmd for cmd in commands}
+    assert len(commands) == len(result['endpoints'])
+    search = urls[f'{site}/search']
+    assert '--data=q=1&page=1' in search
+    assert not any(arg.startswith('--data') for arg in urls[f'{site}/item?id=1'])
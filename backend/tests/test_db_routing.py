@@ -0,0 +1,84 @@
+import importlib
+
+import pytest
+from sqlalchemy import update, text
+
+import app.config as app_config
+from app import create_app
+from app.extensions import db
+from app.models import User
+from app.utils.db_routing import use_replica, REPLICA_BIND
+
+@pytest.fixture
+def replica_app(tmp_path, monkeypatch):
+    """App whose 'replica' bind is a second SQLite file holding different data"""
+    monkeypatch.setenv('DATABASE_REPLICA_URL', f"sqlite:///{tmp_path / 'replica.db'}")
+    importlib.reload(app_config)
+    try:
+        application = create_app('testing')
+    finally:
+        monkeypatch.delenv('DATABASE_REPLICA_URL')
+        importlib.reload(app_config)
+
+    with application.app_context():
+        db.create_all()
+        db.metadata.create_all(db.engines[REPLICA_BIND])
+        db.session.add(User('primary@example.com', 'primary', 'password123'))
+        db.session.commit()
+        with db.engines[REPLICA_BIND].begin() as connection:
+            connection.execute(User.__table__.insert().values(
+                id=1, email='replica@example.com', username='replica', password_hash='x',
+                is_guest=False, scan_limit=10, is_active=True, is_admin=False,
+                created_at=db.func.now(), scans_version=0))
+        yield application
+        db.session.remove()
+        db.drop_all()
+        for engine in db.engines.values():
+            engine.dispose()
+    # init_app registered an (empty) metadata for the bind on the shared db object
+    db.metadatas.pop(REPLICA_BIND, None)
+
+def username(user_id=1):
+    return db.session.query(User.username).filter_by(id=user_id).scalar()
+
+def replica_username():
+    with db.engines[REPLICA_BIND].connect() as connection:
+        return connection.execute(text('SELECT username FROM users WHERE id = 1')).scalar()
+
+def test_reads_use_primary_by_default(replica_app):
+    assert username() == 'primary'
+
+def test_marked_reads_hit_the_replica(replica_app):
+    with use_replica():
+        assert username() == 'replica'
+    db.session.rollback()
+    assert username() == 'primary'
+
+def test_dml_stays_on_primary(replica_app):
+    with use_replica():
+        db.session.execute(update(User).where(User.id == 1).values(username='renamed'))
+        db.session.commit()
+    assert username() == 'renamed'
+    assert replica_username() == 'replica'
+
+def test_for_update_stays_on_primary(replica_app):
+    with use_replica():
+        user = User.query.filter_by(id=1).with_for_update().one()
+        assert user.username == 'primary'
+
+def test_reads_after_pending_changes_stay_on_primary(replica_app):
+    with use_replica():
+        db.session.add(User('new@example.com', 'new', 'password123'))
+        with db.session.no_autoflush:
+            assert username() == 'primary'
+
+def test_reads_after_a_flush_stay_on_primary(replica_app):
+    with use_replica():
+        db.session.add(User('new@example.com', 'new', 'password123'))
+        db.session.flush()
+        # The replica cannot see this transaction's writes
+        assert db.session.query(User).filter_by(username='new').count() == 1
+        assert username() == 'primary'
+    db.session.commit()
+    with use_replica():
+        assert username() == 'replica'
@@ -0,0 +1,115 @@
+import pytest
+
+from app.extensions import db
+from app.models import Scan, ScanResult
+from app.services import scanner_services
+from app.services.scanner_services import ScannerService
+
+TARGET = 'http://example.com/'
+
+def endpoint(url, method='GET', data=None):
+    return {'url': url, 'method': method, 'data': data}
+
+def tool(name):
+    def run(self, target_url):
+        return {'command': name, 'return_code': 0, 'parsed_results': {'vulnerabilities': [], 'total_found': 0}}
+    return run
+
+@pytest.fixture
+def site(app, monkeypatch):
+    """Endpoints the crawler finds, and the URLs SQLMap was run on"""
+    state = {
+        'endpoints': [endpoint(TARGET), endpoint(TARGET + 'item?id=1'), endpoint(TARGET + 'search', 'POST', 'q=1')],
+        'tested': []
+    }
+
+    def run_endpoint(self, target):
+        state['tested'].append(target['url'])
+        vulns = [{'parameter': 'id', 'type': 'boolean-based blind'}] if 'id=' in target['url'] else []
+        return {'command': f"sqlmap -u {target['url']}", 'return_code': 0,
+                'vulnerabilities': {'vulnerabilities': vulns, 'total_found': len(vulns)}}
+
+    monkeypatch.setattr(ScannerService, '_crawl', lambda self, url: list(state['endpoints']))
+    monkeypatch.setattr(ScannerService, '_run_sqlmap_endpoint', run_endpoint)
+    monkeypatch.setattr(ScannerService, '_run_nmap', tool('nmap'))
+    monkeypatch.setattr(ScannerService, '_run_nikto', tool('nikto'))
+    monkeypatch.setattr(ScannerService, '_run_http_checks', tool('http_checks'))
+    monkeypatch.setattr(scanner_services, 'probe_http', lambda url: {'status': 200})
+    return state
+
+def new_scan(user):
+    scan = Scan(user_id=user.id, target_url=TARGET, scan_type='full')
+    db.session.add(scan)
+    db.session.commit()
+    return scan
+
+def run_scan(scan, previous=None):
+    service = ScannerService(result_callback=db.session.add)
+    if previous is None:
+        summary = service.run_all_scans(scan.id, TARGET)
+    else:
+        summary = service.run_incremental_scans(scan.id, TARGET, previous)
+    db.session.commit()
+    return summary
+
+def stored(scan, tool_name):
+    return ScanResult.query.filter_by(scan_id=scan.id, tool_name=tool_name).one().raw_data
+
+def test_fingerprint_records_endpoint_signatures(user, site):
+    scan = new_scan(user)
+    run_scan(scan)
+
+    assert stored(scan, 'fingerprint')['endpoints'] == [
+        'GET http://example.com/?', 'GET http://example.com/item?id', 'POST http://example.com/search?q'
+    ]
+
+def test_only_new_endpoints_are_tested(user, site):
+    first = new_scan(user)
+    run_scan(first)
+    site['endpoints'].append(endpoint(TARGET + 'item?id=1&sort=asc'))
+    site['tested'] = []
+
+    second = new_scan(user)
+    summary = run_scan(second, first)
+
+    assert site['tested'] == [TARGET + 'item?id=1&sort=asc']
+    result = stored(second, 'sqlmap')
+    carried = {entry['url'] for entry in result['endpoints'] if entry.get('carried_forward_from') == first.id}
+    assert carried == {TARGET, TARGET + 'item?id=1', TARGET + 'search'}
+    # The previous finding is carried forward alongside the new one
+    assert result['vulnerabilities']['total_found'] == 2
+    assert summary['sqlmap']['vulnerabilities_found'] == 2
+
+def test_unchanged_endpoints_carry_sqlmap_forward(user, site):
+    first = new_scan(user)
+    run_scan(first)
+    site['tested'] = []
+
+    second = new_scan(user)
+    summary = run_scan(second, first)
+
+    assert site['tested'] == []
+    assert summary['sqlmap']['carried_forward']
+    assert stored(second, 'sqlmap')['carried_forward_from'] == first.id
+
+def test_removed_endpoints_drop_their_findings(user, site):
+    first = new_scan(user)
+    run_scan(first)
+    site['endpoints'] = [e for e in site['endpoints'] if 'id=' not in e['url']]
+    site['tested'] = []
+
+    second = new_scan(user)
+    run_scan(second, first)
+
+    assert site['tested'] == []
+    assert stored(second, 'sqlmap')['vulnerabilities']['total_found'] == 0
+
+def test_fingerprint_failure_runs_every_tool(user, site, monkeypatch):
+    first = new_scan(user)
+    run_scan(first)
+    monkeypatch.setattr(ScannerService, '_run_nmap', lambda self, url: None)
+
+    second = new_scan(user)
+    summary = run_scan(second, first)
+
+    assert set(summary) == {'nmap', 'sqlmap', 'nikto', 'http_checks'}
@@ -0,0 +1,66 @@
+import os
+import sys
+import random
+
+import pytest
+
+from app.services.scanner_services import ScannerService
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+import bench_parsers  # noqa: E402
+
+GENERATED_SIZE_KB = 1024
+
+def seed_paths(tool):
+    seed_dir = os.path.join(bench_parsers.SEED_DIR, tool)
+    return [os.path.join(seed_dir, name) for name in sorted(os.listdir(seed_dir))]
+
+def seed_files():
+    for tool in sorted(bench_parsers.PARSERS):
+        for path in seed_paths(tool):
+            yield pytest.param(tool, path, id=f'{tool}/{os.path.basename(path)}')
+
+def read(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+@pytest.fixture(scope='module')
+def service():
+    return ScannerService()
+
+@pytest.fixture(scope='module')
+def corpus_dir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp('parser_corpus'))
+
+@pytest.mark.parametrize('tool, path', list(seed_files()))
+def test_parse_seed_sample(benchmark, service, tool, path):
+    benchmark.group = tool
+    result = benchmark(bench_parsers.PARSERS[tool], service, read(path))
+    assert isinstance(result, dict)
+
+@pytest.mark.parametrize('tool', sorted(bench_parsers.PARSERS))
+def test_parse_generated_report(benchmark, service, corpus_dir, tool):
+    content = read(bench_parsers.generate(tool, GENERATED_SIZE_KB, corpus_dir))
+    benchmark.group = tool
+    result = benchmark(bench_parsers.PARSERS[tool], service, content)
+    # Fake tools write findings, but nmap only counts the open ones
+    assert result.get('total_found', result.get('total_ports')) > 0
+
+@pytest.mark.parametrize('tool', sorted(bench_parsers.PARSERS))
+def test_parsers_survive_damaged_reports(service, tool):
+    rng = random.Random(0)
+    seeds = [read(path) for path in seed_paths(tool)]
+    for _ in range(300):
+        assert isinstance(bench_parsers.PARSERS[tool](service, bench_parsers.mutate(rng.choice(seeds), rng)), dict)
+
+@pytest.mark.parametrize('port', [
+    '<port protocol="tcp"><state state="open"/><service name="http"/></port>',
+    '<port protocol="tcp" portid=""><state state="open"/></port>',
+    '<port protocol="tcp" portid="x"><state state="open"/></port>',
+])
+def test_nmap_port_without_numeric_portid_is_skipped(service, port):
+    xml = ('<nmaprun><host><ports>'
+           f'{port}<port protocol="tcp" portid="443"><state state="open"/><service name="https"/></port>'
+           '</ports></host></nmaprun>')
+    result = service._parse_nmap_output(xml)
+    assert [p['port'] for p in result['open_ports']] == [443]
@@ -0,0 +1,104 @@
+import tracemalloc
+
+import pytest
+
+from app.extensions import db
+from app.models import Scan, ScanResult, Report
+from app.reports import renderer
+from app.reports.renderer import file_sha256
+from app.services.report_services import ReportService
+
+@pytest.fixture
+def reports_dir(app, tmp_path):
+    app.config['REPORTS_DIR'] = str(tmp_path)
+    return tmp_path
+
+@pytest.fixture
+def scans(user):
+    """One scan with a high finding and one with only a low finding"""
+    scans = []
+    for severity in ('high', 'low'):
+        scan = Scan(user_id=user.id, target_url=f'http://{severity}.example.com/', scan_type='full')
+        scan.status = 'completed'
+        db.session.add(scan)
+        db.session.flush()
+        db.session.add(ScanResult(scan_id=scan.id, tool_name='nikto', raw_data={'parsed_results': {
+            'vulnerabilities': [{'description': f'{severity} finding', 'severity': severity, 'url': '/admin'}]
+        }}))
+        scans.append(scan)
+    db.session.commit()
+    return scans
+
+def render(user, scans, template, fmt):
+    report, _ = ReportService().get_or_create(user.id, [scan.id for scan in scans], template, fmt)
+    return ReportService().render(report)
+
+def test_etag_is_the_hash_of_the_served_file(client, user, auth_headers, reports_dir, scans):
+    reports = [render(user, scans, template, fmt) for template in ('summary', 'detailed') for fmt in ('html', 'pdf')]
+
+    etags = set()
+    for report in reports:
+        response = client.get(f'/api/v1/reports/{report.id}/download', headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers['ETag'] == f'"{file_sha256(report.file_path)}"'
+        etags.add(response.headers['ETag'])
+    assert len(etags) == len(reports)
+
+def test_rerendered_file_gets_a_new_etag(client, user, auth_headers, reports_dir, scans, monkeypatch):
+    first = render(user, scans, 'summary', 'html')
+    old_etag = client.get(f'/api/v1/reports/{first.id}/download', headers=auth_headers).headers['ETag']
+    ReportService().delete(first)
+
+    # A re-render with different bytes, e.g. a later generation timestamp
+    context = renderer._context
+    monkeypatch.setattr(renderer, '_context', lambda scan_ids: dict(context(scan_ids), generated_at='2030-01-01 00:00'))
+    second = render(user, scans, 'summary', 'html')
+    response = client.get(f'/api/v1/reports/{second.id}/download',
+                          headers=dict(auth_headers, **{'If-Range': old_etag, 'Range': 'bytes=0-9'}))
+
+    # The stale validator must not produce a partial response of the new file
+    assert response.headers['ETag'] != old_etag
+    assert response.status_code == 200
+    assert Report.query.count() == 1
+
+def test_summary_skips_table_for_sections_without_listed_findings(user, reports_dir, scans):
+    report = render(user, scans, 'summary', 'html')
+    with open(report.file_path, encoding='utf-8') as f:
+        html = f.read()
+
+    high, low = html.split('<section>')[1:]
+    assert 'high finding' in high and '<th>Finding</th>' in high
+    assert '<th>Finding</th>' not in low
+
+def peak_render_memory(user_id, tmp_path, scan_count, findings_per_scan=60):
+    """Peak traced memory while rendering a detailed PDF of scan_count scans"""
+    scan_ids = []
+    for index in range(scan_count):
+        scan = Scan(user_id=user_id, target_url=f'http://host{index}.example.com/', scan_type='full')
+        scan.status = 'completed'
+        db.session.add(scan)
+        db.session.flush()
+        db.session.add(ScanResult(scan_id=scan.id, tool_name='nikto', raw_data={'parsed_results': {
+            'vulnerabilities': [{'description': f'finding {index}-{number} ' + 'x' * 80, 'severity': 'high',
+                                 'url': f'/path/{number}'} for number in range(findings_per_scan)]
+        }}))
+        scan_ids.append(scan.id)
+    db.session.commit()
+    db.session.expunge_all()
+
+    tracemalloc.start()
+    try:
+        renderer.render_report(scan_ids, 'detailed', 'pdf', str(tmp_path / f'{scan_count}.pdf'))
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def test_pdf_memory_does_not_grow_with_the_findings_of_every_scan(user, tmp_path):
+    user_id = user.id
+    # Fonts and styles are loaded once per process, so keep them out of the measurements
+    peak_render_memory(user_id, tmp_path, 1, findings_per_scan=1)
+    small = peak_render_memory(user_id, tmp_path, 2)
+    large = peak_render_memory(user_id, tmp_path, 8)
+
+    # Only the drawn pages accumulate (in reportlab's canvas), not every section's flowables
+    assert large < small * 2
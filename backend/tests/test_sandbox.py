@@ -0,0 +1,53 @@
+import sys
+import shutil
+
+import pytest
+
+from app.scanner.tools.runner import ToolSandbox, MB
+
+PYTHON = sys.executable
+
+def test_memory_limit_hit_is_flagged():
+    sandbox = ToolSandbox(memory_mb=200)
+    run = sandbox.run([PYTHON, '-c', 'x = bytearray(400 * 1024 * 1024)'], timeout=30)
+
+    assert run.returncode == 1
+    assert 'MemoryError' in run.stderr
+    assert run.exceeded == ['memory']
+
+def test_failure_without_enomem_is_not_flagged():
+    sandbox = ToolSandbox(memory_mb=200)
+    run = sandbox.run([PYTHON, '-c', 'raise SystemExit("bad arguments")'], timeout=30)
+
+    assert run.returncode == 1
+    assert run.exceeded == []
+
+@pytest.mark.skipif(not shutil.which('prlimit'), reason='prlimit(1) not installed')
+def test_limits_are_set_before_exec():
+    sandbox = ToolSandbox(memory_mb=256, open_files=64)
+    # Read the limits as the very first thing the tool does
+    script = ('import resource; '
+              'print(resource.getrlimit(resource.RLIMIT_AS)[0], resource.getrlimit(resource.RLIMIT_NOFILE)[0])')
+    run = sandbox.run([PYTHON, '-c', script], timeout=30)
+
+    assert run.returncode == 0
+    assert run.stdout.split() == [str(256 * MB), '64']
+
+def test_missing_tool_raises_file_not_found():
+    sandbox = ToolSandbox(memory_mb=200)
+    with pytest.raises(FileNotFoundError):
+        sandbox.run(['definitely-not-a-scanner-tool'], timeout=5)
+
+def test_output_bytes_counts_both_streams():
+    sandbox = ToolSandbox(memory_mb=200)
+    # Interleave small writes so both readers are busy at the same time
+    script = ('import sys\n'
+              'for _ in range(2000):\n'
+              '    sys.stdout.buffer.write(b"o" * 300); sys.stdout.flush()\n'
+              '    sys.stderr.buffer.write(b"e" * 200); sys.stderr.flush()\n')
+    run = sandbox.run([PYTHON, '-c', script], timeout=30)
+
+    assert run.returncode == 0
+    assert run.output_bytes == 2000 * 500
+    assert run.kept_bytes == 2000 * 500
+    assert len(run.stdout) == 2000 * 300 and len(run.stderr) == 2000 * 200
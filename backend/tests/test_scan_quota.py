@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.extensions import db
+from app.models import User, Scan, ScanSchedule, ScanUsage
+from app.tasks import schedule_tasks
+
+@pytest.fixture
+def enqueued(monkeypatch):
+    """Scan IDs the scheduler hands to Celery, without a broker"""
+    sent = []
+
+    class FakeGroup:
+        def __init__(self, signatures):
+            self.signatures = list(signatures)
+
+        def apply_async(self):
+            sent.extend(signature.args[0] for signature in self.signatures)
+
+    monkeypatch.setattr(schedule_tasks, 'group', FakeGroup)
+    return sent
+
+def add_due_schedules(user, count):
+    for i in range(count):
+        schedule = ScanSchedule(user.id, f'http://example.com/{i}', '0 * * * *', jitter_seconds=0)
+        schedule.next_run_at = datetime.utcnow() - timedelta(minutes=count - i)
+        db.session.add(schedule)
+    db.session.commit()
+
+def test_scheduled_scans_reserve_guest_quota(app, enqueued):
+    guest = User('guest@example.com', 'guest', 'password123', is_guest=True, scan_limit=2)
+    db.session.add(guest)
+    db.session.commit()
+    add_due_schedules(guest, 3)
+
+    result = schedule_tasks.enqueue_due_scans()
+
+    assert result['enqueued'] == 2 and result['skipped'] == 1
+    assert len(enqueued) == 2
+    assert ScanUsage.used_in_window(guest.id, app.config['SCAN_QUOTA_WINDOW']) == 2
+    # The skipped schedule was advanced rather than left due
+    assert ScanSchedule.query.filter(ScanSchedule.next_run_at <= datetime.utcnow()).count() == 0
+
+def test_registered_users_are_limited_only_when_configured(app, user, enqueued):
+    user.scan_limit = 1
+    db.session.commit()
+    add_due_schedules(user, 2)
+
+    assert schedule_tasks.enqueue_due_scans()['enqueued'] == 2
+    assert user.get_remaining_scans() == 1
+
+    app.config['SCAN_QUOTA_ALL_USERS'] = True
+    assert not ScanUsage.reserve_for(user, 2)
+    assert ScanUsage.reserve_for(user, 1)
+    assert user.get_remaining_scans() == 0
+
+def test_scan_submission_is_refused_over_quota(app, client, user, auth_headers, monkeypatch):
+    from app.api import scans
+    monkeypatch.setattr(scans.run_vulnerability_scan, 'delay', lambda scan_id: None)
+    app.config['SCAN_QUOTA_ALL_USERS'] = True
+    user.scan_limit = 1
+    db.session.commit()
+
+    first = client.post('/api/v1/scans/', json={'target_url': 'http://example.com/'}, headers=auth_headers)
+    second = client.post('/api/v1/scans/', json={'target_url': 'http://example.com/'}, headers=auth_headers)
+    assert first.status_code == 201
+    assert second.status_code == 403
+    assert Scan.query.count() == 1
+
+def test_quota_window_rolls_instead_of_resetting(app, user):
+    app.config['SCAN_QUOTA_ALL_USERS'] = True
+    user.scan_limit = 2
+    db.session.commit()
+    window = app.config['SCAN_QUOTA_WINDOW']
+    start = datetime(2030, 1, 1, 23, 59)
+
+    assert ScanUsage.reserve_for(user, 2, now=start)
+    # Past midnight, where an aligned window would have reset
+    assert not ScanUsage.reserve_for(user, 1, now=start + timedelta(minutes=2))
+    assert not ScanUsage.reserve_for(user, 1, now=start + window - timedelta(seconds=1))
+    assert ScanUsage.reserve_for(user, 2, now=start + window)
+    # Expired reservations are pruned as new ones are made
+    assert ScanUsage.query.filter_by(user_id=user.id).count() == 1
+
+def test_guest_limit_is_lifetime(app):
+    guest = User('guest@example.com', 'guest', 'password123', is_guest=True, scan_limit=1)
+    db.session.add(guest)
+    db.session.commit()
+    start = datetime(2030, 1, 1)
+
+    assert ScanUsage.reserve_for(guest, 1, now=start)
+    assert not ScanUsage.reserve_for(guest, 1, now=start + timedelta(days=365))
+    assert guest.get_remaining_scans() == 0
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.extensions import db
+from app.models import ScanSchedule
+
+def schedule_with_offset(cron, jitter_seconds, minimum):
+    """A schedule whose stable jitter offset is at least minimum seconds"""
+    for index in range(1000):
+        schedule = ScanSchedule(1, f'http://example{index}.com/', cron, jitter_seconds=jitter_seconds)
+        if schedule._jitter() >= timedelta(seconds=minimum):
+            return schedule
+    raise AssertionError('no schedule with a large enough offset')
+
+def fire_times(schedule, count):
+    times = []
+    for _ in range(count):
+        now = schedule.next_run_at
+        times.append(now)
+        schedule.advance(now)
+    return times
+
+def test_jitter_longer_than_the_period_keeps_every_cron_time():
+    schedule = schedule_with_offset('*/5 * * * *', 3600, minimum=600)
+    offset = schedule._jitter()
+
+    times = fire_times(schedule, 12)
+
+    assert all(later - earlier == timedelta(minutes=5) for earlier, later in zip(times, times[1:]))
+    assert all((time - offset).minute % 5 == 0 and (time - offset).second == 0 for time in times)
+
+def test_late_run_skips_missed_cron_times():
+    schedule = schedule_with_offset('0 * * * *', 600, minimum=60)
+    offset = schedule._jitter()
+    due = schedule.next_run_at
+
+    # The scheduler was down for three hours
+    schedule.advance(due + timedelta(hours=3, minutes=1))
+
+    assert schedule.next_run_at == due + timedelta(hours=4)
+    assert schedule.next_run_at - offset == (due - offset) + timedelta(hours=4)
+
+def test_next_run_is_after_now():
+    schedule = schedule_with_offset('*/5 * * * *', 3600, minimum=600)
+    now = datetime.utcnow()
+
+    assert now < schedule.compute_next_run(now) <= now + timedelta(minutes=5)
+
+def create_schedule(client, auth_headers, **fields):
+    payload = dict({'target_url': 'http://example.com/', 'cron': '0 3 * * *'}, **fields)
+    return client.post('/api/v1/schedules/', json=payload, headers=auth_headers)
+
+@pytest.mark.parametrize('payload', [{'cron': 5}, {'cron': None}, {'cron': ['0', '3']}])
+def test_non_string_cron_is_a_validation_error(client, auth_headers, payload):
+    created = create_schedule(client, auth_headers).get_json()
+
+    assert create_schedule(client, auth_headers, **payload).status_code == 400
+    response = client.put(f"/api/v1/schedules/{created['id']}", json=payload, headers=auth_headers)
+    assert response.status_code == 400
+
+@pytest.mark.parametrize('payload', [{'scan_type': 'fulll'}, {'is_active': 'yes'}])
+def test_post_and_put_validate_the_same_fields(client, auth_headers, payload):
+    created = create_schedule(client, auth_headers).get_json()
+
+    assert create_schedule(client, auth_headers, **payload).status_code == 400
+    response = client.put(f"/api/v1/schedules/{created['id']}", json=payload, headers=auth_headers)
+    assert response.status_code == 400
+
+def test_put_requires_schedule_permission(client, user, auth_headers):
+    created = create_schedule(client, auth_headers).get_json()
+    user.is_guest = True
+    db.session.commit()
+
+    response = client.put(f"/api/v1/schedules/{created['id']}", json={'cron': '@daily'}, headers=auth_headers)
+    assert response.status_code == 403
+    assert db.session.get(ScanSchedule, created['id']).cron == '0 3 * * *'
@@ -0,0 +1,75 @@
+import pytest
+
+from app.extensions import db
+from app.models import Scan, ScanResult
+from app.services import scanner_services
+from app.services.scanner_services import ScannerService
+from app.tasks.scan_tasks import run_vulnerability_scan
+
+class WorkerLost(BaseException):
+    """Stands in for the worker process dying mid-scan"""
+
+def tool(name):
+    def run(self, target_url):
+        return {'command': name, 'return_code': 0, 'parsed_results': {'vulnerabilities': [], 'total_found': 0}}
+    return run
+
+@pytest.fixture
+def scan(app, user, monkeypatch):
+    monkeypatch.setattr(ScannerService, '_run_sqlmap', tool('sqlmap'))
+    monkeypatch.setattr(ScannerService, '_run_nmap', tool('nmap'))
+    monkeypatch.setattr(ScannerService, '_run_nikto', tool('nikto'))
+    monkeypatch.setattr(ScannerService, '_run_http_checks', tool('http_checks'))
+    monkeypatch.setattr(scanner_services, 'probe_http', lambda url: {})
+    scan = Scan(user_id=user.id, target_url='http://example.com/', scan_type='full')
+    db.session.add(scan)
+    db.session.commit()
+    return scan
+
+def stored_tools(scan_id):
+    return {tool_name for (tool_name,) in db.session.query(ScanResult.tool_name).filter_by(scan_id=scan_id)}
+
+def test_results_are_stored_and_reported(scan):
+    result = run_vulnerability_scan(scan.id)
+
+    assert result['success']
+    assert stored_tools(scan.id) == {'sqlmap', 'nmap', 'nikto', 'http_checks', 'fingerprint'}
+    ids = {tool_name: entry['result_id'] for tool_name, entry in result['results'].items()}
+    assert sorted(ids.values()) == sorted(r.id for r in ScanResult.query.filter_by(scan_id=scan.id))
+
+def test_finished_tools_survive_a_crash_later_in_the_scan(scan, monkeypatch):
+    def crash(self, target_url):
+        raise WorkerLost()
+
+    monkeypatch.setattr(ScannerService, '_run_nikto', crash)
+    with pytest.raises(WorkerLost):
+        run_vulnerability_scan(scan.id)
+    db.session.rollback()
+
+    assert stored_tools(scan.id) == {'sqlmap', 'nmap'}
+
+def test_failed_scan_keeps_finished_tool_results(scan, monkeypatch):
+    monkeypatch.setattr(scanner_services.ScannerService, '_strip_raw_data',
+                        lambda self, results: (_ for _ in ()).throw(RuntimeError('boom')))
+
+    result = run_vulnerability_scan(scan.id)
+
+    assert not result['success']
+    assert db.session.get(Scan, scan.id).status == 'failed'
+    assert stored_tools(scan.id) == {'sqlmap', 'nmap', 'nikto', 'http_checks', 'fingerprint'}
+
+def test_deleting_a_completed_scan_removes_it_from_the_stats(client, auth_headers, scan, monkeypatch):
+    from app.api import scans
+    monkeypatch.setattr(scans.run_vulnerability_scan, 'delay', lambda scan_id: None)
+    scan_id = client.post('/api/v1/scans/', json={'target_url': 'http://example.com/'},
+                          headers=auth_headers).get_json()['id']
+    assert run_vulnerability_scan(scan_id)['success']
+    stats = client.get('/api/v1/scans/stats', headers=auth_headers).get_json()
+    assert stats['total_scans'] == 1 and stats['completed_scans'] == 1
+
+    response = client.delete(f'/api/v1/scans/{scan_id}', headers=auth_headers)
+
+    assert response.status_code == 200
+    assert ScanResult.query.filter_by(scan_id=scan_id).count() == 0
+    stats = client.get('/api/v1/scans/stats', headers=auth_headers).get_json()
+    assert stats['total_scans'] == 0 and stats['completed_scans'] == 0
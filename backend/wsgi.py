@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+Production WSGI entry point
+Usage: gunicorn -c gunicorn.conf.py wsgi:app
+"""
+import os
+from app import create_app
+
+# Created once in the gunicorn master (preload_app) and inherited by every worker
+app = create_app(os.environ.get('FLASK_ENV', 'production'))